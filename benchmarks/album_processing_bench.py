@@ -6,13 +6,21 @@ Usage:
     python benchmarks/album_processing_bench.py <path-to-sample-image.png>
 
 This script will run N iterations and measure wall-clock time for the two approaches.
+It then times the HUD's background job (hud_workers.make_backgrounds) with the previous PNG
+round trip around it against the raw (mode, size, bytes) transport it uses now.
 """
+import os
 import sys
 import time
 from io import BytesIO
 from PIL import Image
 from concurrent.futures import ProcessPoolExecutor
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import hud_workers
+
+BACKGROUND_SIZES = [(480, 320)]
+
 def process_fn(img_bytes):
     from PIL import Image as PILImage
     from io import BytesIO as _BytesIO
@@ -37,6 +45,44 @@ def proc_pool_process(img_bytes, iterations=50, workers=2):
             f.result()
     return time.time() - t0
 
+def make_backgrounds_png(art_png, sizes):
+    # The previous transport: PNG art in, PNG backgrounds out, around the same worker
+    img = Image.open(BytesIO(art_png)).convert('RGB')
+    result = {}
+    for size, packed in hud_workers.make_backgrounds((img.mode, img.size, img.tobytes()), sizes).items():
+        buf = BytesIO(); Image.frombytes(*packed).save(buf, format='PNG'); result[size] = buf.getvalue()
+    return result
+
+def background_png(submit, art):
+    buf = BytesIO(); art.save(buf, format='PNG')
+    return {size: Image.open(BytesIO(data)).convert('RGB')
+            for size, data in submit(make_backgrounds_png, buf.getvalue(), BACKGROUND_SIZES).items()}
+
+def background_raw(submit, art):
+    return {size: Image.frombytes(*packed)
+            for size, packed in submit(hud_workers.make_backgrounds, (art.mode, art.size, art.tobytes()), BACKGROUND_SIZES).items()}
+
+def transport_ms(fn, iterations):
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - t0) / iterations * 1000
+
+def transport_bench(img, iterations=30):
+    art = img.copy()
+    art.thumbnail((150,150), Image.BILINEAR)
+    inline = lambda fn, *args: fn(*args)
+    print(f'Background job from {art.size[0]}px art ({iterations} iterations, PNG round trip vs raw bytes):')
+    before = transport_ms(lambda: background_png(inline, art), iterations)
+    after = transport_ms(lambda: background_raw(inline, art), iterations)
+    print(f'  inline:       png {before:6.2f} ms, raw {after:6.2f} ms ({before / after:.1f}x)')
+    with ProcessPoolExecutor(max_workers=1, initializer=hud_workers.init_worker, initargs=(BACKGROUND_SIZES,)) as ex:
+        submit = lambda fn, *args: ex.submit(fn, *args).result()
+        before = transport_ms(lambda: background_png(submit, art), iterations)
+        after = transport_ms(lambda: background_raw(submit, art), iterations)
+    print(f'  process pool: png {before:6.2f} ms, raw {after:6.2f} ms ({before / after:.1f}x)')
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python benchmarks/album_processing_bench.py sample.png")
@@ -50,7 +96,7 @@ def main():
     print(f'Sync: {iterations} iterations took {sync_time:.3f}s')
     pool_time = proc_pool_process(img_bytes, iterations=iterations, workers=max(1,(os.cpu_count() or 1)//2))
     print(f'ProcessPool: {iterations} iterations took {pool_time:.3f}s')
+    transport_bench(img, iterations=iterations)
 
 if __name__ == '__main__':
-    import os
     main()
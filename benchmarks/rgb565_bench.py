@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the framebuffer RGB565 conversion on a 480x320 frame: the previous per-channel
+gamma lookup (six full-frame temporaries) against the pre-shifted LUT converter writing into
+reusable buffers, with and without rotation.
+
+Usage:
+    python benchmarks/rgb565_bench.py [iterations]
+
+Both converters are copied here so the benchmark runs without the HUD's hardware dependencies.
+"""
+import sys
+import time
+import numpy as np
+from PIL import Image
+
+WIDTH, HEIGHT = 480, 320
+
+_gamma_r = np.array([int(((i / 255.0) ** (1 / 1.5)) * 31 + 0.5) for i in range(256)], dtype=np.uint8)
+_gamma_g = np.array([int(((i / 255.0) ** (1 / 1.5)) * 63 + 0.5) for i in range(256)], dtype=np.uint8)
+_gamma_b = np.array([int(((i / 255.0) ** (1 / 1.5)) * 31 + 0.5) for i in range(256)], dtype=np.uint8)
+_rgb565_r = _gamma_r.astype(np.uint16) << 11
+_rgb565_g = _gamma_g.astype(np.uint16) << 5
+_rgb565_b = _gamma_b.astype(np.uint16)
+_buffers = {}
+
+def rgb565_before(image, rotation=0):
+    if rotation:
+        image = image.rotate(rotation, expand=True)
+    arr = np.array(image, dtype=np.uint8)
+    r = _gamma_r[arr[:, :, 0]].astype(np.uint16)
+    g = _gamma_g[arr[:, :, 1]].astype(np.uint16)
+    b = _gamma_b[arr[:, :, 2]].astype(np.uint16)
+    rgb565 = (r << 11) | (g << 5) | b
+    output = np.empty(arr.shape[:2] + (2,), dtype=np.uint8)
+    output[:, :, 0] = rgb565 & 0xFF
+    output[:, :, 1] = (rgb565 >> 8) & 0xFF
+    return output.tobytes()
+
+def rgb565_after(image, rotation=0):
+    arr = np.asarray(image, dtype=np.uint8)
+    src = np.rot90(arr, (rotation // 90) % 4) if rotation % 360 else arr
+    h, w = src.shape[:2]
+    if _buffers.get('size', 0) < h * w:
+        _buffers.update(size=h * w, out=np.empty(h * w, dtype='<u2'), tmp=np.empty(h * w, dtype=np.uint16), index=np.empty(h * w, dtype=np.intp))
+    out, tmp, index = (_buffers[k][:h * w].reshape(h, w) for k in ('out', 'tmp', 'index'))
+    np.copyto(index, src[:, :, 0])
+    np.take(_rgb565_r, index, out=out)
+    np.copyto(index, src[:, :, 1])
+    np.take(_rgb565_g, index, out=tmp)
+    out |= tmp
+    np.copyto(index, src[:, :, 2])
+    np.take(_rgb565_b, index, out=tmp)
+    out |= tmp
+    return memoryview(out)
+
+def fps(fn, image, rotation, iterations):
+    fn(image, rotation)
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        fn(image, rotation)
+    return iterations / (time.perf_counter() - t0)
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = np.random.default_rng(0)
+    image = Image.fromarray(rng.integers(0, 256, (HEIGHT, WIDTH, 3), dtype=np.uint8))
+    assert bytes(rgb565_after(image)) == rgb565_before(image)
+    assert bytes(rgb565_after(image, 90)) == rgb565_before(image, 90)
+    print(f'{WIDTH}x{HEIGHT} RGB565 conversion, {iterations} iterations')
+    for rotation in (0, 90, 180):
+        before = fps(rgb565_before, image, rotation, iterations)
+        after = fps(rgb565_after, image, rotation, iterations)
+        print(f'rotation {rotation:3d}: before {before:7.1f} fps, after {after:7.1f} fps ({after / before:.1f}x)')
+
+if __name__ == '__main__':
+    main()
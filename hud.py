@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
-import time, requests, json, evdev, spotipy, colorsys, datetime, os, subprocess, toml, random, sys, copy, math, queue, threading, signal, numpy as np, hashlib
+import time, requests, json, evdev, spotipy, colorsys, datetime, os, subprocess, toml, random, sys, copy, math, queue, threading, signal, numpy as np, hashlib, mmap, struct
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from io import BytesIO
-from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance, ImageStat, ImageColor
+from PIL import Image, ImageDraw, ImageFont, ImageColor
 from threading import Thread, Event, RLock
+import hud_workers
 # Try to detect pillow-simd availability for optimized image ops
 try:
     import pkg_resources
@@ -109,7 +110,12 @@ DEFAULT_CONFIG = {
         "sleep_timeout": 300,
         "progressbar_display": True,
         "enable_current_track_display": True,
-        "max_fps": 25
+        "max_fps": 25,
+        "thermal_zone": "/sys/class/thermal/thermal_zone0/temp",
+        "thermal_high_c": 75,
+        "thermal_low_c": 65,
+        "art_cache_dir": "./cache/art",
+        "art_cache_mb": 64
     },
     "wifi": {
         "ap_ssid": "Neonwifi-Manager",
@@ -137,21 +143,45 @@ DEFAULT_CONFIG = {
 }
 
 bg_cache = {}
+# Procedural backgrounds (gradient fallback, solid fills) keyed by (kind, size, colour)
+procedural_bg_cache = {}
 text_bbox_cache = {}
 weather_cache = {}
 # album_bg_cache will be an LRU cache (OrderedDict)
 album_bg_cache = OrderedDict()
 album_bg_cache_lock = RLock()
 resized_image_cache = OrderedDict()
-dithered_image_cache = OrderedDict()
-dithered_cache_lock = RLock()
 IMG_CACHE_MAX = 6
+# Text sprites: premultiplied glyph runs cropped to their ink box, LRU-evicted by byte size
+text_sprite_cache = OrderedDict()
+text_sprite_cache_lock = RLock()
+text_sprite_cache_bytes = 0
+TEXT_SPRITE_CACHE_BYTES = 2 * 1024 * 1024
+# Art acquisition: the 300px web copy is the largest consumer of album art, so that is the rendition
+# fetched and decoded; the sprite and backgrounds work off the 150px thumbnail
+ART_SOURCE_SIZE = (300, 300)
+ALBUM_ART_SIZE = (150, 150)
+ARTIST_IMAGE_SIZE = (100, 100)
+# Album art disk cache: per art URL the 150px thumbnail, its colours and generated backgrounds,
+# LRU-evicted by total file size (see art_cache_get / art_cache_put). The index maps each key to
+# {file suffix: bytes}, so accounting and eviction never have to list the directory.
+art_disk_index = OrderedDict()
+art_disk_index_loaded = False
+art_disk_bytes = 0
+art_disk_lock = RLock()
+# Weather icons: OpenWeather @2x PNGs kept on disk, decoded sources and their (size, mode) variants in
+# memory; only fetch_weather_icon() touches the network
+weather_icon_sources = {}
+weather_icon_cache = {}
+weather_icon_lock = RLock()
 executor = ThreadPoolExecutor(max_workers=3)
-process_executor = None  # initialized lazily to avoid forking in certain environments
-pending_bg_futures = {}
-pending_artist_futures = {}
-pending_dither_futures = {}
-pending_album_futures = {}
+# Track generations: every track change bumps the counter, and async work tagged with an older
+# generation is cancelled if still queued or dropped when its result arrives
+track_generation = 0
+track_generation_lock = threading.Lock()
+generation_futures = []
+last_art_url = None
+process_executor = None  # created by start_process_pool() in main(), not at import
 # global requests session with retries
 session = requests.Session()
 retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
@@ -171,7 +201,14 @@ waveshare_base_image = None
 partial_refresh_count = 0
 epd2in13_V3 = None
 epdconfig = None
-bg_generation_queue = queue.Queue(maxsize=5)
+# Background jobs: at most one pending job per bg_type, a newer request replaces the pending one.
+# Every job gets a sequence number, and only the newest submitted per bg_type may install its result
+bg_jobs = OrderedDict()
+bg_jobs_condition = threading.Condition()
+bg_job_seq = 0
+bg_job_latest = {}
+bg_job_stats = {'queued': 0, 'coalesced': 0, 'dropped': 0, 'run': 0}
+BG_JOB_STATS_INTERVAL = 300
 spotify_bg_cache = None
 spotify_bg_cache_lock = threading.Lock()
 current_album_art_hash = None
@@ -183,11 +220,19 @@ button_last_press = {5: 0, 6: 0, 16: 0, 24: 0}
 _gamma_r = np.array([int(((i / 255.0) ** (1 / 1.5)) * 31 + 0.5) for i in range(256)], dtype=np.uint8)
 _gamma_g = np.array([int(((i / 255.0) ** (1 / 1.5)) * 63 + 0.5) for i in range(256)], dtype=np.uint8)
 _gamma_b = np.array([int(((i / 255.0) ** (1 / 1.5)) * 31 + 0.5) for i in range(256)], dtype=np.uint8)
+# Gamma tables pre-shifted into their RGB565 bit positions, plus reusable conversion buffers
+_rgb565_r = _gamma_r.astype(np.uint16) << 11
+_rgb565_g = _gamma_g.astype(np.uint16) << 5
+_rgb565_b = _gamma_b.astype(np.uint16)
+_rgb565_buffers = {}
 weather_info = None
 spotify_track = None
 sp = None
 album_art_image = None
 artist_image = None
+previous_track_id = None
+consecutive_no_track_count = 0
+last_api_call = 0
 scroll_state = {"title": {"offset": 0, "max_offset": 0, "active": False}, "artists": {"offset": 0, "max_offset": 0, "active": False}, "album": {"offset": 0, "max_offset": 0, "active": False}}
 bg_map = {"Clear": "bg_clear.png", "Clouds": "bg_clouds.png", "Rain": "bg_rain.png", "Drizzle": "bg_drizzle.png", "Thunderstorm": "bg_storm.png", "Snow": "bg_snow.png", "Mist": "bg_mist.png", "Fog": "bg_fog.png", "Haze": "bg_haze.png", "Smoke": "bg_smoke.png", "Dust": "bg_dust.png", "Sand": "bg_sand.png", "Ash": "bg_ash.png", "Squall": "bg_squall.png", "Tornado": "bg_tornado.png"}
 art_pos = [float(SCREEN_WIDTH - 155), float(SCREEN_HEIGHT - 155)]
@@ -197,7 +242,59 @@ art_velocity = [1, 1]
 artist_on_top = False
 spotify_layout_cache = None
 scrolling_text_cache = {}
+# NumPy compositor: one persistent uint8 frame per screen, blended in place through preallocated scratch
+compositor_frames = {}
+_blend_acc = np.empty((SCREEN_HEIGHT, SCREEN_WIDTH, 3), dtype=np.uint16)
+_blend_carry = np.empty((SCREEN_HEIGHT, SCREEN_WIDTH, 3), dtype=np.uint16)
+_coverage_alpha = np.empty((SCREEN_HEIGHT, SCREEN_WIDTH, 1), dtype=np.uint16)
+_coverage_inv = np.empty((SCREEN_HEIGHT, SCREEN_WIDTH, 1), dtype=np.uint16)
+image_array_cache = OrderedDict()
+IMAGE_ARRAY_CACHE_MAX = 8
+# Clock screen: glyph atlases per (font, colour), memoized palettes and the scene of the last frame
+clock_digit_atlas = OrderedDict()
+CLOCK_ATLAS_MAX = 4
+clock_palette_cache = {}
+# Art palettes (mean, dominant colours, text colours) per image_key, see get_art_palette
+palette_cache = OrderedDict()
+palette_cache_lock = RLock()
+PALETTE_CACHE_MAX = 16
+clock_frame_state = {}
+# Clock scene inputs that change rarely: background/palette per source, local IP, Wyze thumbnail
+clock_scene_cache = {}
+LOCAL_IP_REFRESH = 60
+font_cache = {}
+# Weather screen: base frame without the time badge, and the scene/minute it was composed for
+weather_frame_state = {}
+# Per-frame state the Spotify frame was last composed from, used for dirty-rectangle updates
+spotify_frame_state = {}
+# Retained Spotify layers (background, sprites, panel, scrolling, hud), each rebuilt only when its inputs change
+spotify_layers = {}
+# Rectangles changed by the last render (None means the whole frame)
+frame_damage = None
+# Frame scheduler: producers mark screens dirty, render_loop is the only thread that renders
+render_condition = threading.Condition()
+render_dirty = set()
+render_stats = {'requested': 0, 'performed': 0}
+RENDER_STATS_INTERVAL = 300
+# Timer wheel (see run_timer_wheel): periodic screen updates on wall-clock boundaries
+timer_wheel = {}
+timer_wheel_lock = threading.Lock()
+timer_wheel_wake = Event()
+timer_dump_requested = Event()
+timer_wheel_stats = {'wakeups': 0, 'fired': 0}
+TRACK_END_SLACK = 1.0
+last_rendered_screen = None
+render_lock = RLock()
 last_display_time = 0
+# Memory-mapped framebuffer (see open_framebuffer) with a shadow copy of the RGB565 rows last written
+FBIOGET_VSCREENINFO = 0x4600
+FBIOGET_FSCREENINFO = 0x4602
+fb_map = None
+fb_map_failed = False
+fb_map_lock = RLock()
+# Last frame pushed to each output backend, compared tile by tile to find what changed
+frame_change_state = {}
+FRAME_TILE_SIZE = 16
 waveshare_lock = RLock()
 file_write_lock = threading.Lock()
 last_activity_time = time.time()
@@ -263,6 +360,9 @@ ANIMATION_FRAME_TIME = 1.0 / ANIMATION_FPS
 TEXT_SCROLL_FRAME_TIME = 1.0 / TEXT_SCROLL_FPS
 DEFAULT_ANIMATION_FPS = ANIMATION_FPS
 DEFAULT_TEXT_SCROLL_FPS = TEXT_SCROLL_FPS
+# Every screen is composed at SCREEN_WIDTH x SCREEN_HEIGHT and scaled on output, so album backgrounds
+# are only generated at that size; add a panel size once a render path composes at it directly.
+BACKGROUND_SIZES = [(SCREEN_WIDTH, SCREEN_HEIGHT)]
 def set_fps(anim_fps, scroll_fps):
     global ANIMATION_FPS, TEXT_SCROLL_FPS, ANIMATION_FRAME_TIME, TEXT_SCROLL_FRAME_TIME
     try:
@@ -273,8 +373,72 @@ def set_fps(anim_fps, scroll_fps):
     except Exception:
         pass
 
+# Adaptive FPS governor: render_frame records per-frame render/present time, perf_monitor_loop
+# weighs deadline misses, SoC temperature and load and moves between levels of (fps factor, quality).
+# Frames are always composed at full quality; 'quality' only picks RENDER_RESAMPLE, the filter used
+# where a finished frame has to be rescaled (the ST7789 downscale and the rotated framebuffer fallback).
+GOVERNOR_LEVELS = [(1.0, 'high'), (0.75, 'high'), (0.5, 'low'), (0.25, 'low')]
+GOVERNOR_INTERVAL = 2
+GOVERNOR_RECOVER_CHECKS = 5
+GOVERNOR_MISS_DEGRADE = 0.25
+GOVERNOR_MISS_RECOVER = 0.05
+governor_state = {'level': 0, 'calm_checks': 0}
+frame_timings = deque(maxlen=256)
+RENDER_RESAMPLE = Image.BILINEAR
+
+def record_frame_timing(render_time, present_time):
+    frame_timings.append((render_time, present_time))
+
+def read_soc_temperature(path=None):
+    """SoC temperature in degrees C from a sysfs thermal zone (reported in millidegrees), or None."""
+    try:
+        with open(path or THERMAL_ZONE_PATH, 'r') as f:
+            value = float(f.read().strip())
+    except (OSError, ValueError):
+        return None
+    return value / 1000.0 if value > 200 else value
+
+def governor_frame_budget(level):
+    """Seconds a frame may take at level: the MIN_DISPLAY_INTERVAL that apply_governor_level sets."""
+    factor = GOVERNOR_LEVELS[level][0]
+    return 1.0 / max(1, MAX_FPS * factor)
+
+def frame_miss_ratio(timings, budget):
+    if not timings:
+        return 0.0
+    return sum(1 for render_time, present_time in timings if render_time + present_time > budget) / len(timings)
+
+def governor_step(level, timings, temperature, load_ratio):
+    """Next governor level. Any pressure (frames over budget, SoC above THERMAL_HIGH_C, load) drops
+    a level at once; stepping back up needs GOVERNOR_RECOVER_CHECKS calm checks in a row in which
+    the frames would also have fit the faster level's budget and the SoC is under THERMAL_LOW_C."""
+    hot = temperature is not None and temperature >= THERMAL_HIGH_C
+    if hot or load_ratio > 0.9 or frame_miss_ratio(timings, governor_frame_budget(level)) > GOVERNOR_MISS_DEGRADE:
+        governor_state['calm_checks'] = 0
+        return min(level + 1, len(GOVERNOR_LEVELS) - 1)
+    if level == 0:
+        return level
+    cool = temperature is None or temperature <= THERMAL_LOW_C
+    if cool and load_ratio < 0.75 and frame_miss_ratio(timings, governor_frame_budget(level - 1)) <= GOVERNOR_MISS_RECOVER:
+        governor_state['calm_checks'] += 1
+        if governor_state['calm_checks'] >= GOVERNOR_RECOVER_CHECKS:
+            governor_state['calm_checks'] = 0
+            return level - 1
+    else:
+        governor_state['calm_checks'] = 0
+    return level
+
+def apply_governor_level(level):
+    global MIN_DISPLAY_INTERVAL, RENDER_RESAMPLE
+    factor, quality = GOVERNOR_LEVELS[level]
+    governor_state['level'] = level
+    set_fps(max(1, round(DEFAULT_ANIMATION_FPS * factor)), max(1, round(DEFAULT_TEXT_SCROLL_FPS * factor)))
+    MIN_DISPLAY_INTERVAL = 1.0 / max(1, MAX_FPS * factor)
+    RENDER_RESAMPLE = Image.BILINEAR if quality == 'high' else Image.NEAREST
+
 def perf_monitor_loop():
-    """Monitor CPU load and adjust frame rates to keep system responsive."""
+    """Adaptive FPS governor: every GOVERNOR_INTERVAL seconds step the level from the frame times
+    recorded since the last check, the SoC temperature and the load average."""
     while not exit_event.is_set():
         try:
             cores = os.cpu_count() or 1
@@ -282,17 +446,17 @@ def perf_monitor_loop():
                 loadavg = os.getloadavg()[0]
             except Exception:
                 loadavg = 0
-            ratio = loadavg / cores
-            if ratio > 0.75:
-                new_anim = max(5, DEFAULT_ANIMATION_FPS // 2)
-                new_text = max(5, DEFAULT_TEXT_SCROLL_FPS // 2)
-            else:
-                new_anim = DEFAULT_ANIMATION_FPS
-                new_text = DEFAULT_TEXT_SCROLL_FPS
-            set_fps(new_anim, new_text)
+            timings = [frame_timings.popleft() for _ in range(len(frame_timings))]
+            temperature = read_soc_temperature()
+            level = governor_state['level']
+            new_level = governor_step(level, timings, temperature, loadavg / cores)
+            if new_level != level:
+                apply_governor_level(new_level)
+                temp_text = f"{temperature:.1f}°C" if temperature is not None else "n/a"
+                print(f"🎚️ FPS governor level {new_level}: animation {ANIMATION_FPS} fps, scroll {TEXT_SCROLL_FPS} fps, quality {GOVERNOR_LEVELS[new_level][1]} (SoC {temp_text}, load {loadavg:.2f})")
         except Exception:
             pass
-        if exit_event.wait(10):
+        if exit_event.wait(GOVERNOR_INTERVAL):
             break
 LARGE_FONT = ImageFont.truetype(config["fonts"]["large_font_path"], config["fonts"]["large_font_size"])
 MEDIUM_FONT = ImageFont.truetype(config["fonts"]["medium_font_path"], config["fonts"]["medium_font_size"])
@@ -328,6 +492,12 @@ OVERLAY_ENABLED = config.get('overlay', {}).get('enabled', False)
 OVERLAY_TOKEN = config.get('overlay', {}).get('token', '')
 MAX_FPS = int(config.get('settings', {}).get('max_fps', 25) or 25)
 MIN_DISPLAY_INTERVAL = 1.0 / max(1, MAX_FPS)
+THERMAL_ZONE_PATH = config.get('settings', {}).get('thermal_zone', '/sys/class/thermal/thermal_zone0/temp')
+THERMAL_HIGH_C = float(config.get('settings', {}).get('thermal_high_c', 75))
+THERMAL_LOW_C = float(config.get('settings', {}).get('thermal_low_c', 65))
+ART_CACHE_DIR = config.get('settings', {}).get('art_cache_dir', './cache/art')
+ART_CACHE_BYTES = int(float(config.get('settings', {}).get('art_cache_mb', 64)) * 1024 * 1024)
+WEATHER_ICON_DIR = config.get('settings', {}).get('weather_icon_dir', './cache/weather_icons')
 DEBOUNCE_TIME = 0.3
 UPDATE_INTERVAL_WEATHER = 3600
 WAKEUP_CHECK_INTERVAL = 10
@@ -337,9 +507,15 @@ def get_cached_bg(bg_path, size):
     key = (bg_path, size)
     if key not in bg_cache:
         bg_img = Image.open(bg_path).resize(size, Image.BILINEAR)
-        bg_cache[key] = bg_img
+        bg_cache[key] = tag_image(bg_img, key)
     return bg_cache[key]
 
+def get_font(path, size):
+    key = (path, size)
+    if key not in font_cache:
+        font_cache[key] = ImageFont.truetype(path, size)
+    return font_cache[key]
+
 def get_cached_text_bbox(text, font):
     key = (text, getattr(font, "path", None), getattr(font, "size", None))
     if key not in text_bbox_cache:
@@ -350,11 +526,12 @@ def cleanup_caches():
     global bg_cache, text_bbox_cache, album_bg_cache, scrolling_text_cache
     if len(bg_cache) > 5:
         bg_cache.clear()
+        image_array_cache.clear()
     if len(text_bbox_cache) > 50:
         text_bbox_cache.clear()
-    if len(album_bg_cache) > 3:
-        keys = list(album_bg_cache.keys())[-3:]
-        album_bg_cache = {k: album_bg_cache[k] for k in keys}
+    with album_bg_cache_lock:
+        while len(album_bg_cache) > ALBUM_BG_CACHE_MAX:
+            album_bg_cache.popitem(last=False)
     if len(scrolling_text_cache) > 3:
         scrolling_text_cache.clear()
 
@@ -485,27 +662,28 @@ def get_weather_data_by_coords(api_key, lat, lon, units):
     except KeyError:
         return None
 
+def get_art_palette(img):
+    """hud_workers.art_palette() for an image, memoized by image_key() so the Spotify, clock and web
+    UI paths share one computation per piece of art."""
+    key = image_key(img)
+    with palette_cache_lock:
+        palette = palette_cache.get(key)
+        if palette is not None:
+            palette_cache.move_to_end(key)
+            return palette
+    return store_art_palette(img, hud_workers.art_palette(img))
+
+def store_art_palette(img, palette):
+    """Memoize a palette computed elsewhere (by the pool worker that thumbnailed img) for img."""
+    with palette_cache_lock:
+        palette_cache[image_key(img)] = palette
+        if len(palette_cache) > PALETTE_CACHE_MAX:
+            palette_cache.popitem(last=False)
+    return palette
+
 def get_contrasting_colors(img, n=2):
-    if img.mode != "RGB": img = img.convert("RGB")
-    small_img = img.resize((50, 50), Image.BILINEAR)
-    pixels = list(small_img.getdata())
-    avg_r = sum(p[0] for p in pixels) // len(pixels)
-    avg_g = sum(p[1] for p in pixels) // len(pixels)
-    avg_b = sum(p[2] for p in pixels) // len(pixels)
-    avg_h, avg_s, avg_v = colorsys.rgb_to_hsv(avg_r/255, avg_g/255, avg_b/255)
-    opposite_h = (avg_h + 0.5) % 1.0
-    colors = []
-    data_saturation = min(0.9, avg_s + 0.3)
-    label_saturation = max(0.6, data_saturation - 0.2)
-    base_brightness = 0.9 if avg_v < 0.3 else (0.8 if avg_v > 0.7 else 0.85)
-    r1, g1, b1 = colorsys.hsv_to_rgb(opposite_h, data_saturation, base_brightness)
-    colors.append((int(r1*255), int(g1*255), int(b1*255)))
-    if n > 1:
-        secondary_h = (opposite_h + 0.12) % 1.0
-        label_brightness = base_brightness - 0.05 if base_brightness > 0.7 else base_brightness
-        r2, g2, b2 = colorsys.hsv_to_rgb(secondary_h, label_saturation, label_brightness)
-        colors.append((int(r2*255), int(g2*255), int(b2*255)))
-    return colors[:n]
+    palette = get_art_palette(img)
+    return [palette['main_color'], palette['secondary_color']][:n]
 
 
 def init_lastfm_client():
@@ -628,45 +806,31 @@ def post_overlay_event(event):
     except Exception:
         pass
 
-def make_background_from_art(size, album_art_img):
-    width, height = size
-    if album_art_img is None:
-        bg = Image.new("RGB", size, (40, 40, 60))
-        for y in range(height):
-            factor = 0.7 + (y / height) * 0.6
-            for x in range(width):
-                r, g, b = bg.getpixel((x, y))
-                bg.putpixel((x, y), (int(r * factor), int(g * factor), int(b * factor)))
-        return bg
-    if album_art_img.mode != "RGB":
-        album_art_img = album_art_img.convert("RGB")
-    small_for_color = album_art_img.resize((50, 50), Image.BILINEAR)
-    pixels = list(small_for_color.getdata())
-    r = sum(p[0] for p in pixels) // len(pixels)
-    g = sum(p[1] for p in pixels) // len(pixels)
-    b = sum(p[2] for p in pixels) // len(pixels)
-    avg_color = (int(r * 0.7), int(g * 0.7), int(b * 0.7))
-    bg = Image.new("RGB", size, avg_color)
-    art_size = height
-    scaled_art = album_art_img.resize((art_size, art_size), Image.BILINEAR)
-    blurred_art = scaled_art.filter(ImageFilter.GaussianBlur(2))
-    enhancer = ImageEnhance.Brightness(blurred_art)
-    blurred_art = enhancer.enhance(0.6)
-    fade_width = min(80, art_size // 4)
-    x_coords = np.arange(art_size)
-    left_fade_mask = np.where(x_coords < fade_width,
-                            255 * ((x_coords / fade_width) ** 0.7),
-                            255).astype(np.uint8)
-    right_fade_mask = np.where(x_coords > art_size - fade_width,
-                            255 * (((art_size - x_coords) / fade_width) ** 0.7),
-                            255).astype(np.uint8)
-    combined_alpha = np.minimum(left_fade_mask, right_fade_mask)
-    mask_array = np.tile(combined_alpha, (art_size, 1))
-    mask = Image.fromarray(mask_array, mode='L')
-    art_x = (width - art_size) // 2
-    bg.paste(blurred_art, (art_x, 0), mask)
+def get_procedural_background(kind, size, color=(0, 0, 0)):
+    """Backgrounds drawn from code rather than art: the 'gradient' no-art fallback and 'solid' fills.
+    Generated once per (kind, size, colour), tagged, and shared read-only."""
+    key = (kind, tuple(size), tuple(color))
+    bg = procedural_bg_cache.get(key)
+    if bg is None:
+        bg = hud_workers.gradient_background(size) if kind == 'gradient' else Image.new("RGB", size, color)
+        procedural_bg_cache[key] = bg = tag_image(bg, key)
     return bg
 
+def make_backgrounds_from_art(sizes, album_art_img):
+    """Backgrounds for every size in one pass (see hud_workers.render_backgrounds), as {size: image}."""
+    if album_art_img is None:
+        return {tuple(size): get_procedural_background('gradient', size).copy() for size in sizes}
+    return hud_workers.render_backgrounds(album_art_img, [tuple(size) for size in sizes], get_art_palette(album_art_img)['mean'])
+
+
+def select_image_rendition(images, min_size):
+    """Pick from Spotify's image renditions ({'url', 'width', 'height'}) the smallest one whose short
+    side is at least min_size, falling back to the largest. Renditions without dimensions count as large."""
+    sized = [(min(r.get('width') or 0, r.get('height') or 0) or math.inf, i, r) for i, r in enumerate(images or []) if r.get('url')]
+    if not sized:
+        return None
+    enough = [entry for entry in sized if entry[0] >= min_size]
+    return (min(enough) if enough else max(sized))[2]
 
 def get_musicbrainz_cover_art(artist_name, album_name):
     """Search MusicBrainz for a release and return a Cover Art Archive URL for the front image (or None)."""
@@ -687,157 +851,46 @@ def get_musicbrainz_cover_art(artist_name, album_name):
         release_id = releases[0].get('id')
         if not release_id:
             return None
-        # Try the Cover Art Archive for the release front image
-        cover_url = f'https://coverartarchive.org/release/{release_id}/front'
-        # Check that the URL exists
-        r = session.head(cover_url, timeout=5, headers=headers)
-        if r.status_code == 200:
-            return cover_url
-        else:
-            # Cover Art Archive may return 404; try front-500 or the /front-250
-            for suffix in ['front-500', 'front-250', 'front-1200']:
-                tryu = f'https://coverartarchive.org/release/{release_id}/{suffix}'
-                r2 = session.head(tryu, timeout=5, headers=headers)
-                if r2.status_code == 200:
-                    return tryu
-            return None
+        # Try the Cover Art Archive thumbnails smallest-sufficient first; the original /front can be
+        # several thousand pixels wide
+        for suffix in ['front-500', 'front-1200', 'front', 'front-250']:
+            cover_url = f'https://coverartarchive.org/release/{release_id}/{suffix}'
+            r = session.head(cover_url, timeout=5, headers=headers)
+            if r.status_code == 200:
+                return cover_url
+        return None
     except Exception:
         return None
 
 
-def _make_background_bytes(art_bytes, size):
-    # Worker function to generate a background image from art bytes.
-    # This runs in a separate process; avoid global state.
-    try:
-        from PIL import Image as PILImage, ImageFilter as PILImageFilter, ImageEnhance as PILImageEnhance
-        import numpy as _np
-        from io import BytesIO as _BytesIO
-        if art_bytes is None:
-            bg = PILImage.new("RGB", size, (40, 40, 60))
-            # simple vertical gradient
-            width, height = size
-            pixels = bg.load()
-            for y in range(height):
-                factor = 0.7 + (y / height) * 0.6
-                for x in range(width):
-                    r, g, b = pixels[x, y]
-                    pixels[x, y] = (int(r * factor), int(g * factor), int(b * factor))
-            buf = _BytesIO()
-            bg.save(buf, format='PNG')
-            return buf.getvalue()
-        img = PILImage.open(_BytesIO(art_bytes)).convert('RGB')
-        width, height = size
-        small_for_color = img.resize((50, 50), PILImage.BILINEAR)
-        pixels = list(small_for_color.getdata())
-        r = sum(p[0] for p in pixels) // len(pixels)
-        g = sum(p[1] for p in pixels) // len(pixels)
-        b = sum(p[2] for p in pixels) // len(pixels)
-        avg_color = (int(r * 0.7), int(g * 0.7), int(b * 0.7))
-        bg = PILImage.new("RGB", (width, height), avg_color)
-        art_size = height
-        scaled_art = img.resize((art_size, art_size), PILImage.BILINEAR)
-        blurred_art = scaled_art.filter(PILImageFilter.GaussianBlur(2))
-        enhancer = PILImageEnhance.Brightness(blurred_art)
-        blurred_art = enhancer.enhance(0.6)
-        fade_width = min(80, art_size // 4)
-        x_coords = _np.arange(art_size)
-        left_fade_mask = _np.where(x_coords < fade_width,
-                                255 * ((x_coords / fade_width) ** 0.7),
-                                255).astype(_np.uint8)
-        right_fade_mask = _np.where(x_coords > art_size - fade_width,
-                                255 * (((art_size - x_coords) / fade_width) ** 0.7),
-                                255).astype(_np.uint8)
-        combined_alpha = _np.minimum(left_fade_mask, right_fade_mask)
-        mask_array = _np.tile(combined_alpha, (art_size, 1))
-        mask = PILImage.fromarray(mask_array, mode='L')
-        art_x = (width - art_size) // 2
-        bg.paste(blurred_art, (art_x, 0), mask)
-        buf = _BytesIO()
-        bg.save(buf, format='PNG')
-        return buf.getvalue()
-    except Exception as e:
-        try:
-            # On failure return a basic black PNG
-            from PIL import Image as PILImage
-            from io import BytesIO as _BytesIO
-            bg = PILImage.new('RGB', size, 'black')
-            buf = _BytesIO(); bg.save(buf, format='PNG'); return buf.getvalue()
-        except Exception:
-            return b''
-
-
-    def _process_artist_image_bytes(art_bytes):
-        try:
-            from PIL import Image as PILImage
-            from io import BytesIO as _BytesIO
-            if not art_bytes:
-                return b''
-            img = PILImage.open(_BytesIO(art_bytes)).convert('RGBA')
-            img = img.resize((100, 100), PILImage.BILINEAR)
-            buf = _BytesIO()
-            img.save(buf, format='PNG')
-            return buf.getvalue()
-        except Exception:
-            return b''
-
-
-    def _process_album_art_bytes(art_bytes, size=(150,150)):
-        try:
-            from PIL import Image as PILImage
-            from io import BytesIO as _BytesIO
-            import colorsys as _colorsys
-            if not art_bytes:
-                return (b'', (0,255,0), (0,255,255))
-            img = PILImage.open(_BytesIO(art_bytes)).convert('RGB')
-            img.thumbnail(size, PILImage.BILINEAR)
-            bio = _BytesIO(); img.save(bio, format='PNG'); img_bytes = bio.getvalue()
-            # compute contrasting colors
-            small_for_color = img.resize((50,50), PILImage.BILINEAR)
-            pixels = list(small_for_color.getdata())
-            r = sum(p[0] for p in pixels) // len(pixels)
-            g = sum(p[1] for p in pixels) // len(pixels)
-            b = sum(p[2] for p in pixels) // len(pixels)
-            avg_h, avg_s, avg_v = _colorsys.rgb_to_hsv(r/255.0, g/255.0, b/255.0)
-            opposite_h = (avg_h + 0.5) % 1.0
-            data_saturation = min(0.9, avg_s + 0.3)
-            label_saturation = max(0.6, data_saturation - 0.2)
-            base_brightness = 0.9 if avg_v < 0.3 else (0.8 if avg_v > 0.7 else 0.85)
-            r1,g1,b1 = _colorsys.hsv_to_rgb(opposite_h, data_saturation, base_brightness)
-            main_color = (int(r1*255), int(g1*255), int(b1*255))
-            secondary_h = (opposite_h + 0.12) % 1.0
-            label_brightness = base_brightness - 0.05 if base_brightness > 0.7 else base_brightness
-            r2,g2,b2 = _colorsys.hsv_to_rgb(secondary_h, label_saturation, label_brightness)
-            secondary_color = (int(r2*255), int(g2*255), int(b2*255))
-            return (img_bytes, main_color, secondary_color)
-        except Exception:
-            return (b'', (0,255,0), (0,255,255))
-
-
-    def _dither_image_bytes(art_bytes, size=(40,40)):
-        try:
-            from PIL import Image as PILImage
-            from io import BytesIO as _BytesIO
-            if not art_bytes:
-                return b''
-            img = PILImage.open(_BytesIO(art_bytes)).convert('RGB')
-            img = img.resize(size, PILImage.BILINEAR)
-            bw = img.convert('L')
-            bw = bw.convert('1')
-            buf = _BytesIO()
-            bw.save(buf, format='PNG')
-            return buf.getvalue()
-        except Exception:
-            return b''
+def pack_image(img):
+    """Raw transport for process pool jobs: (mode, size, pixel bytes). Pickles without any codec work
+    on either side, unlike the PNG round trip it replaces."""
+    if img is None:
+        return None
+    return (img.mode, img.size, img.tobytes())
 
-def compute_img_hash(img):
-    """Compute a stable MD5 hash for an image by saving to PNG bytes."""
-    try:
-        buf = BytesIO()
-        img.save(buf, format='PNG')
-        import hashlib
-        return hashlib.md5(buf.getvalue()).hexdigest()
-    except Exception:
+def unpack_image(packed):
+    if not packed:
         return None
+    mode, size, data = packed
+    return Image.frombytes(mode, size, data)
+
+def tag_image(img, key):
+    """Attach a stable content key (e.g. the URL it was downloaded from) to an image when it is loaded.
+    Tagged images are treated as read-only; the tag follows copy() and lapses when size or mode change."""
+    if img is not None:
+        img.info['hud_key'] = (key, img.size, img.mode)
+    return img
+
+def image_key(img):
+    """Cache key for an image's content: its tag_image() key, or for untagged images a digest of the
+    raw pixels computed once and then kept on the image as its tag."""
+    tag = img.info.get('hud_key')
+    if tag is not None and tag[1:] == (img.size, img.mode):
+        return tag
+    digest = hashlib.blake2b(img.tobytes(), digest_size=16).hexdigest()
+    return tag_image(img, digest).info['hud_key']
 
 
 def get_local_ip():
@@ -854,34 +907,176 @@ def get_local_ip():
         return '127.0.0.1'
 
 
-ALBUM_BG_CACHE_MAX = 3
+ALBUM_BG_CACHE_MAX = 3 * len(BACKGROUND_SIZES)
+def background_targets(size):
+    """size first, then the other BACKGROUND_SIZES; one generation pass produces all of them."""
+    size = tuple(size)
+    return [size] + [other for other in BACKGROUND_SIZES if other != size]
+
+def store_backgrounds(album_art_hash, backgrounds):
+    """Put {size: background} into the album background LRU."""
+    with album_bg_cache_lock:
+        for size, bg in backgrounds.items():
+            album_bg_cache[(album_art_hash, size)] = bg.copy()
+            album_bg_cache.move_to_end((album_art_hash, size))
+        while len(album_bg_cache) > ALBUM_BG_CACHE_MAX:
+            album_bg_cache.popitem(last=False)
+
 def get_cached_background(size, album_art_img, album_art_hash=None):
     """Return a cached background for a given album art & size. Uses an LRU OrderedDict.
-    album_art_hash may be provided to avoid repeated hashing."""
-    global album_bg_cache
+    album_art_hash defaults to the art's image_key(). A miss generates every display geometry."""
     if album_art_img is None:
-        return Image.new("RGB", size, "black")
+        return get_procedural_background('solid', size).copy()
     if album_art_hash is None:
-        album_art_hash = compute_img_hash(album_art_img)
-    key = (album_art_hash, size)
+        album_art_hash = image_key(album_art_img)
+    key = (album_art_hash, tuple(size))
     with album_bg_cache_lock:
         if key in album_bg_cache:
             album_bg_cache.move_to_end(key)
             return album_bg_cache[key].copy()
-    bg = make_background_from_art(size, album_art_img)
-    with album_bg_cache_lock:
-        album_bg_cache[key] = bg.copy()
-        if len(album_bg_cache) > ALBUM_BG_CACHE_MAX:
-            album_bg_cache.popitem(last=False)
-    return bg
+    backgrounds = make_backgrounds_from_art(background_targets(size), album_art_img)
+    store_backgrounds(album_art_hash, backgrounds)
+    return backgrounds[tuple(size)]
+
+
+def art_cache_url(img):
+    """Download URL an album art image was tagged with by tag_image(), or None."""
+    if img is None:
+        return None
+    key = image_key(img)[0]
+    if isinstance(key, str) and key.startswith(('http://', 'https://')):
+        return key
+    return None
+
+def _art_disk_path(key, suffix):
+    return os.path.join(ART_CACHE_DIR, key + suffix)
+
+def _load_art_disk_index():
+    """Rebuild the LRU index from the cache directory, oldest entry first by file mtime."""
+    global art_disk_index_loaded, art_disk_bytes
+    entries = {}
+    try:
+        with os.scandir(ART_CACHE_DIR) as it:
+            for entry in it:
+                if len(entry.name) > 40 and entry.is_file():
+                    stat = entry.stat()
+                    files, mtime = entries.get(entry.name[:40], ({}, 0))
+                    files[entry.name[40:]] = stat.st_size
+                    entries[entry.name[:40]] = (files, max(mtime, stat.st_mtime))
+    except OSError:
+        pass
+    art_disk_index.clear()
+    for key, (files, _) in sorted(entries.items(), key=lambda kv: kv[1][1]):
+        art_disk_index[key] = files
+    art_disk_bytes = sum(sum(files.values()) for files in art_disk_index.values())
+    art_disk_index_loaded = True
+
+def _touch_art_disk_entry(key):
+    if not art_disk_index_loaded:
+        _load_art_disk_index()
+    if key in art_disk_index:
+        art_disk_index.move_to_end(key)
+        try:
+            os.utime(_art_disk_path(key, '.json'))
+        except OSError:
+            pass
+        return True
+    return False
+
+def _write_art_disk_file(key, suffix, data):
+    """Atomically write one cache file, then re-account the entry and evict to the byte budget."""
+    global art_disk_bytes
+    os.makedirs(ART_CACHE_DIR, exist_ok=True)
+    path = _art_disk_path(key, suffix)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    if not art_disk_index_loaded:
+        _load_art_disk_index()
+    files = art_disk_index.pop(key, {})
+    art_disk_bytes += len(data) - files.get(suffix, 0)
+    files[suffix] = len(data)
+    art_disk_index[key] = files
+    while art_disk_bytes > ART_CACHE_BYTES and len(art_disk_index) > 1:
+        old_key, old_files = art_disk_index.popitem(last=False)
+        art_disk_bytes -= sum(old_files.values())
+        for old_suffix in old_files:
+            try:
+                os.remove(_art_disk_path(old_key, old_suffix))
+            except OSError:
+                pass
+
+def art_cache_get(url):
+    """Cached album art for a URL: {'image': 150px thumbnail tagged with the URL, 'main_color',
+    'secondary_color'}, or None when it has not been processed before."""
+    if not url:
+        return None
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    with art_disk_lock:
+        if not _touch_art_disk_entry(key):
+            return None
+        try:
+            with open(_art_disk_path(key, '.json'), 'r') as f:
+                meta = json.load(f)
+            img = Image.open(_art_disk_path(key, '.png'))
+            img.load()
+        except (OSError, ValueError):
+            return None
+    return {'image': tag_image(img.convert('RGB'), url),
+            'main_color': tuple(meta['main_color']), 'secondary_color': tuple(meta['secondary_color'])}
+
+def art_cache_put(url, img, main_color, secondary_color):
+    if not url or img is None:
+        return
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    try:
+        bio = BytesIO(); img.save(bio, format='PNG')
+        meta = {'url': url, 'main_color': list(main_color), 'secondary_color': list(secondary_color)}
+        with art_disk_lock:
+            _write_art_disk_file(key, '.png', bio.getvalue())
+            _write_art_disk_file(key, '.json', json.dumps(meta).encode('utf-8'))
+    except Exception as e:
+        print(f"⚠️ Album art cache write failed: {e}")
+
+def art_cache_get_image(url, size):
+    """Cached image derived from the art at url at the given size (generated backgrounds, the web
+    copy), or None."""
+    if not url:
+        return None
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    with art_disk_lock:
+        if not _touch_art_disk_entry(key):
+            return None
+        try:
+            img = Image.open(_art_disk_path(key, f'-{size[0]}x{size[1]}.jpg'))
+            img.load()
+        except OSError:
+            return None
+    return img.convert('RGB')
+
+def art_cache_put_image(url, size, img):
+    if not url or img is None:
+        return
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    try:
+        bio = BytesIO(); img.convert('RGB').save(bio, format='JPEG', quality=90)
+        with art_disk_lock:
+            _write_art_disk_file(key, f'-{size[0]}x{size[1]}.jpg', bio.getvalue())
+    except Exception as e:
+        print(f"⚠️ Art image cache write failed: {e}")
+
+
+def art_cache_put_backgrounds(url, backgrounds):
+    for size, bg in backgrounds.items():
+        art_cache_put_image(url, size, bg)
 
 
 def get_cached_resized_image(img, size, mode='RGB'):
-    """Return a resized/converted version of img, using LRU cache keyed by image hash & size."""
+    """Return a resized/converted version of img, using LRU cache keyed by image key & size."""
     if img is None:
         return None
-    img_hash = compute_img_hash(img)
-    key = (img_hash, size, mode)
+    key = (image_key(img), size, mode)
     if key in resized_image_cache:
         resized_image_cache.move_to_end(key)
         return resized_image_cache[key].copy()
@@ -899,172 +1094,209 @@ def get_cached_resized_image(img, size, mode='RGB'):
         return img
 
 
-def get_cached_dithered_image(img, size=(40, 40)):
-    if img is None:
-        return None
-    img_hash = compute_img_hash(img)
-    key = (img_hash, size, '1')
-    with dithered_cache_lock:
-        if key in dithered_image_cache:
-            dithered_image_cache.move_to_end(key)
-            return dithered_image_cache[key].copy()
+def start_process_pool():
+    """Create the image worker pool (see hud_workers) and warm every worker up with a dummy job, so the
+    first track change after boot does not pay for process spawn and imports. Called from main() before
+    the other threads start rather than at import, since forking at import time can be problematic."""
+    global process_executor
     if process_executor is not None:
-        # Submit to process pool and return None until result is ready
-        try:
-            bio = BytesIO(); img.save(bio, format='PNG'); art_bytes = bio.getvalue()
-            fut = process_executor.submit(_dither_image_bytes, art_bytes, size)
-            pending_dither_futures[fut] = {'size': size, 'key': key}
-            return None
-        except Exception:
-            pass
-    # fallback synchronous conversion
+        return
     try:
-        small_img = img.resize(size, Image.BILINEAR)
-        gray_img = small_img.convert('L')
-        bw_img = gray_img.convert('1')
-        with dithered_cache_lock:
-            dithered_image_cache[key] = bw_img.copy()
-            if len(dithered_image_cache) > IMG_CACHE_MAX:
-                dithered_image_cache.popitem(last=False)
-        return bw_img
-    except Exception:
-        return img.convert('1')
-
-def background_generation_worker():
-    global spotify_bg_cache, current_album_art_hash, clock_bg_image
-    global spotify_bg_cache, current_album_art_hash, clock_bg_image, process_executor, pending_bg_futures
-    # Lazily initialize process executor since forking at import time can be problematic
-    if process_executor is None:
+        cpu_count = os.cpu_count() or 1
+        config_workers = config.get('settings', {}).get('process_pool_workers', None)
+        if config_workers and isinstance(config_workers, int) and config_workers > 0:
+            workers = config_workers
+        else:
+            workers = max(1, cpu_count // 2)
+        process_executor = ProcessPoolExecutor(max_workers=workers, initializer=hud_workers.init_worker, initargs=(BACKGROUND_SIZES,))
+        for _ in range(workers):
+            process_executor.submit(hud_workers.warm_up, BACKGROUND_SIZES)
+        print(f"✅ ProcessPoolExecutor initialized with {workers} workers")
+    except Exception as e:
+        print(f"⚠️ ProcessPoolExecutor init failed: {e}")
+        process_executor = None
+
+def dispatch_future(fut, handler, meta):
+    """Hand a pool future's result to handler(result, meta) the moment it completes. Callbacks run on
+    the executor's completion thread, so handlers only install results and mark screens dirty; slower
+    follow-up work (disk cache writes) goes to the thread pool."""
+    def on_done(done):
+        # begin_track_generation() cancels queued jobs of a skipped track on purpose
+        if done.cancelled():
+            return
         try:
-            cpu_count = os.cpu_count() or 1
-            config_workers = config.get('settings', {}).get('process_pool_workers', None)
-            if config_workers and isinstance(config_workers, int) and config_workers > 0:
-                workers = config_workers
-            else:
-                workers = max(1, cpu_count // 2)
-            process_executor = ProcessPoolExecutor(max_workers=workers)
-            print(f"✅ ProcessPoolExecutor initialized with {workers} workers")
+            result = done.result()
+            if result:
+                handler(result, meta)
         except Exception as e:
-            print(f"⚠️ ProcessPoolExecutor init failed: {e}")
-            process_executor = None
+            print(f"⚠️ {handler.__name__} error: {e}")
+    fut.add_done_callback(on_done)
+    return fut
+
+def begin_track_generation():
+    """Start a new track generation and cancel pool jobs queued for older ones. Jobs already running
+    cannot be interrupted; they notice through is_current_generation() and their results are dropped."""
+    global track_generation, generation_futures
+    with track_generation_lock:
+        track_generation += 1
+        stale, generation_futures = generation_futures, []
+        generation = track_generation
+    cancelled = sum(1 for _, fut in stale if fut.cancel())
+    if cancelled:
+        print(f"⏭️ Cancelled {cancelled} queued job(s) for superseded tracks")
+    return generation
+
+def is_current_generation(generation):
+    """Untagged work (generation None) is never considered stale."""
+    return generation is None or generation == track_generation
+
+def track_future(fut, generation):
+    """Register a future so begin_track_generation() can cancel it while it is still queued."""
+    if generation is not None:
+        with track_generation_lock:
+            generation_futures[:] = [(g, f) for g, f in generation_futures if not f.done()]
+            generation_futures.append((generation, fut))
+    return fut
+
+def download_for_generation(url, generation, require_image=False, chunk_size=16384, **kwargs):
+    """GET url in chunks, abandoning the transfer as soon as the generation is superseded.
+    Returns the body, or None if the download was abandoned."""
+    with session.get(url, stream=True, **kwargs) as resp:
+        resp.raise_for_status()
+        if require_image and 'image' not in resp.headers.get('content-type', '').lower():
+            raise ValueError("Not an image")
+        chunks = []
+        for chunk in resp.iter_content(chunk_size):
+            if not is_current_generation(generation):
+                return None
+            chunks.append(chunk)
+    return b''.join(chunks)
+
+def set_generated_background(bg_type, bg, album_hash):
+    global spotify_bg_cache, current_album_art_hash, clock_bg_image
+    if bg_type == 'spotify':
+        with spotify_bg_cache_lock:
+            spotify_bg_cache = bg
+            current_album_art_hash = album_hash
+        invalidate_spotify_layers('background')
+        update_display('spotify')
+    elif bg_type == 'clock':
+        with clock_bg_lock:
+            clock_bg_image = bg
+        update_display('time')
+
+def on_background_ready(data, meta):
+    if not is_current_generation(meta.get('generation')) or not is_latest_background_job(meta['bg_type'], meta.get('seq')):
+        return
+    backgrounds = {size: unpack_image(packed) for size, packed in data.items()}
+    executor.submit(art_cache_put_backgrounds, meta.get('url'), backgrounds)
+    store_backgrounds(meta['album_hash'], backgrounds)
+    set_generated_background(meta['bg_type'], backgrounds[meta['size']], meta['album_hash'])
+
+def on_artist_image_ready(data, meta):
+    global artist_image
+    if not is_current_generation(meta.get('generation')):
+        return
+    img = tag_image(unpack_image(data), meta.get('url'))
+    with artist_image_lock:
+        artist_image = img
+    update_display('spotify')
+
+def on_album_art_ready(result, meta):
+    global album_art_image
+    packed, main_color, secondary_color, palette = result
+    if not packed or not is_current_generation(meta.get('generation')):
+        return
+    img = tag_image(unpack_image(packed), meta.get('url'))
+    store_art_palette(img, palette)
+    with art_lock:
+        album_art_image = img
+    executor.submit(art_cache_put, meta.get('url'), img, main_color, secondary_color)
+    spotify_track_local = spotify_track
+    if spotify_track_local:
+        spotify_track_local['main_color'] = main_color
+        spotify_track_local['secondary_color'] = secondary_color
+        spotify_track_local['palette'] = palette['dominant']
+    update_spotify_layout(spotify_track_local)
+    update_display('spotify')
+
+def enqueue_background_job(bg_type, album_img, size, generation=None):
+    """Queue a background for bg_type, replacing any job for that type still waiting."""
+    global bg_job_seq
+    with bg_jobs_condition:
+        bg_job_seq += 1
+        bg_job_stats['queued'] += 1
+        if bg_jobs.pop(bg_type, None) is not None:
+            bg_job_stats['coalesced'] += 1
+        bg_jobs[bg_type] = (album_img, size, generation, bg_job_seq)
+        bg_jobs_condition.notify()
+
+def take_background_job(timeout):
+    """Pop the oldest pending job as (bg_type, album_img, size, generation, seq), or None on timeout.
+    Jobs queued for an older track generation are counted as dropped and skipped."""
+    with bg_jobs_condition:
+        while True:
+            if not bg_jobs_condition.wait_for(lambda: bg_jobs or exit_event.is_set(), timeout) or not bg_jobs:
+                return None
+            bg_type, (album_img, size, generation, seq) = bg_jobs.popitem(last=False)
+            bg_job_latest[bg_type] = seq
+            if is_current_generation(generation):
+                bg_job_stats['run'] += 1
+                return bg_type, album_img, size, generation, seq
+            bg_job_stats['dropped'] += 1
+
+def is_latest_background_job(bg_type, seq):
+    """False once a newer job for bg_type has been taken or is waiting; its result would be stale."""
+    with bg_jobs_condition:
+        if bg_type in bg_jobs or bg_job_latest.get(bg_type) != seq:
+            bg_job_stats['dropped'] += 1
+            return False
+        return True
+
+def generate_backgrounds_inline(art_url, album_img, album_hash, targets):
+    """Worker fallback without a process pool: all targets in one pass, cached in memory and on disk.
+    Returns the background for targets[0]."""
+    backgrounds = make_backgrounds_from_art(targets, album_img)
+    store_backgrounds(album_hash, backgrounds)
+    art_cache_put_backgrounds(art_url, backgrounds)
+    return backgrounds[targets[0]]
+
+def background_generation_worker():
+    """Turns queued background requests into pool jobs. Results come back through dispatch_future()."""
+    last_report = time.monotonic()
     while not exit_event.is_set():
-        # First, check for completed futures (background images, artists, dithered images)
-        for fut, meta in list(pending_bg_futures.items()):
-            if fut.done():
-                try:
-                    data = fut.result()
-                    if data:
-                        img = Image.open(BytesIO(data)).convert('RGB')
-                        size, bg_type, album_hash = meta['size'], meta['bg_type'], meta['album_hash']
-                        if bg_type == 'spotify':
-                            with spotify_bg_cache_lock:
-                                spotify_bg_cache = img.copy()
-                                current_album_art_hash = album_hash
-                        elif bg_type == 'clock':
-                            with clock_bg_lock:
-                                clock_bg_image = img.copy()
-                        key = (album_hash, size)
-                        try:
-                            album_bg_cache[key] = img.copy()
-                            album_bg_cache.move_to_end(key)
-                        except Exception:
-                            pass
-                except Exception as e:
-                    print(f"Background generation future error: {e}")
-                finally:
-                    pending_bg_futures.pop(fut, None)
-            # Artist futures
-            for fut, meta in list(pending_artist_futures.items()):
-                if fut.done():
-                    try:
-                        data = fut.result()
-                        if data:
-                            img = Image.open(BytesIO(data)).convert('RGBA')
-                            with artist_image_lock:
-                                artist_image = img
-                            try:
-                                update_display()
-                            except Exception:
-                                pass
-                    except Exception as e:
-                        print(f"Artist generation future error: {e}")
-                    finally:
-                        pending_artist_futures.pop(fut, None)
-            # Album art futures
-            for fut, meta in list(pending_album_futures.items()):
-                if fut.done():
-                    try:
-                        img_bytes, main_color, secondary_color = fut.result()
-                        if img_bytes:
-                            img = Image.open(BytesIO(img_bytes)).convert('RGB')
-                            with art_lock:
-                                album_art_image = img
-                            spotify_track_local = spotify_track
-                            if spotify_track_local:
-                                spotify_track_local['main_color'] = main_color
-                                spotify_track_local['secondary_color'] = secondary_color
-                            update_spotify_layout(spotify_track_local)
-                            if START_SCREEN == 'spotify':
-                                update_display()
-                    except Exception as e:
-                        print(f"Album art future error: {e}")
-                    finally:
-                        pending_album_futures.pop(fut, None)
-            # Dither futures
-            for fut, meta in list(pending_dither_futures.items()):
-                if fut.done():
-                    try:
-                        data = fut.result()
-                        if data:
-                            bw = Image.open(BytesIO(data)).convert('1')
-                            size, key = meta.get('size'), meta.get('key')
-                            with dithered_cache_lock:
-                                dithered_image_cache[key] = bw.copy()
-                                dithered_image_cache.move_to_end(key)
-                    except Exception as e:
-                        print(f"Dither generation future error: {e}")
-                    finally:
-                        pending_dither_futures.pop(fut, None)
-        try:
-            album_img, size, bg_type = bg_generation_queue.get(timeout=1)
-        except queue.Empty:
+        if time.monotonic() - last_report >= BG_JOB_STATS_INTERVAL:
+            last_report = time.monotonic()
+            print(f"📊 Background jobs: {bg_job_stats['run']} run for {bg_job_stats['queued']} requested "
+                  f"({bg_job_stats['coalesced']} coalesced, {bg_job_stats['dropped']} dropped)")
+        job = take_background_job(timeout=1)
+        if job is None:
             continue
+        bg_type, album_img, size, generation, seq = job
         try:
-            album_hash = compute_img_hash(album_img) if album_img else None
-            if process_executor is not None:
+            album_hash = image_key(album_img) if album_img else None
+            art_url = art_cache_url(album_img)
+            targets = background_targets(size)
+            with album_bg_cache_lock:
+                ready_bg = album_bg_cache.get((album_hash, size))
+            if ready_bg is None:
+                cached = {target: art_cache_get_image(art_url, target) for target in targets}
+                if all(bg is not None for bg in cached.values()):
+                    store_backgrounds(album_hash, cached)
+                    ready_bg = cached[size]
+            if ready_bg is not None:
+                set_generated_background(bg_type, ready_bg.copy(), album_hash)
+            elif process_executor is not None:
                 try:
-                    if album_img is not None:
-                        bio = BytesIO(); album_img.save(bio, format='PNG'); art_bytes = bio.getvalue()
-                    else:
-                        art_bytes = None
-                    fut = process_executor.submit(_make_background_bytes, art_bytes, size)
-                    pending_bg_futures[fut] = {'size': size, 'bg_type': bg_type, 'album_hash': album_hash}
+                    fut = track_future(process_executor.submit(hud_workers.make_backgrounds, pack_image(album_img), targets), generation)
+                    dispatch_future(fut, on_background_ready, {'size': size, 'bg_type': bg_type, 'album_hash': album_hash, 'url': art_url, 'generation': generation, 'seq': seq})
                 except Exception as e:
                     # fallback: generate inline
-                    generated_bg = get_cached_background(size, album_img, album_art_hash=album_hash)
-                    if bg_type == 'spotify':
-                        with spotify_bg_cache_lock:
-                            spotify_bg_cache = generated_bg.copy() if generated_bg else None
-                            current_album_art_hash = album_hash
-                    elif bg_type == 'clock':
-                        with clock_bg_lock:
-                            clock_bg_image = generated_bg.copy() if generated_bg else None
+                    set_generated_background(bg_type, generate_backgrounds_inline(art_url, album_img, album_hash, targets), album_hash)
             else:
-                generated_bg = get_cached_background(size, album_img, album_art_hash=album_hash)
-                if bg_type == 'spotify':
-                    with spotify_bg_cache_lock:
-                        spotify_bg_cache = generated_bg.copy() if generated_bg else None
-                        current_album_art_hash = album_hash
-                elif bg_type == 'clock':
-                    with clock_bg_lock:
-                        clock_bg_image = generated_bg.copy() if generated_bg else None
+                set_generated_background(bg_type, generate_backgrounds_inline(art_url, album_img, album_hash, targets), album_hash)
         except Exception as e:
             print(f"Background generation worker error: {e}")
-        finally:
-            try:
-                bg_generation_queue.task_done()
-            except Exception:
-                pass
         # check for new notifications from neondisplay every loop iteration
         try:
             # poll notifications regardless of process executor availability
@@ -1086,10 +1318,12 @@ def background_generation_worker():
         except Exception:
             pass
 
-def request_background_generation(album_img):
+def request_background_generation(album_img, generation=None):
     global current_clock_artwork, current_clock_artwork_hash
+    if not is_current_generation(generation):
+        return
     if album_img is not None:
-        album_hash = compute_img_hash(album_img)
+        album_hash = image_key(album_img)
         with clock_bg_lock:
             if current_clock_artwork is None or album_hash != current_clock_artwork_hash:
                 current_clock_artwork = album_img.copy()
@@ -1099,15 +1333,9 @@ def request_background_generation(album_img):
             if request_background_generation.last_queued_hash == current_hash:
                 return
         request_background_generation.last_queued_hash = current_hash
-        try:
-            bg_generation_queue.put((album_img, (SCREEN_WIDTH, SCREEN_HEIGHT), "spotify"), block=False)
-        except queue.Full:
-            pass
+        enqueue_background_job("spotify", album_img, (SCREEN_WIDTH, SCREEN_HEIGHT), generation)
         if CLOCK_BACKGROUND == "album":
-            try:
-                bg_generation_queue.put((album_img, (SCREEN_WIDTH, SCREEN_HEIGHT), "clock"), block=False)
-            except queue.Full:
-                pass
+            enqueue_background_job("clock", album_img, (SCREEN_WIDTH, SCREEN_HEIGHT), generation)
     else:
         with clock_bg_lock:
             current_clock_artwork = None
@@ -1127,21 +1355,164 @@ def get_background_path(weather_info):
         return "bg_default.png"
     return None
 
-def draw_text_aliased(draw, image, position, text, font, fill):
-    mask = Image.new("L", image.size, 0)
-    mask_draw = ImageDraw.Draw(mask)
-    mask_draw.text(position, text, fill=255, font=font)
-    color_layer = Image.new("RGB", image.size, fill)
-    image.paste(color_layer, (0, 0), mask)
+def get_frame_buffer(name):
+    """Persistent (H, W, 3) uint8 frame for a screen, allocated once and recomposited in place."""
+    frame = compositor_frames.get(name)
+    if frame is None:
+        frame = compositor_frames[name] = np.zeros((SCREEN_HEIGHT, SCREEN_WIDTH, 3), dtype=np.uint8)
+    return frame
+
+def frame_image(frame):
+    """PIL image for what render_frame pushes: compositor screens hand over their frame array, which only
+    the backends that scale or dither need as an image (one copy, made there)."""
+    return Image.fromarray(frame) if isinstance(frame, np.ndarray) else frame
+
+def image_array(img):
+    """Read-only uint8 RGB array for an image, converted once per image object (small identity LRU)."""
+    key = id(img)
+    entry = image_array_cache.get(key)
+    if entry is not None and entry[0] is img:
+        image_array_cache.move_to_end(key)
+        return entry[1]
+    arr = np.asarray(img if img.mode == "RGB" else img.convert("RGB"), dtype=np.uint8)
+    # The entry holds the image itself so its id cannot be reused while cached
+    image_array_cache[key] = (img, arr)
+    if len(image_array_cache) > IMAGE_ARRAY_CACHE_MAX:
+        image_array_cache.popitem(last=False)
+    return arr
+
+def _clip_box(box, clip=None):
+    cx0, cy0, cx1, cy1 = clip if clip is not None else (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+    x0, y0 = max(int(box[0]), cx0, 0), max(int(box[1]), cy0, 0)
+    x1, y1 = min(int(box[2]), cx1, SCREEN_WIDTH), min(int(box[3]), cy1, SCREEN_HEIGHT)
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return x0, y0, x1, y1
+
+def _blend_into(dst, inv_alpha, color_term):
+    """dst = round((dst * inv_alpha + color_term) / 255) in place, color_term being colour * alpha.
+    Runs in the preallocated uint16 scratch; the rounding is exact over the whole 0..255*255 range."""
+    h, w = dst.shape[:2]
+    acc = _blend_acc[:h, :w]
+    carry = _blend_carry[:h, :w]
+    np.multiply(dst, inv_alpha, out=acc, dtype=np.uint16)
+    acc += color_term
+    acc += 128
+    np.right_shift(acc, 8, out=carry)
+    acc += carry
+    acc >>= 8
+    np.copyto(dst, acc, casting='unsafe')
+
+def make_layer(rgba, box):
+    """Premultiplied compositor layer from an RGBA image drawn for screen rectangle box:
+    colour * alpha as uint16 plus the inverted alpha."""
+    arr = np.asarray(rgba if rgba.mode == "RGBA" else rgba.convert("RGBA"))
+    alpha = arr[:, :, 3:]
+    return {'box': tuple(box), 'color': arr[:, :, :3] * alpha.astype(np.uint16), 'inv_alpha': 255 - alpha}
+
+def blend_layer(frame, layer, clip=None):
+    """Blend a premultiplied layer over the frame in place (dst * (1 - a) + src), limited to clip."""
+    lx0, ly0 = layer['box'][:2]
+    box = _clip_box(layer['box'], clip)
+    if box is None:
+        return
+    x0, y0, x1, y1 = box
+    src = (slice(y0 - ly0, y1 - ly0), slice(x0 - lx0, x1 - lx0))
+    _blend_into(frame[y0:y1, x0:x1], layer['inv_alpha'][src], layer['color'][src])
+
+def blend_coverage(frame, x, y, coverage, color, alpha=255):
+    """Blend a solid colour through a uint8 coverage mask whose top-left corner sits at (x, y)."""
+    h, w = coverage.shape[:2]
+    box = _clip_box((x, y, x + w, y + h))
+    if box is None:
+        return
+    x0, y0, x1, y1 = box
+    cov = coverage[y0 - y:y1 - y, x0 - x:x1 - x]
+    a = _coverage_alpha[:y1 - y0, :x1 - x0]
+    inv = _coverage_inv[:y1 - y0, :x1 - x0]
+    if alpha >= 255:
+        np.copyto(a[:, :, 0], cov)
+    else:
+        np.multiply(cov, alpha, out=a[:, :, 0], dtype=np.uint16)
+        a += 127
+        a //= 255
+    np.subtract(255, a, out=inv)
+    color_term = _blend_carry[:y1 - y0, :x1 - x0]
+    np.multiply(a, np.asarray(color[:3], dtype=np.uint16), out=color_term)
+    _blend_into(frame[y0:y1, x0:x1], inv, color_term)
+
+def blend_rects(frame, rects, color, alpha):
+    """Translucent fill of the union of rects (inclusive corners, as ImageDraw.rectangle takes them);
+    overlapping rectangles are covered once, like drawing them onto one overlay."""
+    if not rects:
+        return
+    ux0, uy0 = min(r[0] for r in rects), min(r[1] for r in rects)
+    ux1, uy1 = max(r[2] for r in rects) + 1, max(r[3] for r in rects) + 1
+    mask = np.zeros((uy1 - uy0, ux1 - ux0), dtype=np.uint8)
+    for x0, y0, x1, y1 in rects:
+        mask[y0 - uy0:y1 - uy0 + 1, x0 - ux0:x1 - ux0 + 1] = 255
+    blend_coverage(frame, ux0, uy0, mask, color, alpha)
+
+def blit_array(frame, x, y, arr, clip=None):
+    """Opaque copy of an RGB(A) array into the frame with its top-left corner at (x, y)."""
+    h, w = arr.shape[:2]
+    box = _clip_box((x, y, x + w, y + h), clip)
+    if box is None:
+        return
+    x0, y0, x1, y1 = box
+    np.copyto(frame[y0:y1, x0:x1], arr[y0 - y:y1 - y, x0 - x:x1 - x, :3])
+
+def text_mask(text, font):
+    """Coverage mask of text cropped to its ink box, with the box offset from the draw position."""
+    bbox = get_cached_text_bbox(text, font)
+    mask = Image.new("L", (max(1, bbox[2] - bbox[0]), max(1, bbox[3] - bbox[1])), 0)
+    ImageDraw.Draw(mask).text((-bbox[0], -bbox[1]), text, fill=255, font=font)
+    return (bbox[0], bbox[1]), np.asarray(mask)
+
+def get_text_sprite(text, font, fill):
+    """Premultiplied sprite of text in one colour, cropped to its ink box and cached by
+    (text, font path, size, colour) until the cache outgrows TEXT_SPRITE_CACHE_BYTES."""
+    global text_sprite_cache_bytes
+    fill = tuple(fill) if isinstance(fill, list) else fill
+    key = (text, getattr(font, "path", None), getattr(font, "size", None), fill)
+    with text_sprite_cache_lock:
+        sprite = text_sprite_cache.get(key)
+        if sprite is not None:
+            text_sprite_cache.move_to_end(key)
+            return sprite
+    offset, mask = text_mask(text, font)
+    color = ImageColor.getrgb(fill) if isinstance(fill, str) else fill
+    alpha = mask[:, :, None]
+    sprite = {'offset': offset, 'color': alpha * np.asarray(color[:3], dtype=np.uint16), 'inv_alpha': 255 - alpha}
+    sprite['nbytes'] = sprite['color'].nbytes + sprite['inv_alpha'].nbytes
+    with text_sprite_cache_lock:
+        if key not in text_sprite_cache:
+            text_sprite_cache[key] = sprite
+            text_sprite_cache_bytes += sprite['nbytes']
+            while text_sprite_cache_bytes > TEXT_SPRITE_CACHE_BYTES and len(text_sprite_cache) > 1:
+                _, old = text_sprite_cache.popitem(last=False)
+                text_sprite_cache_bytes -= old['nbytes']
+    return sprite
+
+def sprite_layer(sprite, position):
+    """Place a text sprite as a compositor layer for text drawn at position."""
+    x, y = int(position[0]) + sprite['offset'][0], int(position[1]) + sprite['offset'][1]
+    h, w = sprite['inv_alpha'].shape[:2]
+    return {'box': (x, y, x + w, y + h), 'color': sprite['color'], 'inv_alpha': sprite['inv_alpha']}
+
+def draw_text_aliased(frame, position, text, font, fill):
+    if not text:
+        return
+    blend_layer(frame, sprite_layer(get_text_sprite(text, font, fill), position))
 
-def draw_weather_image(weather_info):
-    img = Image.new("RGB", (SCREEN_WIDTH, SCREEN_HEIGHT), "black")
+def render_weather_base(frame, weather_info):
+    """Everything on the weather screen except the HH:MM badge: background, panels, text and icon."""
     bg_filename = get_background_path(weather_info)
     if bg_filename:
         bg_path = os.path.join(BG_DIR, bg_filename)
-        bg_img = get_cached_bg(bg_path, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        img.paste(bg_img, (0, 0))
-    draw = ImageDraw.Draw(img)
+        np.copyto(frame, image_array(get_cached_bg(bg_path, (SCREEN_WIDTH, SCREEN_HEIGHT))))
+    else:
+        frame.fill(0)
     if weather_info:
         text_elements = []
         title = f"{weather_info['city']}, {weather_info['country']}"
@@ -1158,38 +1529,19 @@ def draw_weather_image(weather_info):
         text_elements.append((pressure_text, (10, 215), SMALL_FONT, "orange"))
         wind_text = f"Wind: {weather_info['wind_speed']} m/s"
         text_elements.append((wind_text, (10, 240), SMALL_FONT, "orange"))
-        overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
+        panels = []
         for text, position, font, color in text_elements:
             bbox = get_cached_text_bbox(text, font)
             actual_bbox = (position[0] + bbox[0], position[1] + bbox[1], position[0] + bbox[2], position[1] + bbox[3])
-            overlay_draw.rectangle([actual_bbox[0]-5, actual_bbox[1]-5, actual_bbox[2]+5, actual_bbox[3]+5], fill=(0, 0, 0, 200))
-        img = Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB")
-        draw = ImageDraw.Draw(img)
+            panels.append((actual_bbox[0]-5, actual_bbox[1]-5, actual_bbox[2]+5, actual_bbox[3]+5))
+        blend_rects(frame, panels, (0, 0, 0), 200)
         for text, position, font, color in text_elements:
-            draw_text_aliased(draw, img, position, text, font, color)
+            draw_text_aliased(frame, position, text, font, color)
         if "icon_id" in weather_info:
-                try:
-                    icon_url = f"http://openweathermap.org/img/wn/{weather_info['icon_id']}@2x.png"
-                    resp = session.get(icon_url, timeout=5)
-                resp.raise_for_status()
-                icon_img = Image.open(BytesIO(resp.content)).convert("RGBA")
-                icon_img.thumbnail((128, 128), Image.BILINEAR)
-                img.paste(icon_img, (SCREEN_WIDTH - icon_img.size[0], SCREEN_HEIGHT - icon_img.size[1] - 40), icon_img)
-            except Exception:
-                pass
-        if TIME_DISPLAY:
-            now = datetime.datetime.now().strftime("%H:%M")
-            time_bbox = get_cached_text_bbox(now, MEDIUM_FONT)
-            time_width = time_bbox[2] - time_bbox[0]
-            time_height = time_bbox[3] - time_bbox[1]
-            x = SCREEN_WIDTH - time_width - 10
-            y = SCREEN_HEIGHT - time_height - 10
-            overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
-            overlay_draw = ImageDraw.Draw(overlay)
-            overlay_draw.rectangle([x-5, y-5, x + time_width + 5, y + time_height + 5], fill=(0, 0, 0,200))
-            img = Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB")
-            draw_text_aliased(draw, img, (x, y), now, MEDIUM_FONT, "gray")
+            icon_img = get_weather_icon(weather_info['icon_id'], (128, 128))
+            if icon_img is not None:
+                icon_x, icon_y = SCREEN_WIDTH - icon_img.size[0], SCREEN_HEIGHT - icon_img.size[1] - 40
+                blend_layer(frame, make_layer(icon_img, (icon_x, icon_y, icon_x + icon_img.size[0], icon_y + icon_img.size[1])))
     else:
         error_text = "Failed to fetch weather data."
         bbox = get_cached_text_bbox(error_text, MEDIUM_FONT)
@@ -1197,29 +1549,59 @@ def draw_weather_image(weather_info):
         text_height = bbox[3] - bbox[1]
         x = (SCREEN_WIDTH - text_width) // 2
         y = (SCREEN_HEIGHT - text_height) // 2
-        overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
-        overlay_draw.rectangle([x-5, y-5, x + text_width + 5, y + text_height + 5], fill=(0, 0, 0,200))
-        img = Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB")
-        draw = ImageDraw.Draw(img)
-        draw_text_aliased(draw, img, (x, y), error_text, MEDIUM_FONT, "red")
-        if TIME_DISPLAY:
-            now = datetime.datetime.now().strftime("%H:%M")
-            time_bbox = get_cached_text_bbox(now, MEDIUM_FONT)
-            time_width = time_bbox[2] - time_bbox[0]
-            time_height = time_bbox[3] - time_bbox[1]
-            time_x = SCREEN_WIDTH - time_width - 10
-            time_y = SCREEN_HEIGHT - time_height - 10
-            overlay_draw.rectangle([time_x-5, time_y-5, time_x + time_width + 5, time_y + time_height + 5], fill=(0, 0, 0,200))
-            img = Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB")
-            draw = ImageDraw.Draw(img)
-            draw_text_aliased(draw, img, (time_x, time_y), now, MEDIUM_FONT, "gray")
-    return img
+        blend_rects(frame, [(x-5, y-5, x + text_width + 5, y + text_height + 5)], (0, 0, 0), 200)
+        draw_text_aliased(frame, (x, y), error_text, MEDIUM_FONT, "red")
+
+def draw_weather_time_badge(frame, now):
+    """HH:MM in a translucent panel in the bottom-right corner. Returns the rectangle it covers."""
+    time_bbox = get_cached_text_bbox(now, MEDIUM_FONT)
+    time_width = time_bbox[2] - time_bbox[0]
+    time_height = time_bbox[3] - time_bbox[1]
+    x = SCREEN_WIDTH - time_width - 10
+    y = SCREEN_HEIGHT - time_height - 10
+    blend_rects(frame, [(x-5, y-5, x + time_width + 5, y + time_height + 5)], (0, 0, 0), 200)
+    draw_text_aliased(frame, (x, y), now, MEDIUM_FONT, "gray")
+    return (min(x - 5, x + time_bbox[0]), min(y - 5, y + time_bbox[1]),
+            max(x + time_width + 6, x + time_bbox[2]), max(y + time_height + 6, y + time_bbox[3]))
+
+def draw_weather_image(weather_info):
+    """The weather screen is rendered once per weather update (or icon arrival) into a cached base
+    frame; after that only the HH:MM badge is recomposited, once per minute. Unchanged calls leave
+    an empty frame_damage. Like the other compositor screens it returns the frame array itself."""
+    global weather_frame_state, frame_damage
+    frame = get_frame_buffer("weather")
+    icon_ready = bool(weather_info and "icon_id" in weather_info and get_weather_icon(weather_info['icon_id'], (128, 128)) is not None)
+    scene = (tuple(sorted(weather_info.items())) if weather_info else None, get_background_path(weather_info), icon_ready)
+    now = datetime.datetime.now().strftime("%H:%M") if TIME_DISPLAY else None
+    state = weather_frame_state
+    if state and state['scene'] == scene:
+        if state['time'] == now:
+            frame_damage = []
+            return frame
+        damage = []
+        if state['badge'] is not None:
+            x0, y0, x1, y1 = state['badge']
+            x0, y0 = max(0, x0), max(0, y0)
+            frame[y0:y1, x0:x1] = state['base'][y0:y1, x0:x1]
+            damage.append(state['badge'])
+    else:
+        base = state['base'] if state else np.empty_like(frame)
+        render_weather_base(base, weather_info)
+        np.copyto(frame, base)
+        state = {'scene': scene, 'base': base}
+        damage = None
+    badge = draw_weather_time_badge(frame, now) if now else None
+    if damage is not None and badge is not None:
+        damage = merge_damage_rects(damage + [badge])
+    weather_frame_state = dict(state, time=now, badge=badge)
+    frame_damage = damage
+    return frame
 
 def update_spotify_layout(track_data):
     global spotify_layout_cache
     if not track_data:
         spotify_layout_cache = None
+        invalidate_spotify_layers('panel')
         return
     fields = [("title", "Track  :", track_data.get("title", "")), ("artists", "Artists:", track_data.get("artists", "")), ("album", "Album:", track_data.get("album", ""))]
     layout = []
@@ -1239,6 +1621,7 @@ def update_spotify_layout(track_data):
         layout.append({'key': key, 'label': label, 'data': data, 'y': y, 'field_height': field_height, 'label_width': label_width, 'text_width': text_width, 'left_boundary': left_boundary, 'visible_width': visible_width, 'needs_scroll': text_width > visible_width})
         y += field_height
     spotify_layout_cache = layout
+    invalidate_spotify_layers('panel')
 
 def create_scrolling_text_image(text, font, color, total_width):
     img = Image.new("RGBA", (total_width, font.size + 10), (0,0,0,0))
@@ -1247,110 +1630,113 @@ def create_scrolling_text_image(text, font, color, total_width):
     draw.text((total_width // 2, 5), text, font=font, fill=color)
     return img
 
-def draw_spotify_image(spotify_track):
-    global album_art_image, artist_image, artist_on_top
-    if display_sleeping:
-        return Image.new("RGB", (SCREEN_WIDTH, SCREEN_HEIGHT), "black")
-        with art_lock:
-            art_img = album_art_image
-    bg_to_use = None
-    with spotify_bg_cache_lock:
-        if spotify_bg_cache is not None and art_img is not None and current_album_art_hash is not None:
-            bg_to_use = spotify_bg_cache.copy()
-    if bg_to_use is None:
-        bg_to_use = get_cached_background((SCREEN_WIDTH, SCREEN_HEIGHT), art_img, album_art_hash=current_album_art_hash)
-    img = bg_to_use
-    if spotify_track and 'main_color' in spotify_track and 'secondary_color' in spotify_track:
-        main_color = spotify_track['main_color']
-        secondary_color = spotify_track['secondary_color']
-    else:
-        if album_art_image:
-            main_color, secondary_color = get_contrasting_colors(album_art_image)
-        else:
-            main_color, secondary_color = (0, 255, 0), (0, 255, 255)
-    album_img_to_draw = None
-    artist_img_to_draw = None
-    album_pos = None
-    artist_pos_to_draw = None
-    if art_img:
-        int_pos = (int(art_pos[0]), int(art_pos[1]))
-        if art_img.mode != "RGB":
-            bg = Image.new("RGB", art_img.size, "black")
-            if art_img.mode in ("RGBA", "LA"):
-                bg.paste(art_img, mask=art_img.split()[-1])
-            else:
-                bg.paste(art_img)
-            album_img_to_draw = get_cached_resized_image(bg, bg.size, 'RGB')
-        else:
-            album_img_to_draw = get_cached_resized_image(art_img, art_img.size, 'RGB')
-        album_pos = int_pos
-    with artist_image_lock:
-        art_img_artist = artist_image
-    if art_img_artist:
-        int_artist_pos = (int(artist_pos[0]), int(artist_pos[1]))
-        if art_img_artist.mode != "RGB":
-            bg = Image.new("RGB", art_img_artist.size, "black")
-            if art_img_artist.mode in ("RGBA", "LA"):
-                bg.paste(art_img_artist, mask=art_img_artist.split()[-1])
+def _rect_area(box):
+    return (box[2] - box[0]) * (box[3] - box[1])
+
+def merge_damage_rects(rects, size=(SCREEN_WIDTH, SCREEN_HEIGHT), full_ratio=0.6):
+    """Clip and coalesce damage rectangles (x0, y0, x1, y1).
+    Returns None when the damaged area is large enough that a full redraw is cheaper."""
+    width, height = size
+    merged = []
+    for x0, y0, x1, y1 in rects:
+        box = [max(0, int(x0)), max(0, int(y0)), min(width, int(math.ceil(x1))), min(height, int(math.ceil(y1)))]
+        if box[0] >= box[2] or box[1] >= box[3]:
+            continue
+        i = 0
+        while i < len(merged):
+            other = merged[i]
+            union = [min(box[0], other[0]), min(box[1], other[1]), max(box[2], other[2]), max(box[3], other[3])]
+            # Overlapping boxes are merged only when their union does not drag in much undamaged area
+            if (box[0] <= other[2] and other[0] <= box[2] and box[1] <= other[3] and other[1] <= box[3]
+                    and _rect_area(union) <= _rect_area(box) + _rect_area(other)):
+                box = union
+                merged.pop(i)
+                i = 0
             else:
-                bg.paste(art_img_artist)
-            artist_img_to_draw = get_cached_resized_image(bg, bg.size, 'RGB')
+                i += 1
+        merged.append(box)
+    if sum(_rect_area(b) for b in merged) > width * height * full_ratio:
+        return None
+    return [tuple(b) for b in merged]
+
+def _shift(coords, origin):
+    return [c - origin[i % 2] for i, c in enumerate(coords)]
+
+def _spotify_sprite(img):
+    if img is None:
+        return None
+    if img.mode != "RGB":
+        flat = Image.new("RGB", img.size, "black")
+        if img.mode in ("RGBA", "LA"):
+            flat.paste(img, mask=img.split()[-1])
         else:
-            artist_img_to_draw = get_cached_resized_image(art_img_artist, art_img_artist.size, 'RGB')
-        artist_pos_to_draw = int_artist_pos
-    if artist_on_top:
-        if album_img_to_draw and album_pos: img.paste(album_img_to_draw, album_pos)
-        if artist_img_to_draw and artist_pos_to_draw: img.paste(artist_img_to_draw, artist_pos_to_draw)
+            flat.paste(img)
+        img = flat
+    return np.asarray(img, dtype=np.uint8)
+
+def _spotify_hud_strip_top():
+    """Top edge of the bottom strip holding the progress bar and the time badges."""
+    ascent, descent = SPOT_LARGE_FONT.getmetrics()
+    time_y_offset = 13 if PROGRESSBAR_DISPLAY else 0
+    return max(0, SCREEN_HEIGHT - time_y_offset - (ascent + descent) - 12)
+
+def invalidate_spotify_layers(*names):
+    """Drop cached Spotify layers so they are rebuilt on the next frame (all layers when no names are given)."""
+    for name in names or list(spotify_layers):
+        spotify_layers.pop(name, None)
+
+def _refresh_spotify_layer(name, sources, values, build):
+    """Return (layer, rebuilt). A layer is rebuilt when invalidated, when one of its source objects is
+    replaced or when one of its plain values changes. Holding the sources keeps identity checks sound."""
+    layer = spotify_layers.get(name)
+    if (layer is not None and len(layer['sources']) == len(sources)
+            and all(a is b for a, b in zip(layer['sources'], sources)) and layer['values'] == values):
+        return layer, False
+    layer = build()
+    layer['sources'], layer['values'] = sources, values
+    spotify_layers[name] = layer
+    return layer, True
+
+def build_spotify_panel_layer(layout, colors):
+    """Static text layer: translucent panels, labels, non-scrolling text and the scroll band backgrounds."""
+    main_color, secondary_color = colors
+    if layout:
+        bottom = max(item['y'] + item['field_height'] for item in layout) + 1
     else:
-        if artist_img_to_draw and artist_pos_to_draw: img.paste(artist_img_to_draw, artist_pos_to_draw)
-        if album_img_to_draw and album_pos: img.paste(album_img_to_draw, album_pos)
-    overlay = Image.new("RGBA", (SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 0))
+        bottom = get_cached_text_bbox("No track playing", MEDIUM_FONT)[3] + 10
+    overlay = Image.new("RGBA", (SCREEN_WIDTH, bottom), (0, 0, 0, 0))
     draw = ImageDraw.Draw(overlay)
-    layout = spotify_layout_cache
     if layout:
         for item in layout:
             bg_width = min(item['label_width'] + 6 + item['text_width'] + 6, SCREEN_WIDTH - 5 - 5)
             draw.rectangle([5, item['y'], 5 + bg_width, item['y'] + item['field_height']], fill=(0,0,0,200))
             draw.text((5, item['y'] + 4), item['label'], fill=secondary_color, font=SPOT_MEDIUM_FONT)
-            if item['needs_scroll']:
-                scrolling_img = scrolling_text_cache.get(item['key'])
-                if scrolling_img:
-                    offset = scroll_state[item['key']]["offset"]
-                    crop_x = offset % (item['text_width'] + 50)
-                    cropped = scrolling_img.crop((crop_x, 0, crop_x + item['visible_width'], item['field_height']))
-                    draw.rectangle([item['left_boundary'], item['y'], item['left_boundary'] + item['visible_width'], item['y'] + item['field_height']], fill=(0,0,0,200))
-                    overlay.paste(cropped, (item['left_boundary'], item['y']), cropped)
-                else:
-                    draw.text((item['left_boundary'], item['y'] + 4), item['data'], fill=main_color, font=SPOT_MEDIUM_FONT)
+            if item['needs_scroll'] and scrolling_text_cache.get(item['key']):
+                draw.rectangle([item['left_boundary'], item['y'], item['left_boundary'] + item['visible_width'], item['y'] + item['field_height']], fill=(0,0,0,200))
             else:
                 draw.text((item['left_boundary'], item['y'] + 4), item['data'], fill=main_color, font=SPOT_MEDIUM_FONT)
     else:
-        img = Image.new("RGB", (SCREEN_WIDTH, SCREEN_HEIGHT), "black")
-        if os.path.exists(os.path.join(BG_DIR, "no_track.png")):
-            bg_path = os.path.join(BG_DIR, "no_track.png")
-            bg_img = get_cached_bg(bg_path, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            img.paste(bg_img, (0, 0))
         error_text = "No track playing"
         bbox = get_cached_text_bbox(error_text, MEDIUM_FONT)
         draw.rectangle([5, 5, min(bbox[2]+11, SCREEN_WIDTH-5), bbox[3]+9], fill=(0,0,0,200))
         draw.text((11, 9), error_text, fill="red", font=MEDIUM_FONT)
+    return make_layer(overlay, (0, 0, SCREEN_WIDTH, bottom))
+
+def build_spotify_hud_layer(spotify_track, colors, clock):
+    """Dynamic HUD strip: progress bar, position/duration badge and the wall clock badge."""
+    main_color, secondary_color = colors
+    top = _spotify_hud_strip_top()
+    overlay = Image.new("RGBA", (SCREEN_WIDTH, SCREEN_HEIGHT - top), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    origin = (0, top)
+    time_y_offset = 0
     if PROGRESSBAR_DISPLAY:
         progress_bar_height = 10
         border_width = 2
         progress_bar_y = SCREEN_HEIGHT - progress_bar_height
         time_y_offset = progress_bar_height + border_width + 1
-        draw.rectangle([
-            0, 
-            progress_bar_y - border_width, 
-            SCREEN_WIDTH, 
-            SCREEN_HEIGHT
-        ], fill=(*secondary_color, 150))
-        draw.rectangle([
-            border_width, 
-            progress_bar_y, 
-            SCREEN_WIDTH - border_width, 
-            SCREEN_HEIGHT
-        ], fill=(0, 0, 0, 200))
+        draw.rectangle(_shift([0, progress_bar_y - border_width, SCREEN_WIDTH, SCREEN_HEIGHT], origin), fill=(*secondary_color, 150))
+        draw.rectangle(_shift([border_width, progress_bar_y, SCREEN_WIDTH - border_width, SCREEN_HEIGHT], origin), fill=(0, 0, 0, 200))
         if spotify_track and 'current_position' in spotify_track and 'duration' in spotify_track:
             current_pos = spotify_track['current_position']
             duration = spotify_track['duration']
@@ -1359,101 +1745,156 @@ def draw_spotify_image(spotify_track):
             else:
                 progress_percent = 0
             progress_width = int((SCREEN_WIDTH - 2 * border_width) * progress_percent)
-            draw.rectangle([
-                border_width, 
-                progress_bar_y, 
-                border_width + progress_width, 
-                SCREEN_HEIGHT
-            ], fill=(*main_color, 180))
-            current_min = current_pos // 60
-            current_sec = current_pos % 60
-            duration_min = duration // 60
-            duration_sec = duration % 60
-            time_text = f"{current_min}:{current_sec:02d} / {duration_min}:{duration_sec:02d}"
-            time_bbox = SPOT_LARGE_FONT.getbbox(time_text)
-            time_width = time_bbox[2] - time_bbox[0]
-            time_height = time_bbox[3] - time_bbox[1]
+            draw.rectangle(_shift([border_width, progress_bar_y, border_width + progress_width, SCREEN_HEIGHT], origin), fill=(*main_color, 180))
+            time_text = f"{current_pos // 60}:{current_pos % 60:02d} / {duration // 60}:{duration % 60:02d}"
+            time_bbox = get_cached_text_bbox(time_text, SPOT_LARGE_FONT)
             padding = 5
-            background_width = time_width + 2 * padding
-            background_height = time_height + 2 * padding
+            background_width = time_bbox[2] - time_bbox[0] + 2 * padding
+            background_height = time_bbox[3] - time_bbox[1] + 2 * padding
             time_x = 5
             time_y = SCREEN_HEIGHT - background_height - time_y_offset
-            draw.rectangle([time_x, time_y, time_x + background_width, time_y + background_height], fill=(0, 0, 0, 200))
-            text_x = time_x + padding
-            text_y = time_y + padding - time_bbox[1]
-            draw.text((text_x, text_y), time_text, fill=secondary_color, font=SPOT_LARGE_FONT)
-    else:
-        progress_bar_height = 0
-        time_y_offset = 0
-        if spotify_track and 'current_position' in spotify_track and 'duration' in spotify_track:
-            current_pos = spotify_track['current_position']
-            duration = spotify_track['duration']
+            draw.rectangle(_shift([time_x, time_y, time_x + background_width, time_y + background_height], origin), fill=(0, 0, 0, 200))
+            draw.text(_shift((time_x + padding, time_y + padding - time_bbox[1]), origin), time_text, fill=secondary_color, font=SPOT_LARGE_FONT)
     if TIME_DISPLAY:
-        now = datetime.datetime.now().strftime("%H:%M")
-        time_bbox = SPOT_LARGE_FONT.getbbox(now)
-        time_width = time_bbox[2] - time_bbox[0]
-        time_height = time_bbox[3] - time_bbox[1]
+        time_bbox = get_cached_text_bbox(clock, SPOT_LARGE_FONT)
         padding = 5
-        background_width = time_width + 2 * padding
-        background_height = time_height + 2 * padding
+        background_width = time_bbox[2] - time_bbox[0] + 2 * padding
+        background_height = time_bbox[3] - time_bbox[1] + 2 * padding
         time_x = SCREEN_WIDTH - background_width - 5
         time_y = SCREEN_HEIGHT - background_height - time_y_offset
-        draw.rectangle([time_x, time_y, time_x + background_width, time_y + background_height], fill=(0, 0, 0, 170))
-        text_x = time_x + padding
-        text_y = time_y + padding - time_bbox[1]
-        draw.text((text_x, text_y), now, fill=main_color, font=SPOT_LARGE_FONT)
-    img = Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB")
-    return img
+        draw.rectangle(_shift([time_x, time_y, time_x + background_width, time_y + background_height], origin), fill=(0, 0, 0, 170))
+        draw.text(_shift((time_x + padding, time_y + padding - time_bbox[1]), origin), clock, fill=main_color, font=SPOT_LARGE_FONT)
+    return make_layer(overlay, (0, top, SCREEN_WIDTH, SCREEN_HEIGHT))
+
+def _spotify_scroll_layers(layout, scrolling, scroll):
+    """Per-frame layers for the scrolling fields: views into the premultiplied scrolling text strips."""
+    layers = []
+    for item in layout or []:
+        strip = scrolling.get(item['key']) if item['needs_scroll'] else None
+        if strip is None:
+            continue
+        crop_x = scroll.get(item['key'], 0) % (item['text_width'] + 50)
+        crop = (slice(0, item['field_height']), slice(crop_x, crop_x + item['visible_width']))
+        color, inv_alpha = strip['color'][crop], strip['inv_alpha'][crop]
+        x, y = item['left_boundary'], item['y']
+        layers.append({'box': (x, y, x + color.shape[1], y + color.shape[0]), 'color': color, 'inv_alpha': inv_alpha})
+    return layers
+
+def compose_spotify_region(stack, state, frame, box):
+    """Recomposite one rectangle of the Spotify frame in place from the layer stack:
+    background, sprites, static panel, scrolling text, then the HUD strip."""
+    x0, y0, x1, y1 = box
+    np.copyto(frame[y0:y1, x0:x1], stack['background']['array'][y0:y1, x0:x1])
+    sprites = [(stack['sprites']['album'], state['album_rect']), (stack['sprites']['artist'], state['artist_rect'])]
+    if not state['artist_on_top']:
+        sprites.reverse()
+    for sprite, rect in sprites:
+        if sprite is not None and rect is not None:
+            blit_array(frame, rect[0], rect[1], sprite, clip=box)
+    for layer in [stack['panel']] + state['scroll_layers'] + [stack['hud']]:
+        blend_layer(frame, layer, clip=box)
+
+def _spotify_damage(previous, frame, hud_rebuilt):
+    """Rectangles whose content differs between the previously composed frame and this one."""
+    rects = []
+    on_top_changed = previous['artist_on_top'] != frame['artist_on_top']
+    for key in ('album_rect', 'artist_rect'):
+        if previous[key] != frame[key] or on_top_changed:
+            rects.extend(r for r in (previous[key], frame[key]) if r)
+    previous_scroll = {layer['box']: layer for layer in previous['scroll_layers']}
+    for key, layer in zip(frame['scroll_keys'], frame['scroll_layers']):
+        if previous['scroll'].get(key) != frame['scroll'].get(key) or layer['box'] not in previous_scroll:
+            rects.append(layer['box'])
+    if hud_rebuilt:
+        rects.append((0, min(previous['hud_top'], frame['hud_top']), SCREEN_WIDTH, SCREEN_HEIGHT))
+    return merge_damage_rects(rects)
 
-def draw_clock_image():
-    global weather_info, clock_bg_image
-    img = Image.new("RGB", (SCREEN_WIDTH, SCREEN_HEIGHT), "black")
-    avg_color = (128, 128, 128)
-    bg_applied = False
-    if CLOCK_BACKGROUND == "album":
-        with clock_bg_lock:
-            bg_to_use = clock_bg_image
-        if bg_to_use is not None:
-            img.paste(bg_to_use, (0, 0))
-            stat = ImageStat.Stat(bg_to_use)
-            avg_color = tuple(int(v) for v in stat.mean[:3])
-            bg_applied = True
+def draw_spotify_image(spotify_track):
+    """Render the Spotify screen into its persistent compositor frame from a retained layer stack.
+    Background, sprites, the static text panel and the HUD strip are cached in spotify_layers and
+    rebuilt only when their inputs change; between rebuilds only the damaged rectangles (moved
+    sprites, scrolling text bands, a new HUD strip) are recomposited. The rectangles are left in
+    frame_damage (None for a full frame) for the display backend."""
+    global spotify_frame_state, frame_damage
+    if display_sleeping:
+        return Image.new("RGB", (SCREEN_WIDTH, SCREEN_HEIGHT), "black")
+    with art_lock:
+        art_img = album_art_image
+    with artist_image_lock:
+        art_img_artist = artist_image
+    layout = spotify_layout_cache
+    if not layout:
+        art_img = art_img_artist = None
+    with spotify_bg_cache_lock:
+        cached_bg = spotify_bg_cache if art_img is not None and current_album_art_hash is not None else None
+
+    def build_background():
+        if not layout:
+            bg = get_procedural_background('solid', (SCREEN_WIDTH, SCREEN_HEIGHT)).copy()
+            if os.path.exists(os.path.join(BG_DIR, "no_track.png")):
+                bg.paste(get_cached_bg(os.path.join(BG_DIR, "no_track.png"), (SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
+        elif cached_bg is not None:
+            bg = cached_bg
         else:
-            try:
-                if CLOCK_COLOR:
-                    bg_color = ImageColor.getrgb(CLOCK_COLOR)
-                else:
-                    bg_color = (0, 0, 0)
-                img.paste(Image.new("RGB", (SCREEN_WIDTH, SCREEN_HEIGHT), bg_color))
-                avg_color = bg_color
-                bg_applied = True
-            except Exception:
-                img.paste(Image.new("RGB", (SCREEN_WIDTH, SCREEN_HEIGHT), "black"))
-                avg_color = (0, 0, 0)
-                bg_applied = True
-    elif CLOCK_BACKGROUND == "weather":
-        bg_filename = get_background_path(weather_info)
-        if bg_filename:
-            bg_path = os.path.join(BG_DIR, bg_filename)
-            if os.path.exists(bg_path):
-                bg_img = get_cached_bg(bg_path, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                img.paste(bg_img, (0, 0))
-                stat = ImageStat.Stat(bg_img)
-                avg_color = tuple(int(v) for v in stat.mean[:3])
-                bg_applied = True
-    if not bg_applied:
-        try:
-            if CLOCK_COLOR:
-                bg_color = ImageColor.getrgb(CLOCK_COLOR)
-            else:
-                hue_shift = (datetime.datetime.now().second / 60.0) % 1.0
-                rr, gg, bb = colorsys.hsv_to_rgb(hue_shift, 0.5, 0.2)
-                bg_color = (int(rr * 255), int(gg * 255), int(bb * 255))
-            img.paste(Image.new("RGB", (SCREEN_WIDTH, SCREEN_HEIGHT), bg_color))
-            avg_color = bg_color
-        except Exception:
-            img.paste(Image.new("RGB", (SCREEN_WIDTH, SCREEN_HEIGHT), "black"))
-            avg_color = (0, 0, 0)
+            bg = get_cached_background((SCREEN_WIDTH, SCREEN_HEIGHT), art_img)
+        if bg.size != (SCREEN_WIDTH, SCREEN_HEIGHT):
+            bg = bg.resize((SCREEN_WIDTH, SCREEN_HEIGHT), Image.BILINEAR)
+        return {'image': bg, 'array': np.asarray(bg if bg.mode == "RGB" else bg.convert("RGB"))}
+
+    if spotify_track and 'main_color' in spotify_track and 'secondary_color' in spotify_track:
+        colors = (tuple(spotify_track['main_color']), tuple(spotify_track['secondary_color']))
+    else:
+        colors = _refresh_spotify_layer('colors', (art_img,), (), lambda: {'colors': tuple(get_contrasting_colors(art_img)) if art_img else ((0, 255, 0), (0, 255, 255))})[0]['colors']
+    # Layers are read through this local stack so a concurrent invalidation cannot pull one out mid-frame
+    stack = {}
+    rebuilt = set()
+    layers = [
+        ('background', (cached_bg, art_img), (current_album_art_hash, bool(layout)), build_background),
+        ('sprites', (art_img, art_img_artist), (), lambda: {'album': _spotify_sprite(art_img), 'artist': _spotify_sprite(art_img_artist)}),
+        # The panel leaves a blank band where a scroll strip exists, so it is keyed on which ones do
+        ('panel', (layout,), (colors, frozenset(scrolling_text_cache)), lambda: build_spotify_panel_layer(layout, colors)),
+        ('scrolling', tuple(scrolling_text_cache.values()), tuple(scrolling_text_cache),
+         lambda: {'strips': {key: make_layer(img, (0, 0) + img.size) for key, img in scrolling_text_cache.items()}}),
+    ]
+    now = datetime.datetime.now().strftime("%H:%M") if TIME_DISPLAY else None
+    progress = (spotify_track.get('current_position'), spotify_track.get('duration')) if spotify_track else None
+    layers.append(('hud', (), (progress, now, colors, PROGRESSBAR_DISPLAY, TIME_DISPLAY), lambda: build_spotify_hud_layer(spotify_track, colors, now)))
+    for name, sources, values, build in layers:
+        stack[name], changed = _refresh_spotify_layer(name, sources, values, build)
+        if changed:
+            rebuilt.add(name)
+
+    sprites = stack['sprites']
+    album_rect = artist_rect = None
+    if sprites['album'] is not None:
+        x, y = int(art_pos[0]), int(art_pos[1])
+        album_rect = (x, y, x + sprites['album'].shape[1], y + sprites['album'].shape[0])
+    if sprites['artist'] is not None:
+        x, y = int(artist_pos[0]), int(artist_pos[1])
+        artist_rect = (x, y, x + sprites['artist'].shape[1], y + sprites['artist'].shape[0])
+    with scroll_lock:
+        scroll = {item['key']: scroll_state[item['key']]["offset"] for item in layout or [] if item['needs_scroll']}
+    strips = stack['scrolling']['strips']
+    state = {'album_rect': album_rect, 'artist_rect': artist_rect, 'artist_on_top': artist_on_top, 'scroll': scroll,
+             'scroll_keys': [item['key'] for item in layout or [] if item['needs_scroll'] and item['key'] in strips],
+             'scroll_layers': _spotify_scroll_layers(layout, strips, scroll), 'hud_top': stack['hud']['box'][1]}
+    frame = get_frame_buffer("spotify")
+    if not spotify_frame_state or rebuilt & {'background', 'sprites', 'panel', 'scrolling'}:
+        damage = None
+    else:
+        damage = _spotify_damage(spotify_frame_state, state, 'hud' in rebuilt)
+    for box in damage if damage is not None else [(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)]:
+        compose_spotify_region(stack, state, frame, box)
+    spotify_frame_state = state
+    frame_damage = damage
+    return frame
+
+def clock_palette(avg_color):
+    """Five contrasting colours for the clock derived from the background's average colour (memoized)."""
+    avg_color = tuple(int(v) for v in avg_color[:3])
+    palette = clock_palette_cache.get(avg_color)
+    if palette is not None:
+        return palette
     r, g, b = [x / 255.0 for x in avg_color]
     h, s, v = colorsys.rgb_to_hsv(r, g, b)
     base_hue = (h + 0.5) % 1.0
@@ -1468,39 +1909,126 @@ def draw_clock_image():
         gg = min(max(gg + (128 - avg_color[1]) // 2, 0), 255)
         bb = min(max(bb + (128 - avg_color[2]) // 2, 0), 255)
         palette.append((rr, gg, bb))
+    if len(clock_palette_cache) > 64:
+        clock_palette_cache.clear()
+    clock_palette_cache[avg_color] = palette = tuple(palette)
+    return palette
+
+def get_clock_atlas(font, fill):
+    """Pre-rasterised digit and colon sprites for one font and colour, with tabular advances so
+    every digit occupies the same cell and the clock never shifts sideways."""
+    key = (getattr(font, "path", None), getattr(font, "size", None), fill)
+    atlas = clock_digit_atlas.get(key)
+    if atlas is not None:
+        clock_digit_atlas.move_to_end(key)
+        return atlas
+    digit_advance = max(font.getlength(d) for d in "0123456789")
+    atlas = {'glyphs': {ch: get_text_sprite(ch, font, fill) for ch in "0123456789:"},
+             'advance': dict({d: digit_advance for d in "0123456789"}, **{':': font.getlength(":")})}
+    clock_digit_atlas[key] = atlas
+    if len(clock_digit_atlas) > CLOCK_ATLAS_MAX:
+        clock_digit_atlas.popitem(last=False)
+    return atlas
+
+def clock_glyph_layers(time_str, atlas, center_x, y):
+    """One layer per character of time_str laid out on the atlas' fixed cells, centred on center_x."""
+    width = sum(atlas['advance'][ch] for ch in time_str)
+    x = center_x - width / 2
+    layers = []
+    for ch in time_str:
+        layers.append((ch, sprite_layer(atlas['glyphs'][ch], (round(x), y))))
+        x += atlas['advance'][ch]
+    return layers
+
+def compose_clock_region(frame, background, bg_color, ops, box):
+    """Recomposite one rectangle of the clock frame: background, then blits and text layers."""
+    if background is not None:
+        blit_array(frame, 0, 0, image_array(background), clip=box)
+    else:
+        frame[box[1]:box[3], box[0]:box[2]] = bg_color
+    for op in ops:
+        if op[0] == 'blit':
+            blit_array(frame, op[1], op[2], op[3], clip=box)
+        else:
+            blend_layer(frame, op[1], clip=box)
+
+def clock_background():
+    """(background image or None, solid colour, five-colour palette) for the configured clock
+    background, cached per background source so its stats and palette are derived once rather than
+    every second."""
+    background = None
+    if CLOCK_BACKGROUND == "album":
+        with clock_bg_lock:
+            background = clock_bg_image
+    elif CLOCK_BACKGROUND == "weather":
+        bg_filename = get_background_path(weather_info)
+        bg_path = os.path.join(BG_DIR, bg_filename) if bg_filename else None
+        if bg_path and os.path.exists(bg_path):
+            background = get_cached_bg(bg_path, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    if background is not None:
+        source = ('image', id(background))
+    elif CLOCK_COLOR or CLOCK_BACKGROUND == "album":
+        source = ('color', CLOCK_COLOR)
+    else:
+        # No colour configured: a dim hue that cycles once a minute
+        source = ('hue', datetime.datetime.now().second)
+    cached = clock_scene_cache.get('background')
+    if cached and cached[0] == source and cached[1] is background:
+        return cached[1:]
+    bg_color = (0, 0, 0)
+    if background is not None:
+        avg_color = get_art_palette(background)['mean']
+    elif source[0] == 'hue':
+        rr, gg, bb = colorsys.hsv_to_rgb(source[1] / 60.0, 0.5, 0.2)
+        bg_color = avg_color = (int(rr * 255), int(gg * 255), int(bb * 255))
+    else:
+        try:
+            bg_color = ImageColor.getrgb(CLOCK_COLOR)[:3]
+        except Exception:
+            pass
+        avg_color = bg_color
+    clock_scene_cache['background'] = cached = (source, background, bg_color, clock_palette(avg_color))
+    return cached[1:]
+
+def get_display_ip():
+    """get_local_ip(), re-checked at most every LOCAL_IP_REFRESH seconds."""
+    checked, ip = clock_scene_cache.get('ip', (None, None))
+    if checked is None or time.monotonic() - checked >= LOCAL_IP_REFRESH:
+        ip = get_local_ip()
+        clock_scene_cache['ip'] = (time.monotonic(), ip)
+    return ip
+
+def get_wyze_thumbnail(path=os.path.join('static', 'wyze_last.jpg')):
+    """(mtime, 60x60 RGB array) of the latest Wyze snapshot, decoded again only when the file's
+    mtime changes; (None, None) if there is no snapshot."""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None, None
+    cached = clock_scene_cache.get('wyze')
+    if cached and cached[0] == mtime:
+        return cached
+    try:
+        thumb = np.asarray(Image.open(path).convert('RGB').resize((60, 60), Image.BILINEAR))
+    except Exception:
+        thumb = None
+    clock_scene_cache['wyze'] = cached = (mtime, thumb)
+    return cached
+
+def draw_clock_image():
+    """Digital clock on a persistent frame. Background, date, IP, notification and Wyze thumbnail
+    form the scene; while the scene is unchanged only the glyph cells of characters that changed
+    since the last frame are recomposited, and those rectangles are left in frame_damage."""
+    global weather_info, clock_bg_image, clock_frame_state, frame_damage
+    frame = get_frame_buffer("clock")
+    background, bg_color, palette = clock_background()
     face_color, notch_color, hour_color, minute_color, second_color = palette
-    draw = ImageDraw.Draw(img)
     now = datetime.datetime.now()
     # Always draw a digital clock (we removed analog support in favor of digital-only)
     time_str = now.strftime("%H:%M:%S")
     date_str = now.strftime("%A, %B %d, %Y")
-    overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
-    time_bbox = get_cached_text_bbox(time_str, LARGE_FONT)
-    time_width = time_bbox[2] - time_bbox[0]
-    time_height = time_bbox[3] - time_bbox[1]
-    time_x = (SCREEN_WIDTH - time_width) // 2
-    time_y = (SCREEN_HEIGHT - time_height) // 2 - 30
-    date_bbox = get_cached_text_bbox(date_str, MEDIUM_FONT)
-    date_width = date_bbox[2] - date_bbox[0]
-    date_x = (SCREEN_WIDTH - date_width) // 2
-    date_y = time_y + time_height + 20
-    img = Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB")
-    draw = ImageDraw.Draw(img)
-    draw_text_aliased(draw, img, (time_x, time_y), time_str, LARGE_FONT, face_color)
-    draw_text_aliased(draw, img, (date_x, date_y), date_str, MEDIUM_FONT, notch_color)
-    # Optionally show the device IP in small font
-    try:
-        cfg = config
-        if cfg.get('display_ip_on_main', False):
-            ip = get_local_ip()
-            small_font = ImageFont.truetype(config['fonts']['small_font_path'], config['fonts']['small_font_size'])
-            ip_bbox = get_cached_text_bbox(ip, small_font)
-            ip_x = 5
-            ip_y = SCREEN_HEIGHT - 20
-            draw_text_aliased(draw, img, (ip_x, ip_y), ip, small_font, (220, 220, 220))
-    except Exception:
-        pass
-    # Show latest notification if available
+    ip = get_display_ip() if config.get('display_ip_on_main', False) else None
+    notif_text = None
     try:
         notifs = globals().get('notifications', [])
         if notifs:
@@ -1509,24 +2037,58 @@ def draw_clock_image():
             message = last_notif.get('message') or payload.get('message') or payload.get('event') or payload.get('state') or payload.get('title') or str(payload.get('message', ''))
             if message:
                 notif_text = f"{last_notif.get('source', '')}: {message}" if last_notif.get('source') else message
-                notif_font = ImageFont.truetype(config['fonts']['small_font_path'], max(12, int(config['fonts']['small_font_size']*0.9)))
-                notif_bbox = get_cached_text_bbox(notif_text, notif_font)
-                notif_width = notif_bbox[2] - notif_bbox[0]
-                notif_x = SCREEN_WIDTH - notif_width - 8
-                notif_y = 8
-                draw_text_aliased(draw, img, (notif_x, notif_y), notif_text, notif_font, (255, 255, 255))
     except Exception:
         pass
-    # Show a small Wyze snapshot if available
-    try:
-        wyze_path = os.path.join('static', 'wyze_last.jpg')
-        if os.path.exists(wyze_path):
-            wyze_img = Image.open(wyze_path).convert('RGB')
-            wyze_thumb = get_cached_resized_image(wyze_img, (60, 60), 'RGB')
-            img.paste(wyze_thumb, (SCREEN_WIDTH - 70, SCREEN_HEIGHT - 70))
-    except Exception:
-        pass
-    return img
+    wyze_mtime, wyze_thumb = get_wyze_thumbnail()
+    scene = (bg_color, face_color, notch_color, date_str, ip, notif_text, wyze_mtime)
+    atlas = get_clock_atlas(LARGE_FONT, face_color)
+    template_bbox = get_cached_text_bbox("00:00:00", LARGE_FONT)
+    time_height = template_bbox[3] - template_bbox[1]
+    time_y = (SCREEN_HEIGHT - time_height) // 2 - 30
+    glyphs = clock_glyph_layers(time_str, atlas, SCREEN_WIDTH // 2, time_y)
+    state = clock_frame_state
+    if state and state['background'] is background and state['scene'] == scene and len(state['glyphs']) == len(glyphs):
+        ops = state['ops'] + [('layer', layer) for ch, layer in glyphs]
+        rects = []
+        for (old_ch, old_layer), (ch, layer) in zip(state['glyphs'], glyphs):
+            if old_ch != ch:
+                old_box, box = old_layer['box'], layer['box']
+                rects.append((min(old_box[0], box[0]), min(old_box[1], box[1]), max(old_box[2], box[2]), max(old_box[3], box[3])))
+        damage = merge_damage_rects(rects)
+    else:
+        ops = []
+        date_bbox = get_cached_text_bbox(date_str, MEDIUM_FONT)
+        date_x = (SCREEN_WIDTH - (date_bbox[2] - date_bbox[0])) // 2
+        date_y = time_y + time_height + 20
+        ops.append(('layer', sprite_layer(get_text_sprite(date_str, MEDIUM_FONT, notch_color), (date_x, date_y))))
+        # Optionally show the device IP in small font
+        try:
+            if ip:
+                small_font = get_font(config['fonts']['small_font_path'], config['fonts']['small_font_size'])
+                ops.append(('layer', sprite_layer(get_text_sprite(ip, small_font, (220, 220, 220)), (5, SCREEN_HEIGHT - 20))))
+        except Exception:
+            pass
+        # Show latest notification if available
+        try:
+            if notif_text:
+                notif_font = get_font(config['fonts']['small_font_path'], max(12, int(config['fonts']['small_font_size']*0.9)))
+                notif_bbox = get_cached_text_bbox(notif_text, notif_font)
+                notif_x = SCREEN_WIDTH - (notif_bbox[2] - notif_bbox[0]) - 8
+                ops.append(('layer', sprite_layer(get_text_sprite(notif_text, notif_font, (255, 255, 255)), (notif_x, 8))))
+        except Exception:
+            pass
+        # Show a small Wyze snapshot if available
+        if wyze_thumb is not None:
+            ops.append(('blit', SCREEN_WIDTH - 70, SCREEN_HEIGHT - 70, wyze_thumb))
+        # Scene ops are kept without the glyphs; they are appended per frame
+        state = {'background': background, 'scene': scene, 'ops': ops}
+        ops = ops + [('layer', layer) for ch, layer in glyphs]
+        damage = None
+    for box in damage if damage is not None else [(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)]:
+        compose_clock_region(frame, background, bg_color, ops, box)
+    clock_frame_state = dict(state, glyphs=glyphs)
+    frame_damage = damage
+    return frame
 
 def setup_spotify_oauth():
     return SpotifyOAuth(
@@ -1539,8 +2101,10 @@ def setup_spotify_oauth():
         show_dialog=False
     )
 
-def fetch_and_store_artist_image(sp, artist_id):
+def fetch_and_store_artist_image(sp, artist_id, generation=None):
     global artist_image
+    if not is_current_generation(generation):
+        return
     if not artist_id:
         with artist_image_lock: 
             artist_image = None
@@ -1549,45 +2113,46 @@ def fetch_and_store_artist_image(sp, artist_id):
     for attempt in range(max_retries):
         try:
             artist = sp.artist(artist_id)
+            if not is_current_generation(generation):
+                return
             images = artist.get('images', [])
             if not images:
                 with artist_image_lock: 
                     artist_image = None
                 return
-            url = None
-            for img in images:
-                if abs(img['width'] - 150) <= 20 and abs(img['height'] - 150) <= 20:
-                    url = img['url']
-                    break
-            if not url:
-                url = images[-1]['url']
+            rendition = select_image_rendition(images, ARTIST_IMAGE_SIZE[0])
+            url = rendition['url'] if rendition else None
             if not url:
                 with artist_image_lock: 
                     artist_image = None
                 return
             headers = {'User-Agent': 'Mozilla/5.0'}
-            resp = session.get(url, headers=headers, timeout=10)
-            resp.raise_for_status()
-            if 'image' not in resp.headers.get('content-type', '').lower(): 
-                raise ValueError("Not an image")
-            art_bytes = resp.content
+            art_bytes = download_for_generation(url, generation, require_image=True, headers=headers, timeout=10)
+            if art_bytes is None:
+                return
             # Offload image processing to process pool
             if process_executor is not None:
                 try:
-                    fut = process_executor.submit(_process_artist_image_bytes, art_bytes)
-                    pending_artist_futures[fut] = {'artist_id': artist_id}
+                    fut = track_future(process_executor.submit(hud_workers.process_artist_image, art_bytes), generation)
+                    dispatch_future(fut, on_artist_image_ready, {'artist_id': artist_id, 'url': url, 'generation': generation})
                 except Exception:
-                    img = Image.open(BytesIO(art_bytes)).convert("RGBA")
-                    img = img.resize((100, 100), Image.BILINEAR)
+                    img = hud_workers.decode_art_bytes(art_bytes, ARTIST_IMAGE_SIZE, 'RGBA')
+                    img = tag_image(img.resize(ARTIST_IMAGE_SIZE, Image.BILINEAR), url)
+                    if not is_current_generation(generation):
+                        return
                     with artist_image_lock:
                         artist_image = img
             else:
-                img = Image.open(BytesIO(art_bytes)).convert("RGBA")
-                img = img.resize((100, 100), Image.BILINEAR)
+                img = hud_workers.decode_art_bytes(art_bytes, ARTIST_IMAGE_SIZE, 'RGBA')
+                img = tag_image(img.resize(ARTIST_IMAGE_SIZE, Image.BILINEAR), url)
+                if not is_current_generation(generation):
+                    return
                 with artist_image_lock:
                     artist_image = img
             break
         except Exception as e:
+            if not is_current_generation(generation):
+                return
             if attempt < max_retries - 1:
                 wait_time = (attempt + 1) * 2
                 print(f"🔄 Artist image fetch attempt {attempt + 1} failed: {e}, retrying in {wait_time}s")
@@ -1613,6 +2178,7 @@ def write_current_track_state(track_data):
                 'current_position': int(track_data.get('current_position', 0)),
                 'duration': int(track_data.get('duration', 0)),
                 'is_playing': bool(track_data.get('is_playing', False)),
+                'palette': ['#%02x%02x%02x' % c for c in track_data.get('palette', ())],
                 'timestamp': time.time()
             }
         else:
@@ -1720,6 +2286,66 @@ def authenticate_spotify_interactive():
         print(f"❌ Authentication error: {e}")
         return None
 
+def _weather_icon_path(icon_id):
+    return os.path.join(WEATHER_ICON_DIR, f"{icon_id}@2x.png")
+
+def _load_weather_icon_file(icon_id):
+    img = Image.open(_weather_icon_path(icon_id)).convert("RGBA")
+    with weather_icon_lock:
+        weather_icon_sources[icon_id] = img
+    return img
+
+def preload_weather_icons():
+    """Decode every icon fetched on an earlier run, so a known condition renders without a fetch."""
+    try:
+        names = os.listdir(WEATHER_ICON_DIR)
+    except OSError:
+        return
+    for name in names:
+        if name.endswith('@2x.png'):
+            try:
+                _load_weather_icon_file(name[:-len('@2x.png')])
+            except Exception as e:
+                print(f"⚠️ Weather icon {name} unreadable: {e}")
+
+def fetch_weather_icon(icon_id):
+    """Make sure the icon is on disk and decoded, downloading it if needed. Runs off the render path."""
+    with weather_icon_lock:
+        if icon_id in weather_icon_sources:
+            return
+    try:
+        if not os.path.exists(_weather_icon_path(icon_id)):
+            icon_url = f"http://openweathermap.org/img/wn/{icon_id}@2x.png"
+            resp = session.get(icon_url, timeout=5)
+            resp.raise_for_status()
+            os.makedirs(WEATHER_ICON_DIR, exist_ok=True)
+            tmp = _weather_icon_path(icon_id) + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(resp.content)
+            os.replace(tmp, _weather_icon_path(icon_id))
+        _load_weather_icon_file(icon_id)
+    except Exception as e:
+        print(f"Weather icon fetch error: {e}")
+        return
+    update_display('weather')
+
+def get_weather_icon(icon_id, size, mode='RGBA'):
+    """Icon fitted into size and converted to mode ('RGBA' for colour screens, '1' for e-paper), or None
+    if fetch_weather_icon() has not got it yet. Never touches the network."""
+    key = (icon_id, size, mode)
+    with weather_icon_lock:
+        icon = weather_icon_cache.get(key)
+        if icon is None:
+            source = weather_icon_sources.get(icon_id)
+            if source is None:
+                return None
+            icon = source.copy()
+            icon.thumbnail(size, Image.BILINEAR)
+            if mode != icon.mode:
+                icon = icon.convert(mode)
+            weather_icon_cache[key] = icon = tag_image(icon, key)
+    return icon
+
 def weather_loop():
     global START_SCREEN, weather_info
     lat, lon = None, None
@@ -1730,7 +2356,6 @@ def weather_loop():
         if lat is None or lon is None: return
     last_geo = time.time()
     last_weather = 0
-    last_display_update = 0
     last_cache_cleanup = time.time()
     GEO_UPDATE_INTERVAL = 900
     while not exit_event.is_set():
@@ -1749,24 +2374,11 @@ def weather_loop():
             if new_weather is not None: 
                 weather_info = new_weather
                 if weather_info and "icon_id" in weather_info:
-                    try:
-                        icon_url = f"http://openweathermap.org/img/wn/{weather_info['icon_id']}.png"
-                        resp = session.get(icon_url, timeout=5)
-                        resp.raise_for_status()
-                        icon_img = Image.open(BytesIO(resp.content)).convert("RGBA")
-                        icon_img = icon_img.resize((30, 30), Image.BILINEAR)
-                        icon_img_bw = icon_img.convert('1')
-                        weather_info['cached_icon'] = icon_img_bw
-                    except Exception as e:
-                        print(f"Weather icon fetch error: {e}")
-                        weather_info['cached_icon'] = None
-                else:
-                    weather_info['cached_icon'] = None
+                    executor.submit(fetch_weather_icon, weather_info['icon_id'])
+                update_display('weather')
             last_weather = now
-        if START_SCREEN == "weather" and now - last_display_update >= 1:
-            update_display()
-            last_display_update = now
-        if exit_event.wait(2):
+        # Weather and location change on a scale of minutes; the screen's minute tick is on the timer wheel
+        if exit_event.wait(max(0.0, next_boundary(60.0) - time.time())):
             break
 
 def animate_text_scroll():
@@ -1870,20 +2482,58 @@ def init_st7789_display():
         print(f"ST7789 init failed: {e}")
         return None
 
+def changed_tiles(frame, previous, tile=FRAME_TILE_SIZE):
+    """Rectangles (x0, y0, x1, y1) covering the tiles where frame differs from previous (same shape).
+    Pixels are compared as raw bytes, so any dtype or channel count works; changed tiles next to each
+    other in a tile row are joined into one rectangle."""
+    h, w = frame.shape[:2]
+    current, before = frame.reshape(h, -1), previous.reshape(h, -1)
+    pixel_bytes = current.shape[1] // w
+    diff = np.not_equal(current, before)
+    tile_rows = np.logical_or.reduceat(diff, np.arange(0, h, tile), axis=0)
+    tiles = np.logical_or.reduceat(tile_rows, np.arange(0, w * pixel_bytes, tile * pixel_bytes), axis=1)
+    rects = []
+    for ty in np.flatnonzero(tiles.any(axis=1)).tolist():
+        columns = np.flatnonzero(tiles[ty])
+        breaks = np.flatnonzero(np.diff(columns) > 1)
+        starts = np.concatenate(([columns[0]], columns[breaks + 1]))
+        ends = np.concatenate((columns[breaks], [columns[-1]]))
+        y0, y1 = ty * tile, min(h, (ty + 1) * tile)
+        rects.extend((x0 * tile, y0, min(w, (x1 + 1) * tile), y1) for x0, x1 in zip(starts.tolist(), ends.tolist()))
+    return rects
+
+def detect_frame_changes(name, frame):
+    """Compare frame with the one last pushed to backend name and remember it for next time.
+    Returns None when there is nothing comparable (first frame, new size), otherwise the list of
+    changed tile rectangles, empty when the frame is unchanged."""
+    previous = frame_change_state.get(name)
+    if previous is None or previous.shape != frame.shape or previous.dtype != frame.dtype:
+        frame_change_state[name] = np.array(frame, copy=True)
+        return None
+    rects = changed_tiles(frame, previous)
+    if rects:
+        np.copyto(previous, frame)
+    return rects
+
+def reset_frame_changes(name=None):
+    """Forget the last frame of one backend (or all), forcing the next frame to be pushed in full."""
+    if name is None:
+        frame_change_state.clear()
+    else:
+        frame_change_state.pop(name, None)
+
 def display_image_on_st7789(image):
     global st7789_display
     try:
         if st7789_display is None:
             st7789_display = init_st7789_display()
             if st7789_display is None: return
-        scaled_image = get_cached_resized_image(image, (320, 240), 'RGB')
+        scaled_image = image if image.size == (320, 240) else image.resize((320, 240), RENDER_RESAMPLE)
+        if scaled_image.mode != 'RGB':
+            scaled_image = scaled_image.convert('RGB')
         try:
-            buf = scaled_image.tobytes()
-            md = hashlib.md5(buf).hexdigest()
-            last_hash = getattr(display_image_on_st7789, 'last_image_hash', None)
-            if md == last_hash:
+            if detect_frame_changes('st7789', np.asarray(scaled_image)) == []:
                 return
-            display_image_on_st7789.last_image_hash = md
         except Exception:
             pass
         st7789_display.display(scaled_image)
@@ -1891,35 +2541,175 @@ def display_image_on_st7789(image):
         print(f"ST7789 display error: {e}")
         display_image_on_original_fb(image)
 
-def display_image_on_original_fb(image):
+def _rgb565_scratch(count):
+    if _rgb565_buffers.get('size', 0) < count:
+        _rgb565_buffers.update(size=count, out=np.empty(count, dtype='<u2'), tmp=np.empty(count, dtype=np.uint16), index=np.empty(count, dtype=np.intp))
+    return _rgb565_buffers['out'][:count], _rgb565_buffers['tmp'][:count], _rgb565_buffers['index'][:count]
+
+def rgb_to_rgb565(arr, rotation=0):
+    """Gamma-corrected little-endian RGB565 of an (h, w, 3) uint8 array, rotated counter-clockwise by
+    rotation (a multiple of 90) in the same pass. Returns an (h, w) '<u2' view of a reusable buffer,
+    valid until the next call; its memoryview can be written to the framebuffer as is."""
+    src = np.rot90(arr, (rotation // 90) % 4) if rotation % 360 else arr
+    h, w = src.shape[:2]
+    out, tmp, index = (buf.reshape(h, w) for buf in _rgb565_scratch(h * w))
+    # Indices are widened into a preallocated buffer so np.take does not allocate its own copy
+    np.copyto(index, src[:, :, 0])
+    np.take(_rgb565_r, index, out=out)
+    np.copyto(index, src[:, :, 1])
+    np.take(_rgb565_g, index, out=tmp)
+    out |= tmp
+    np.copyto(index, src[:, :, 2])
+    np.take(_rgb565_b, index, out=tmp)
+    out |= tmp
+    return out
+
+def read_framebuffer_geometry(fd):
+    """(width, height, bits_per_pixel, line_length) from the fb ioctls, or None when fd is not a framebuffer."""
+    try:
+        import fcntl
+        vinfo = fcntl.ioctl(fd, FBIOGET_VSCREENINFO, bytes(160))
+        finfo = fcntl.ioctl(fd, FBIOGET_FSCREENINFO, bytes(80))
+    except (ImportError, OSError):
+        return None
+    xres, yres, _, _, _, _, bits_per_pixel = struct.unpack_from("7I", vinfo)
+    # struct fb_fix_screeninfo: id[16], smem_start (unsigned long), smem_len, type, type_aux, visual,
+    # xpanstep, ypanstep, ywrapstep, line_length; native alignment places line_length correctly
+    line_length = struct.unpack_from("@16sLIIIIHHHI", finfo)[-1]
+    return xres, yres, bits_per_pixel, line_length or xres * bits_per_pixel // 8
+
+def open_framebuffer():
+    """Map FRAMEBUFFER once and keep it mapped. Geometry and stride come from the fb ioctls; a regular
+    file falls back to SCREEN_WIDTH x SCREEN_HEIGHT RGB565. Returns None when mapping is not possible
+    (no device yet, other pixel depths, no mmap support), in which case frames are written the old way."""
+    global fb_map, fb_map_failed
+    with fb_map_lock:
+        if fb_map is not None or fb_map_failed:
+            return fb_map
+        fb_file = None
+        try:
+            fb_file = open(FRAMEBUFFER, "r+b")
+            geometry = read_framebuffer_geometry(fb_file.fileno())
+            if geometry is None:
+                width, height, bits_per_pixel, stride = SCREEN_WIDTH, SCREEN_HEIGHT, 16, SCREEN_WIDTH * 2
+                if os.path.isfile(FRAMEBUFFER) and os.path.getsize(FRAMEBUFFER) < stride * height:
+                    fb_file.truncate(stride * height)
+            else:
+                width, height, bits_per_pixel, stride = geometry
+            if bits_per_pixel != 16 or stride % 2:
+                raise ValueError(f"unsupported framebuffer format: {bits_per_pixel} bpp, stride {stride}")
+            mapped = mmap.mmap(fb_file.fileno(), stride * height, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        except PermissionError:
+            if fb_file is not None:
+                fb_file.close()
+            raise
+        except Exception as e:
+            # FileNotFoundError included: the plain write path creates the file
+            if fb_file is not None:
+                fb_file.close()
+            fb_map_failed = True
+            print(f"⚠️ Framebuffer mmap unavailable ({e}), using plain writes")
+            return None
+        pixels = np.frombuffer(mapped, dtype='<u2', count=stride * height // 2).reshape(height, stride // 2)[:, :width]
+        fb_map = {'file': fb_file, 'mmap': mapped, 'pixels': pixels, 'shadow': pixels.copy(), 'width': width, 'height': height}
+        print(f"✅ Framebuffer mapped: {FRAMEBUFFER} {width}x{height}, stride {stride}")
+        return fb_map
+
+def write_framebuffer_rows(fb, rgb565):
+    """Copy an (h, w) uint16 RGB565 frame into the mapped framebuffer. Rows are diffed against the
+    shadow copy and only the span between the first and last changed pixel of each row is written."""
+    h, w = min(fb['height'], rgb565.shape[0]), min(fb['width'], rgb565.shape[1])
+    new, shadow, pixels = rgb565[:h, :w], fb['shadow'][:h, :w], fb['pixels'][:h, :w]
+    changed = new != shadow
+    rows = np.flatnonzero(changed.any(axis=1))
+    if not rows.size:
+        return
+    row_changes = changed[rows]
+    first = row_changes.argmax(axis=1)
+    last = w - row_changes[:, ::-1].argmax(axis=1)
+    for row, x0, x1 in zip(rows.tolist(), first.tolist(), last.tolist()):
+        pixels[row, x0:x1] = new[row, x0:x1]
+    shadow[rows] = new[rows]
+
+def write_framebuffer_rects(arr, rects):
+    """Convert and write only the given rectangles of an unrotated full-size (h, w, 3) frame array."""
+    fb = open_framebuffer()
+    if fb is not None:
+        with fb_map_lock:
+            for x0, y0, x1, y1 in rects:
+                x1, y1 = min(x1, fb['width']), min(y1, fb['height'])
+                if x0 >= x1 or y0 >= y1:
+                    continue
+                rows = rgb_to_rgb565(arr[y0:y1, x0:x1])
+                fb['pixels'][y0:y1, x0:x1] = rows
+                fb['shadow'][y0:y1, x0:x1] = rows
+        return
+    with open(FRAMEBUFFER, "r+b") as fb:
+        for x0, y0, x1, y1 in rects:
+            rows = rgb_to_rgb565(arr[y0:y1, x0:x1])
+            for row_index, row in enumerate(rows):
+                fb.seek(((y0 + row_index) * SCREEN_WIDTH + x0) * 2)
+                fb.write(row)
+    # The framebuffer no longer matches the last full frame written
+    reset_frame_changes('framebuffer')
+
+def blank_framebuffer():
+    """Zero the mapped framebuffer. Returns False when it is not mapped."""
+    fb = open_framebuffer()
+    if fb is None:
+        return False
+    with fb_map_lock:
+        fb['pixels'][:] = 0
+        fb['shadow'][:] = 0
+        fb['mmap'].flush()
+    return True
+
+def display_image_on_original_fb(image, damage=None):
     try:
         rotation = config["display"].get("rotation", 0)
-        if rotation == 180:
-            rotated_image = image.rotate(180, expand=False)
+        # The RGB565 conversion buffers are shared, so conversion and write happen under the map lock
+        if isinstance(image, np.ndarray):
+            arr = image
         else:
-            rotated_image = image.rotate(rotation, expand=True)
-        rotated_image = get_cached_resized_image(rotated_image, (SCREEN_WIDTH, SCREEN_HEIGHT), 'RGB')
-        arr = np.array(rotated_image, dtype=np.uint8)
-        r = _gamma_r[arr[:, :, 0]].astype(np.uint16)
-        g = _gamma_g[arr[:, :, 1]].astype(np.uint16)
-        b = _gamma_b[arr[:, :, 2]].astype(np.uint16)
-        rgb565 = (r << 11) | (g << 5) | b
-        output = np.empty((SCREEN_HEIGHT, SCREEN_WIDTH, 2), dtype=np.uint8)
-        output[:, :, 0] = rgb565 & 0xFF
-        output[:, :, 1] = (rgb565 >> 8) & 0xFF
-        # compute md5 of the RGB565 buffer and skip writing if identical
-        buf = output.tobytes()
-        md = hashlib.md5(buf).hexdigest()
-        last_hash = getattr(display_image_on_original_fb, 'last_image_hash', None)
-        if md == last_hash:
-            return
-        display_image_on_original_fb.last_image_hash = md
-        with open(FRAMEBUFFER, "wb") as fb:
-            fb.write(buf)
+            arr = np.asarray(image if image.mode == "RGB" else image.convert("RGB"), dtype=np.uint8)
+        with fb_map_lock:
+            if damage is not None and rotation == 0 and arr.shape[:2] == (SCREEN_HEIGHT, SCREEN_WIDTH):
+                if damage:
+                    write_framebuffer_rects(arr, damage)
+                return
+            fb = open_framebuffer()
+            target = (fb['height'], fb['width']) if fb is not None else (SCREEN_HEIGHT, SCREEN_WIDTH)
+            if rotation % 90 == 0 and (arr.shape[:2] if rotation % 180 == 0 else arr.shape[1::-1]) == target:
+                output = rgb_to_rgb565(arr, rotation)
+            else:
+                image = frame_image(image)
+                if rotation == 180:
+                    rotated_image = image.rotate(180, expand=False)
+                else:
+                    rotated_image = image.rotate(rotation, expand=True)
+                if rotated_image.size != (SCREEN_WIDTH, SCREEN_HEIGHT):
+                    rotated_image = rotated_image.resize((SCREEN_WIDTH, SCREEN_HEIGHT), RENDER_RESAMPLE)
+                output = rgb_to_rgb565(np.asarray(rotated_image.convert("RGB"), dtype=np.uint8))
+            if fb is not None:
+                write_framebuffer_rows(fb, output)
+                return
+            # Only the changed tiles are written once there is a previous frame to compare with
+            rects = detect_frame_changes('framebuffer', output)
+            if rects is None:
+                with open(FRAMEBUFFER, "wb") as fb_file:
+                    fb_file.write(output)
+                return
+            if rects:
+                with open(FRAMEBUFFER, "r+b") as fb_file:
+                    width = output.shape[1]
+                    for x0, y0, x1, y1 in rects:
+                        for row in range(y0, y1):
+                            fb_file.seek((row * width + x0) * 2)
+                            fb_file.write(output[row, x0:x1])
     except PermissionError:
         print(f"Permission denied for {FRAMEBUFFER} - falling back to ST7789")
         if HAS_ST7789:
-            display_image_on_st7789(image)
+            display_image_on_st7789(frame_image(image))
         else:
             print("No display available")
     except Exception as e:
@@ -1934,10 +2724,19 @@ def save_current_album_art(album_art_image, track_data=None):
                 os.remove('static/current_album_art.jpg')
                 last_saved_album_art_hash = None
             return
-        display_size = (300, 300)
-        resized_art = get_cached_resized_image(album_art_image, display_size, 'RGB')
+        # Keyed on the art's source rather than this rendition, so the 150px thumbnail of art whose
+        # web copy was already written from the full-size source does not overwrite it with an upscale
+        art_key = image_key(album_art_image)[0]
+        if art_key == last_saved_album_art_hash and os.path.exists('static/current_album_art.jpg'):
+            return
+        url = art_cache_url(album_art_image)
+        resized_art = art_cache_get_image(url, ART_SOURCE_SIZE)
+        if resized_art is None:
+            resized_art = get_cached_resized_image(album_art_image, ART_SOURCE_SIZE, 'RGB')
+            if min(album_art_image.size) >= ART_SOURCE_SIZE[0]:
+                art_cache_put_image(url, ART_SOURCE_SIZE, resized_art)
         resized_art.save('static/current_album_art.jpg', 'JPEG', quality=85)
-        last_saved_album_art_hash = compute_img_hash(album_art_image)
+        last_saved_album_art_hash = art_key
     except Exception as e:
         print(f"❌ Error saving album art for web: {e}")
 
@@ -2076,37 +2875,58 @@ def initialize_spotify_client_or_auth():
     return True
 
 def handle_no_track_playing(current_time, last_successful_write, write_interval):
-    global spotify_track, consecutive_no_track_count
+    global spotify_track, consecutive_no_track_count, album_art_image, current_album_art_hash
     consecutive_no_track_count += 1
-        if ENABLE_LASTFM_SCROBBLE and spotify_track is not None:
-            # Scrobble if a track was previously playing and met threshold
-            try:
-                if spotify_track and spotify_track.get('is_playing', False):
-                    duration = int(spotify_track.get('duration', 0))
-                    position = int(spotify_track.get('current_position', 0))
-                    # require both min seconds and percent threshold
-                    if duration > 0 and position >= int(duration * LASTFM_SCROBBLE_THRESHOLD) and position >= LASTFM_MIN_SECONDS:
-                        ts = int(time.time()) - int(position)
-                        scrobble_to_lastfm(spotify_track, timestamp=ts)
-                    else:
-                        print(f"ℹ️ Skipping scrobble: played {position}s of {duration}s (<{int(LASTFM_SCROBBLE_THRESHOLD*100)}% or <{LASTFM_MIN_SECONDS}s) ")
-            except Exception:
-                pass
-        spotify_track = None
-        with art_lock: 
-            album_art_image = None
-            current_album_art_hash = None
-        cleanup_album_art()
-        if current_time - last_successful_write >= write_interval:
-            write_current_track_state(None)
-            last_successful_write = current_time
-        update_spotify_layout(None)
-        if START_SCREEN == "spotify":
-            update_display()
+    if ENABLE_LASTFM_SCROBBLE and spotify_track is not None:
+        # Scrobble if a track was previously playing and met threshold
+        try:
+            if spotify_track and spotify_track.get('is_playing', False):
+                duration = int(spotify_track.get('duration', 0))
+                position = int(spotify_track.get('current_position', 0))
+                # require both min seconds and percent threshold
+                if duration > 0 and position >= int(duration * LASTFM_SCROBBLE_THRESHOLD) and position >= LASTFM_MIN_SECONDS:
+                    ts = int(time.time()) - int(position)
+                    scrobble_to_lastfm(spotify_track, timestamp=ts)
+                else:
+                    print(f"ℹ️ Skipping scrobble: played {position}s of {duration}s (<{int(LASTFM_SCROBBLE_THRESHOLD*100)}% or <{LASTFM_MIN_SECONDS}s) ")
+        except Exception:
+            pass
+    spotify_track = None
+    # Nothing is playing, so results still in flight for the last track are stale
+    begin_track_generation()
+    cancel_timer("track_end")
+    with art_lock: 
+        album_art_image = None
+        current_album_art_hash = None
+    cleanup_album_art()
+    if current_time - last_successful_write >= write_interval:
+        write_current_track_state(None)
+        last_successful_write = current_time
+    update_spotify_layout(None)
+    if START_SCREEN == "spotify":
+        update_display()
     return last_successful_write
 
-def fetch_and_process_album_art(art_url, spotify_track, item, is_continuation):
-    global last_art_url, album_art_image
+def set_processed_album_art(url, packed, main_color, secondary_color, palette, track, generation=None):
+    """Install an inline hud_workers.process_album_art() result and remember it in the disk cache.
+    Does nothing once generation has been superseded."""
+    global album_art_image
+    if not is_current_generation(generation):
+        return
+    if packed:
+        img = tag_image(unpack_image(packed), url)
+        store_art_palette(img, palette)
+        with art_lock:
+            album_art_image = img
+        art_cache_put(url, img, main_color, secondary_color)
+        track['palette'] = palette['dominant']
+    track['main_color'] = main_color
+    track['secondary_color'] = secondary_color
+
+def fetch_and_process_album_art(art_url, spotify_track, item, is_continuation, generation=None):
+    """Runs on the thread pool for each track change. Every stage checks the track generation it was
+    started for and gives up, leaving shared state alone, once a newer track has taken over."""
+    global album_art_image, current_album_art_hash
     if not is_continuation:
         try:
             # derive artist and album names for fallback lookups
@@ -2121,50 +2941,61 @@ def fetch_and_process_album_art(art_url, spotify_track, item, is_continuation):
                         art_url = mb_url
                 except Exception:
                     pass
-            if art_url:
+                if not is_current_generation(generation):
+                    return
+            cached_art = art_cache_get(art_url)
+            if cached_art:
+                # Seen before: thumbnail and colours come off disk, the background worker finds
+                # the generated backgrounds there too
+                img = cached_art['image']
+                if not is_current_generation(generation):
+                    return
+                current_album_art_hash = image_key(img)
+                with art_lock:
+                    album_art_image = img
+                spotify_track['main_color'] = cached_art['main_color']
+                spotify_track['secondary_color'] = cached_art['secondary_color']
+                spotify_track['palette'] = get_art_palette(img)['dominant']
+                request_background_generation(img, generation)
+                with album_bg_cache_lock:
+                    album_bg_cache.clear()
+                save_current_album_art(img)
+            elif art_url:
                 max_retries = 2
                 for art_attempt in range(max_retries):
                     try:
                         headers = {'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'}
-                        resp = session.get(art_url, headers=headers, timeout=15)
-                        resp.raise_for_status()
-                        img = Image.open(BytesIO(resp.content)).convert("RGB")
-                        img.thumbnail((150, 150), Image.NEAREST)
-                        # compute hash early to avoid repeated background generation
-                        try:
-                            current_album_art_hash = compute_img_hash(img)
-                        except Exception:
-                            current_album_art_hash = None
-                        # Save a copy to disk & request background generation immediately
-                        save_current_album_art(img)
-                        request_background_generation(img)
+                        data = download_for_generation(art_url, generation, headers=headers, timeout=15)
+                        if data is None:
+                            return
+                        source = tag_image(hud_workers.decode_art_bytes(data, ART_SOURCE_SIZE), art_url)
+                        if not is_current_generation(generation):
+                            return
+                        # The web copy is taken from the source; everything else works off the 150px thumbnail
+                        save_current_album_art(source)
+                        img = source.copy()
+                        img.thumbnail(ALBUM_ART_SIZE, Image.BILINEAR)
+                        # The source URL identifies the art for every cache from here on
+                        current_album_art_hash = image_key(tag_image(img, art_url))
+                        # Request background generation immediately
+                        request_background_generation(img, generation)
                         with album_bg_cache_lock:
                             album_bg_cache.clear()
                         # Offload color extraction and final thumbnail retainment to process pool
-                        bio = BytesIO(); img.save(bio, format='PNG'); art_bytes = bio.getvalue()
+                        packed_art = pack_image(img)
                         if process_executor is not None:
                             try:
-                                fut = process_executor.submit(_process_album_art_bytes, art_bytes, (150,150))
-                                pending_album_futures[fut] = {'item': item}
+                                fut = track_future(process_executor.submit(hud_workers.process_album_art, packed_art, (150,150)), generation)
+                                dispatch_future(fut, on_album_art_ready, {'item': item, 'url': art_url, 'generation': generation})
                             except Exception:
                                 # fallback: compute inline
-                                img_bytes, main_color, secondary_color = _process_album_art_bytes(art_bytes, (150,150))
-                                if img_bytes:
-                                    img = Image.open(BytesIO(img_bytes)).convert('RGB')
-                                    with art_lock:
-                                        album_art_image = img
-                                spotify_track['main_color'] = main_color
-                                spotify_track['secondary_color'] = secondary_color
+                                set_processed_album_art(art_url, *hud_workers.process_album_art(packed_art, (150,150)), spotify_track, generation)
                         else:
-                            img_bytes, main_color, secondary_color = _process_album_art_bytes(art_bytes, (150,150))
-                            if img_bytes:
-                                img = Image.open(BytesIO(img_bytes)).convert('RGB')
-                                with art_lock:
-                                    album_art_image = img
-                            spotify_track['main_color'] = main_color
-                            spotify_track['secondary_color'] = secondary_color
+                            set_processed_album_art(art_url, *hud_workers.process_album_art(packed_art, (150,150)), spotify_track, generation)
                         break
                     except Exception as e:
+                        if not is_current_generation(generation):
+                            return
                         if art_attempt < max_retries - 1:
                             wait_time = (art_attempt + 1) * 2
                             print(f"🔄 Album art fetch attempt {art_attempt + 1} failed: {e}, retrying in {wait_time}s")
@@ -2175,34 +3006,31 @@ def fetch_and_process_album_art(art_url, spotify_track, item, is_continuation):
                                 mb_url = None
                                 if artist_str and album_str:
                                     mb_url = get_musicbrainz_cover_art(artist_str, album_str)
+                                if not is_current_generation(generation):
+                                    return
                                 if mb_url and mb_url != art_url:
                                     # try one more time with fallback
                                     headers = {'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'}
-                                    r = session.get(mb_url, headers=headers, timeout=15)
-                                    r.raise_for_status()
-                                    img = Image.open(BytesIO(r.content)).convert('RGB')
-                                    img.thumbnail((150, 150), Image.NEAREST)
-                                    try:
-                                        current_album_art_hash = compute_img_hash(img)
-                                    except Exception:
-                                        current_album_art_hash = None
-                                    save_current_album_art(img)
-                                    request_background_generation(img)
+                                    data = download_for_generation(mb_url, generation, headers=headers, timeout=15)
+                                    if data is None:
+                                        return
+                                    source = tag_image(hud_workers.decode_art_bytes(data, ART_SOURCE_SIZE), mb_url)
+                                    if not is_current_generation(generation):
+                                        return
+                                    save_current_album_art(source)
+                                    img = source.copy()
+                                    img.thumbnail(ALBUM_ART_SIZE, Image.BILINEAR)
+                                    current_album_art_hash = image_key(tag_image(img, mb_url))
+                                    request_background_generation(img, generation)
                                     with album_bg_cache_lock:
                                         album_bg_cache.clear()
-                                    bio = BytesIO(); img.save(bio, format='PNG'); art_bytes = bio.getvalue()
+                                    packed_art = pack_image(img)
                                     if process_executor is not None:
                                         try:
-                                            fut = process_executor.submit(_process_album_art_bytes, art_bytes, (150,150))
-                                            pending_album_futures[fut] = {'item': item}
+                                            fut = track_future(process_executor.submit(hud_workers.process_album_art, packed_art, (150,150)), generation)
+                                            dispatch_future(fut, on_album_art_ready, {'item': item, 'url': mb_url, 'generation': generation})
                                         except Exception:
-                                            img_bytes, main_color, secondary_color = _process_album_art_bytes(art_bytes, (150,150))
-                                            if img_bytes:
-                                                img = Image.open(BytesIO(img_bytes)).convert('RGB')
-                                                with art_lock:
-                                                    album_art_image = img
-                                            spotify_track['main_color'] = main_color
-                                            spotify_track['secondary_color'] = secondary_color
+                                            set_processed_album_art(mb_url, *hud_workers.process_album_art(packed_art, (150,150)), spotify_track, generation)
                                             try:
                                                 evt = {'type': 'cover_fallback', 'artist': artist_str, 'album': album_str}
                                                 if executor is not None:
@@ -2212,13 +3040,7 @@ def fetch_and_process_album_art(art_url, spotify_track, item, is_continuation):
                                             except Exception:
                                                 pass
                                     else:
-                                        img_bytes, main_color, secondary_color = _process_album_art_bytes(art_bytes, (150,150))
-                                        if img_bytes:
-                                            img = Image.open(BytesIO(img_bytes)).convert('RGB')
-                                            with art_lock:
-                                                album_art_image = img
-                                        spotify_track['main_color'] = main_color
-                                        spotify_track['secondary_color'] = secondary_color
+                                        set_processed_album_art(mb_url, *hud_workers.process_album_art(packed_art, (150,150)), spotify_track, generation)
                                         try:
                                             evt = {'type': 'cover_fallback', 'artist': artist_str, 'album': album_str}
                                             if executor is not None:
@@ -2235,15 +3057,20 @@ def fetch_and_process_album_art(art_url, spotify_track, item, is_continuation):
                                     spotify_track['main_color'] = (0, 255, 0)
                                     spotify_track['secondary_color'] = (0, 255, 255)
                             except Exception as e2:
+                                if not is_current_generation(generation):
+                                    return
                                 print(f"❌ Album art fetch failed after fallback: {e2}")
                                 with art_lock: 
                                     album_art_image = None
                                     current_album_art_hash = None
                                 spotify_track['main_color'] = (0, 255, 0)
                                 spotify_track['secondary_color'] = (0, 255, 255)
-                last_art_url = art_url
+                if not is_current_generation(generation):
+                    return
                 save_current_album_art(img)
             else:
+                if not is_current_generation(generation):
+                    return
                 with art_lock: 
                     album_art_image = None
                     current_album_art_hash = None
@@ -2251,21 +3078,25 @@ def fetch_and_process_album_art(art_url, spotify_track, item, is_continuation):
                 spotify_track['secondary_color'] = (0, 255, 255)
                 save_current_album_art(None)
         except Exception as e:
+            if not is_current_generation(generation):
+                return
             print(f"❌ Error loading album art: {e}")
             with art_lock: 
                 album_art_image = None
                 current_album_art_hash = None
             spotify_track['main_color'] = (0, 255, 0)
             spotify_track['secondary_color'] = (0, 255, 255)
+        if not is_current_generation(generation):
+            return
         update_spotify_layout(spotify_track)
         scrolling_text_cache.clear()
         setup_scrolling_text_for_track(spotify_track)
         if item.get('artists') and len(item['artists']) > 0:
             primary_artist_id = item['artists'][0]['id']
             try:
-                executor.submit(fetch_and_store_artist_image, sp, primary_artist_id)
+                track_future(executor.submit(fetch_and_store_artist_image, sp, primary_artist_id, generation), generation)
             except Exception:
-                Thread(target=fetch_and_store_artist_image, args=(sp, primary_artist_id), daemon=True).start()
+                Thread(target=fetch_and_store_artist_image, args=(sp, primary_artist_id, generation), daemon=True).start()
     else:
         if album_art_image:
             main_color, secondary_color = get_contrasting_colors(album_art_image)
@@ -2275,6 +3106,7 @@ def fetch_and_process_album_art(art_url, spotify_track, item, is_continuation):
             spotify_track['main_color'] = (0, 255, 0)
             spotify_track['secondary_color'] = (0, 255, 255)
         update_spotify_layout(spotify_track)
+    update_display('spotify')
 
 def setup_scrolling_text_for_track(track_data):
     for key in ['title', 'artists', 'album']:
@@ -2323,7 +3155,7 @@ def handle_track_update(current_time, last_successful_write, write_interval, tra
     track_changed = current_id != last_track_id or spotify_track is None
     art_url = None
     if item.get('album') and item['album'].get('images'):
-        art_url = item['album']['images'][0]['url']
+        art_url = (select_image_rendition(item['album']['images'], ART_SOURCE_SIZE[0]) or {}).get('url')
     art_changed = art_url != last_art_url
     if track_changed or art_changed or spotify_track is None:
         # Scrobble previously playing track before switching
@@ -2346,7 +3178,14 @@ def handle_track_update(current_time, last_successful_write, write_interval, tra
         if current_time - last_successful_write >= write_interval:
             write_current_track_state(spotify_track)
             last_successful_write = current_time
-        fetch_and_process_album_art(art_url, spotify_track, item, is_continuation)
+        # Art, colours and the artist image load off the Spotify thread; a newer track supersedes them
+        last_art_url = art_url
+        generation = begin_track_generation()
+        cancel_timer("track_end")
+        try:
+            track_future(executor.submit(fetch_and_process_album_art, art_url, spotify_track, item, is_continuation, generation), generation)
+        except Exception:
+            Thread(target=fetch_and_process_album_art, args=(art_url, spotify_track, item, is_continuation, generation), daemon=True).start()
         try:
             if lfm and spotify_track and spotify_track.get('is_playing', False):
                 report_now_playing_to_lastfm(spotify_track)
@@ -2384,6 +3223,13 @@ def handle_track_update(current_time, last_successful_write, write_interval, tra
         if should_write:
             write_current_track_state(spotify_track)
             last_successful_write = current_time
+    # One-shot timer so the Spotify screen redraws right when the track is due to end. Polls only
+    # move it when a new track starts or the end drifts by more than TRACK_END_SLACK (a seek).
+    remaining = new_track['duration'] - current_position
+    if is_playing and remaining > 0:
+        schedule_at("track_end", time.time() + remaining, tick_screen("spotify"), slack=TRACK_END_SLACK)
+    else:
+        cancel_timer("track_end")
     return last_successful_write, last_track_id, is_first_track_after_startup
 
 def handle_spotify_api_errors(e, api_error_count):
@@ -2399,25 +3245,21 @@ def handle_spotify_api_errors(e, api_error_count):
         print(f"🎵 Spotify API error (attempt {api_error_count}): {e}")
         last_api_call = time.time()
     return True
-                if art_url:  # This line is unchanged
 def spotify_loop():
-                        # Offload color extraction and final thumbnail retainment to process pool  # This line is unchanged
+    global consecutive_no_track_count, last_api_call
     last_successful_write = 0
-                        if process_executor is not None:  # This line is unchanged
+    write_interval = 1
     base_track_check_interval = 2
-                        else:  # This line is unchanged
+    idle_check_interval = 10
+    max_consecutive_no_track = 3
     last_api_call = 0
-                            spotify_track['main_color'] = main_color  # This line is unchanged
     consecutive_no_track_count = 0
-                            spotify_track['secondary_color'] = secondary_color  # This line is unchanged
     current_check_interval = base_track_check_interval
-                else:  # This line is unchanged
     load_previous_track_state()
-                with art_lock:  # This line is unchanged
     if not initialize_spotify_client_or_auth():
-                    spotify_track['main_color'] = (0, 255, 0)  # This line is unchanged
+        return
     last_track_id = None
-        # Initialize last.fm client lazily and send now playing/scrobble updates  # This line is unchanged
+    is_first_track_after_startup = True
     api_error_count = 0
     while not exit_event.is_set():
         current_time = time.time()
@@ -2425,8 +3267,6 @@ def spotify_loop():
             current_check_interval = min(10 * (2 ** min(api_error_count-1, 2)), 60)
         elif spotify_track and spotify_track.get('is_playing', False):
             current_check_interval = base_track_check_interval
-        except Exception:  # This line is unchanged
-            consecutive_no_track_count = 0
         else:
             if consecutive_no_track_count >= max_consecutive_no_track:
                 current_check_interval = idle_check_interval
@@ -2485,32 +3325,21 @@ def display_image_on_waveshare(image):
         try:
             display_width = 250
             display_height = 122
-            # Use cached dithered conversion at the target display size
-            image_bw = get_cached_dithered_image(image, size=(display_width, display_height))
-            if image_bw is None:
-                # fallback to a synchronous conversion to avoid display gaps
-                image_bw = convert_to_1bit_dithered(image, size=(display_width, display_height))
-            image = image_bw
-            content_changed = getattr(image, 'content_changed', True)
-            try:
-                buf = image.tobytes()
-                md = hashlib.md5(buf).hexdigest()
-                last_hash = getattr(display_image_on_waveshare, 'last_image_hash', None)
-                if md == last_hash and partial_refresh_count < 300:
-                    waveshare_epd.displayPartial(waveshare_epd.getbuffer(image))
-                    partial_refresh_count += 1
-                else:
-                    waveshare_epd.display(waveshare_epd.getbuffer(image))
-                    display_image_on_waveshare.last_image_hash = md
-                    partial_refresh_count = 0
-            except Exception:
-                if content_changed or partial_refresh_count >= 300:
-                    waveshare_epd.display(waveshare_epd.getbuffer(image))
-                waveshare_base_image = image.copy()
+            # Rendered frames are new images every time, so a content-keyed cache would have to hash
+            # each one; the conversion at this size is cheap enough to do inline
+            image = convert_to_1bit_dithered(image, size=(display_width, display_height))
+            changes = detect_frame_changes('waveshare', np.asarray(image))
+            if changes == []:
+                return
+            # Changed content goes out as a partial refresh, with a full refresh on the first frame
+            # and every 300 partials to clear ghosting
+            if changes is None or partial_refresh_count >= 300:
+                waveshare_epd.display(waveshare_epd.getbuffer(image))
                 partial_refresh_count = 0
             else:
                 waveshare_epd.displayPartial(waveshare_epd.getbuffer(image))
                 partial_refresh_count += 1
+            waveshare_base_image = image.copy()
         except Exception as e:
             print(f"Waveshare display error: {e}")
             try:
@@ -2518,45 +3347,188 @@ def display_image_on_waveshare(image):
                 waveshare_epd.display(waveshare_epd.getbuffer(image))
                 waveshare_base_image = image.copy()
                 partial_refresh_count = 0
+                reset_frame_changes('waveshare')
+                detect_frame_changes('waveshare', np.asarray(image))
             except Exception as e2:
                 print(f"Failed to reset waveshare display: {e2}")
 
-def display_image_on_framebuffer(image):
+def display_image_on_framebuffer(image, damage=None):
+    """Push a frame (a PIL image or a compositor frame array) to the configured display. damage lists
+    the rectangles that changed since the previous frame (None for the whole frame). Pacing to
+    MAX_FPS is done by render_loop."""
     global last_display_time
-    now = time.time()
-    if now - last_display_time < MIN_DISPLAY_INTERVAL: 
-        return
-    last_display_time = now
+    last_display_time = time.time()
     display_type = config.get("display", {}).get("type", "framebuffer")
     if display_type == "dummy":
         display_image_on_dummy()
     elif display_type == "st7789" and HAS_ST7789:
-        display_image_on_st7789(image)
+        display_image_on_st7789(frame_image(image))
     elif display_type == "waveshare_epd" and HAS_WAVESHARE_EPD:
-        display_image_on_waveshare(image)
-    else:
-        display_image_on_original_fb(image)
-
-def update_display():
-    global START_SCREEN
-    display_type = config.get("display", {}).get("type", "framebuffer")
-    if display_type == "waveshare_epd" and HAS_WAVESHARE_EPD:
-        img = draw_waveshare(weather_info, spotify_track)
+        display_image_on_waveshare(frame_image(image))
     else:
-        if START_SCREEN == "weather":
-            img = draw_weather_image(weather_info)
-        elif START_SCREEN == "spotify":
-            if display_sleeping:
-                return
-            img = draw_spotify_image(spotify_track)
-        elif START_SCREEN == "time":
-            img = draw_clock_image()
+        display_image_on_original_fb(image, damage)
+
+def update_display(screen=None):
+    """Mark a screen (default: the current one) dirty. Rendering happens on the render thread, which
+    coalesces any number of requests into at most one frame per MAX_FPS deadline."""
+    with render_condition:
+        render_dirty.add(screen or START_SCREEN)
+        render_stats['requested'] += 1
+        render_condition.notify()
+
+def wake_render_loop():
+    # The render thread waits without a timeout; on shutdown it has to be woken to see exit_event
+    with render_condition:
+        render_condition.notify_all()
+
+def render_loop():
+    """Render thread: waits for dirty screens and renders the current one, no more than once per
+    MIN_DISPLAY_INTERVAL. Requests for screens that are not shown are dropped."""
+    next_frame = 0
+    last_report = time.monotonic()
+    while not exit_event.is_set():
+        with render_condition:
+            while not render_dirty and not exit_event.is_set():
+                render_condition.wait()
+        # Requests arriving before the frame deadline fold into the same frame
+        delay = next_frame - time.monotonic()
+        if delay > 0 and exit_event.wait(delay):
+            break
+        with render_condition:
+            dirty = set(render_dirty)
+            render_dirty.clear()
+        next_frame = time.monotonic() + MIN_DISPLAY_INTERVAL
+        if START_SCREEN in dirty:
+            try:
+                render_frame()
+            except Exception as e:
+                print(f"Render error: {e}")
+        if time.monotonic() - last_report >= RENDER_STATS_INTERVAL:
+            last_report = time.monotonic()
+            print(f"📊 Renders: {render_stats['performed']} performed for {render_stats['requested']} requested")
+
+def next_boundary(period, now=None):
+    """First wall-clock multiple of period after now: the next whole second for 1, minute for 60."""
+    now = time.time() if now is None else now
+    return (math.floor(now / period) + 1) * period
+
+def schedule_every(name, period, action):
+    """Run action at every wall-clock multiple of period seconds, replacing any timer called name."""
+    with timer_wheel_lock:
+        timer_wheel[name] = {'deadline': next_boundary(period), 'period': period, 'action': action, 'fired': 0}
+    timer_wheel_wake.set()
+
+def schedule_at(name, when, action, slack=0.0):
+    """Run action once at wall-clock time when, replacing any timer called name. A pending timer
+    whose deadline is already within slack seconds of when is left alone, without waking the wheel."""
+    with timer_wheel_lock:
+        pending = timer_wheel.get(name)
+        if pending and pending['period'] is None and abs(pending['deadline'] - when) <= slack:
+            return
+        timer_wheel[name] = {'deadline': when, 'period': None, 'action': action, 'fired': 0}
+    timer_wheel_wake.set()
+
+def cancel_timer(name):
+    with timer_wheel_lock:
+        timer_wheel.pop(name, None)
+
+def timer_schedule():
+    """Pending timers as (name, deadline, period, times fired), soonest first. period is None for
+    one-shot timers."""
+    with timer_wheel_lock:
+        return sorted(((name, t['deadline'], t['period'], t['fired']) for name, t in timer_wheel.items()), key=lambda entry: entry[1])
+
+def request_timer_schedule(sig=None, frame=None):
+    """SIGUSR1 handler: only flags the dump, since the interrupted frame may hold timer_wheel_lock.
+    run_timer_wheel prints it."""
+    timer_dump_requested.set()
+    timer_wheel_wake.set()
+
+def print_timer_schedule():
+    """Dump the timer wheel."""
+    now = time.time()
+    print(f"⏱️ Timer wheel: {timer_wheel_stats['wakeups']} wakeups, {timer_wheel_stats['fired']} timers fired")
+    for name, deadline, period, fired in timer_schedule():
+        every = f"every {period:g}s" if period else "once"
+        print(f"   {name}: in {deadline - now:.3f}s ({every}, fired {fired}x)")
+
+def tick_screen(screen):
+    """Timer action that marks screen dirty while it is the one shown."""
+    def tick():
+        if START_SCREEN == screen and not display_sleeping:
+            update_display(screen)
+    return tick
+
+def run_timer_wheel():
+    """Main thread loop: sleep until the earliest deadline, fire every due timer and move periodic
+    ones to their next boundary. Boundaries missed while busy are skipped, not replayed."""
+    while not exit_event.is_set():
+        with timer_wheel_lock:
+            deadline = min((t['deadline'] for t in timer_wheel.values()), default=None)
+        timeout = None if deadline is None else max(0.0, deadline - time.time())
+        woken = timer_wheel_wake.wait(timeout)
+        timer_wheel_stats['wakeups'] += 1
+        if woken:
+            # Schedule changed, dump requested or shutdown: recompute the deadline
+            timer_wheel_wake.clear()
+            if timer_dump_requested.is_set():
+                timer_dump_requested.clear()
+                print_timer_schedule()
+            continue
+        now = time.time()
+        due = []
+        with timer_wheel_lock:
+            for name, t in list(timer_wheel.items()):
+                if t['deadline'] <= now:
+                    t['fired'] += 1
+                    due.append(t['action'])
+                    if t['period']:
+                        t['deadline'] = next_boundary(t['period'], now)
+                    else:
+                        del timer_wheel[name]
+        for action in due:
+            timer_wheel_stats['fired'] += 1
+            try:
+                action()
+            except Exception as e:
+                print(f"Timer error: {e}")
+
+def render_frame():
+    """Render the current screen and push it to the display. Called from the render thread."""
+    global START_SCREEN, frame_damage, last_rendered_screen
+    with render_lock:
+        frame_damage = None
+        started = time.perf_counter()
+        display_type = config.get("display", {}).get("type", "framebuffer")
+        if display_type == "waveshare_epd" and HAS_WAVESHARE_EPD:
+            img = draw_waveshare(weather_info, spotify_track)
         else:
-            img = draw_clock_image()
-    display_image_on_framebuffer(img)
+            if START_SCREEN == "weather":
+                img = draw_weather_image(weather_info)
+            elif START_SCREEN == "spotify":
+                if display_sleeping:
+                    return
+                img = draw_spotify_image(spotify_track)
+            elif START_SCREEN == "time":
+                img = draw_clock_image()
+            else:
+                img = draw_clock_image()
+        # Partial updates are only valid on top of a frame of the same screen
+        damage = frame_damage if last_rendered_screen == START_SCREEN else None
+        last_rendered_screen = START_SCREEN
+        render_stats['performed'] += 1
+        rendered = time.perf_counter()
+        if damage == []:
+            # Nothing changed since the frame the display already shows
+            record_frame_timing(rendered - started, 0.0)
+            return
+        display_image_on_framebuffer(img, damage)
+        record_frame_timing(rendered - started, time.perf_counter() - rendered)
 
 def clear_framebuffer():
-    global HAS_ST7789
+    global HAS_ST7789, last_rendered_screen
+    last_rendered_screen = None
+    reset_frame_changes()
     display_type = config.get("display", {}).get("type", "framebuffer")
     if display_type == "dummy":
         return
@@ -2586,11 +3558,13 @@ def clear_framebuffer():
             black_image = Image.new("RGB", (SCREEN_WIDTH, SCREEN_HEIGHT), "black")
             display_image_on_original_fb(black_image)
             try:
-                with open(FRAMEBUFFER, "wb") as f:
-                    black_pixel = b'\x00\x00'
-                    f.write(black_pixel * SCREEN_WIDTH * SCREEN_HEIGHT)
-                    f.flush()
-                    os.fsync(f.fileno())
+                # Truncating a mapped file would invalidate the mapping, so blank it in place when mapped
+                if not blank_framebuffer():
+                    with open(FRAMEBUFFER, "wb") as f:
+                        black_pixel = b'\x00\x00'
+                        f.write(black_pixel * SCREEN_WIDTH * SCREEN_HEIGHT)
+                        f.flush()
+                        os.fsync(f.fileno())
             except Exception as e:
                 print(f"Direct framebuffer write failed: {e}")
             print(f"✅ Framebuffer cleared: {FRAMEBUFFER}")
@@ -2667,11 +3641,17 @@ def sleep_monitor_loop():
 def signal_handler(sig, frame):
     print(f"Received signal {sig}, shutting down quickly...")
     exit_event.set()
+    timer_wheel_wake.set()
+    wake_render_loop()
 
 def main():
     global START_SCREEN, spotify_track
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGUSR1, request_timer_schedule)
+    start_process_pool()
+    executor.submit(preload_weather_icons)
+    Thread(target=render_loop, daemon=True).start()
     Thread(target=background_generation_worker, daemon=True).start()
     Thread(target=writer_worker, daemon=True).start()
     # Initialize optional clients
@@ -2688,21 +3668,12 @@ def main():
     if USE_PILLOW_SIMD:
         print("✅ pillow-simd detected: image operations are optimized")
     update_display()
-    screen_update_intervals = {
-        "weather": 30.0,
-        "spotify": 0.5,
-        "time": 1.0
-    }
-    last_display_update = 0
+    # The clock and the Spotify progress tick on whole seconds, the weather badge on whole minutes
+    schedule_every("time", 1.0, tick_screen("time"))
+    schedule_every("spotify", 1.0, tick_screen("spotify"))
+    schedule_every("weather", 60.0, tick_screen("weather"))
     try:
-        while not exit_event.is_set():
-            current_time = time.time()
-            current_interval = screen_update_intervals.get(START_SCREEN, 1.0)
-            if not display_sleeping and current_time - last_display_update >= current_interval:
-                update_display()
-                last_display_update = current_time
-            if exit_event.wait(0.1):
-                break
+        run_timer_wheel()
     except KeyboardInterrupt:
         print("\nShutting down...")
     finally:
@@ -2712,12 +3683,14 @@ def main():
         spotify_track = None
         update_spotify_layout(None)
         try:
-            update_display()
+            # The render thread may already have stopped, so the last frame is rendered here
+            render_frame()
             time.sleep(0.3)
         except:
             pass
         cleanup_scroll_state()
         exit_event.set()
+        wake_render_loop()
         try:
             executor.shutdown(wait=False)
         except Exception:
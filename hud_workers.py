@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Image jobs for the HUD's process pool.
+
+The pool forks from the running HUD, so workers inherit its modules and memory copy-on-write;
+what keeping the jobs in this module buys is that they only use PIL and NumPy and never touch the
+HUD's hardware handles, Spotify client or config globals. (A spawn or forkserver pool would
+re-import hud.py, including that setup, in every worker.) Images travel as raw (mode, size, bytes) tuples (see hud.pack_image).
+art_palette() is the colour engine shared with hud.py, which memoizes its results per art key.
+init_worker() is the executor initializer: it loads the image plugins and precomputes the fade
+masks for every background height so the first real job does no setup work; warm_up() is the dummy job
+submitted at startup to get every worker through that before the first track change.
+"""
+import os
+import colorsys
+from io import BytesIO
+import numpy as np
+from PIL import Image, ImageFilter, ImageEnhance
+
+_fade_masks = {}
+_gradients = {}
+
+def fade_mask(art_size):
+    """Horizontal fade-in/out alpha mask for background art of the given square size, memoized."""
+    mask = _fade_masks.get(art_size)
+    if mask is None:
+        fade_width = min(80, art_size // 4)
+        x_coords = np.arange(art_size)
+        left_fade_mask = np.where(x_coords < fade_width,
+                                255 * ((x_coords / fade_width) ** 0.7),
+                                255).astype(np.uint8)
+        right_fade_mask = np.where(x_coords > art_size - fade_width,
+                                255 * (((art_size - x_coords) / fade_width) ** 0.7),
+                                255).astype(np.uint8)
+        combined_alpha = np.minimum(left_fade_mask, right_fade_mask)
+        mask = Image.fromarray(np.tile(combined_alpha, (art_size, 1)), mode='L')
+        _fade_masks[art_size] = mask
+    return mask
+
+def contrast_colors(mean):
+    """Main and secondary text colours contrasting with an average colour: the opposite hue, with
+    saturation and brightness lifted so labels stay readable on the art."""
+    avg_h, avg_s, avg_v = colorsys.rgb_to_hsv(mean[0] / 255.0, mean[1] / 255.0, mean[2] / 255.0)
+    opposite_h = (avg_h + 0.5) % 1.0
+    data_saturation = min(0.9, avg_s + 0.3)
+    label_saturation = max(0.6, data_saturation - 0.2)
+    base_brightness = 0.9 if avg_v < 0.3 else (0.8 if avg_v > 0.7 else 0.85)
+    r1, g1, b1 = colorsys.hsv_to_rgb(opposite_h, data_saturation, base_brightness)
+    secondary_h = (opposite_h + 0.12) % 1.0
+    label_brightness = base_brightness - 0.05 if base_brightness > 0.7 else base_brightness
+    r2, g2, b2 = colorsys.hsv_to_rgb(secondary_h, label_saturation, label_brightness)
+    return (int(r1 * 255), int(g1 * 255), int(b1 * 255)), (int(r2 * 255), int(g2 * 255), int(b2 * 255))
+
+def dominant_colors(pixels, k=5, iterations=8):
+    """k-means over an (N, 3) float32 pixel array, seeded at luminance quantiles so the result is
+    deterministic. Returns the centres of the clusters that ended up with pixels, most populated
+    first; a flat image yields a single colour rather than k copies of it."""
+    luma = pixels @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    order = np.argsort(luma, kind='stable')
+    centres = pixels[order[(np.arange(k) * 2 + 1) * len(order) // (2 * k)]].copy()
+    for _ in range(iterations):
+        labels = ((pixels[:, None, :] - centres[None, :, :]) ** 2).sum(axis=2).argmin(axis=1)
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros_like(centres)
+        np.add.at(sums, labels, pixels)
+        filled = counts > 0
+        centres[filled] = sums[filled] / counts[filled, None]
+    order = np.argsort(-counts, kind='stable')
+    return centres[order[counts[order] > 0]]
+
+def art_palette(img, k=5):
+    """Colour summary of an image from a 50x50 downsample: {'mean', 'dominant' (up to k distinct
+    colours, most common first), 'main_color', 'secondary_color'}, all RGB tuples."""
+    small = np.asarray(img.convert('RGB').resize((50, 50), Image.BILINEAR), dtype=np.uint32).reshape(-1, 3)
+    mean = tuple(int(v) for v in small.sum(axis=0) // len(small))
+    dominant = dominant_colors(small.astype(np.float32), k)
+    main_color, secondary_color = contrast_colors(mean)
+    # Clusters that converge to the same colour once rounded are listed once
+    distinct = dict.fromkeys(tuple(int(v) for v in c) for c in dominant.round())
+    return {'mean': mean, 'dominant': tuple(distinct),
+            'main_color': main_color, 'secondary_color': secondary_color}
+
+def gradient_background(size, base=(40, 40, 60)):
+    """No-art fallback background: the base colour scaled from 0.7x at the top to 1.3x at the bottom,
+    built a row at a time with NumPy and memoized per size. Treat the result as read-only."""
+    key = (tuple(size), tuple(base))
+    bg = _gradients.get(key)
+    if bg is None:
+        width, height = size
+        factor = 0.7 + (np.arange(height) / height) * 0.6
+        rows = (factor[:, None] * np.array(base, dtype=np.float64)).astype(np.uint8)
+        bg = Image.fromarray(np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (height, width, 3))), 'RGB')
+        _gradients[key] = bg
+    return bg
+
+def init_worker(sizes):
+    Image.init()
+    for _, height in sizes:
+        fade_mask(height)
+
+def warm_up(sizes):
+    """Dummy job: one small background through the real code path. Returns the worker's pid."""
+    make_backgrounds(('RGB', (8, 8), bytes(8 * 8 * 3)), sizes)
+    return os.getpid()
+
+def render_backgrounds(img, sizes, mean=None):
+    """Backgrounds from album art for several display geometries in one pass: the art is scaled,
+    blurred and darkened once for the tallest size, and each target gets a resize of that result
+    over the art's darkened mean colour, faded in and out with the cached mask for its height."""
+    img = img.convert('RGB')
+    if mean is None:
+        mean = art_palette(img)['mean']
+    avg_color = (int(mean[0] * 0.7), int(mean[1] * 0.7), int(mean[2] * 0.7))
+    top = max(height for _, height in sizes)
+    scaled_art = img.resize((top, top), Image.BILINEAR)
+    blurred_art = ImageEnhance.Brightness(scaled_art.filter(ImageFilter.GaussianBlur(2))).enhance(0.6)
+    backgrounds = {}
+    for width, height in sizes:
+        art = blurred_art if height == top else blurred_art.resize((height, height), Image.BILINEAR)
+        bg = Image.new("RGB", (width, height), avg_color)
+        bg.paste(art, ((width - height) // 2, 0), fade_mask(height))
+        backgrounds[(width, height)] = bg
+    return backgrounds
+
+def make_backgrounds(art, sizes):
+    # Generate backgrounds for every size from packed art. Returns {size: packed background}.
+    sizes = [tuple(size) for size in sizes]
+    try:
+        if art is None:
+            backgrounds = {size: gradient_background(size) for size in sizes}
+        else:
+            backgrounds = render_backgrounds(Image.frombytes(*art), sizes)
+        return {size: (bg.mode, bg.size, bg.tobytes()) for size, bg in backgrounds.items()}
+    except Exception:
+        # On failure return basic black backgrounds
+        return {size: ('RGB', size, bytes(size[0] * size[1] * 3)) for size in sizes}
+
+def decode_art_bytes(data, size, mode='RGB'):
+    """Decode downloaded art for use at up to size. JPEGs go through Pillow's draft mode, which decodes
+    at the smallest 1/2, 1/4 or 1/8 scale that still covers size; other formats decode normally.
+    Used by the pool jobs and by hud.py's inline fallbacks alike."""
+    img = Image.open(BytesIO(data))
+    img.draft('RGB', size)
+    return img.convert(mode)
+
+def process_artist_image(art_bytes):
+    # Decode downloaded artist image bytes into a packed 100x100 RGBA image.
+    try:
+        if not art_bytes:
+            return None
+        img = decode_art_bytes(art_bytes, (100, 100), 'RGBA').resize((100, 100), Image.BILINEAR)
+        return (img.mode, img.size, img.tobytes())
+    except Exception:
+        return None
+
+def process_album_art(art, size=(150,150)):
+    # Thumbnail packed album art and pick contrasting colours.
+    # Returns (packed thumbnail, main_color, secondary_color, art_palette() of the thumbnail);
+    # the palette is None when there is no thumbnail.
+    try:
+        if not art:
+            return (None, (0,255,0), (0,255,255), None)
+        img = Image.frombytes(*art).convert('RGB')
+        img.thumbnail(size, Image.BILINEAR)
+        packed = (img.mode, img.size, img.tobytes())
+        palette = art_palette(img)
+        main_color, secondary_color = palette['main_color'], palette['secondary_color']
+        return (packed, main_color, secondary_color, palette)
+    except Exception:
+        return (None, (0,255,0), (0,255,255), None)
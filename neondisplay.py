@@ -2471,7 +2471,8 @@ def get_current_track():
                     'progress': f"{progress_min}:{progress_sec:02d}",
                     'duration': f"{duration_min}:{duration_sec:02d}",
                     'is_playing': track_data.get('is_playing', False),
-                    'has_track': track_data.get('title') != 'No track playing'
+                    'has_track': track_data.get('title') != 'No track playing',
+                    'palette': track_data.get('palette', [])
                 }
         return {
             'song': 'No track playing',
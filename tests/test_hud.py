@@ -0,0 +1,685 @@
+import os
+import time
+import datetime
+import threading
+from io import BytesIO
+from collections import OrderedDict
+from types import SimpleNamespace
+from concurrent.futures import Future
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+
+@pytest.fixture
+def hud(tmp_path, monkeypatch):
+    # hud.py loads (and writes) config.toml from the working directory on first import
+    monkeypatch.chdir(tmp_path)
+    import hud
+    monkeypatch.setattr(hud, 'exit_event', threading.Event())
+    return hud
+
+
+def jpeg_bytes(size=(64, 64), color=(200, 30, 30)):
+    bio = BytesIO()
+    Image.new('RGB', size, color).save(bio, format='JPEG')
+    return bio.getvalue()
+
+
+# Adaptive FPS governor
+
+def test_read_soc_temperature(hud, tmp_path):
+    zone = tmp_path / 'temp'
+    zone.write_text('85123\n')
+    assert hud.read_soc_temperature(str(zone)) == pytest.approx(85.123)
+    zone.write_text('garbage')
+    assert hud.read_soc_temperature(str(zone)) is None
+    assert hud.read_soc_temperature(str(tmp_path / 'missing')) is None
+
+
+def test_frame_budget_matches_display_interval(hud, monkeypatch):
+    monkeypatch.setattr(hud, 'MAX_FPS', 20)
+    assert hud.governor_frame_budget(0) == pytest.approx(1 / 20)
+    assert hud.governor_frame_budget(2) == pytest.approx(1 / 10)
+
+
+def test_frame_miss_ratio(hud):
+    assert hud.frame_miss_ratio([], 0.04) == 0.0
+    assert hud.frame_miss_ratio([(0.01, 0.01), (0.03, 0.02), (0.05, 0.0), (0.0, 0.0)], 0.04) == 0.5
+
+
+def test_governor_degrades_on_missed_frames_and_heat(hud, monkeypatch, tmp_path):
+    monkeypatch.setitem(hud.governor_state, 'calm_checks', 0)
+    slow = [(1.0, 0.0)] * 10
+    assert hud.governor_step(0, slow, None, 0.1) == 1
+    zone = tmp_path / 'temp'
+    zone.write_text(str(int((hud.THERMAL_HIGH_C + 1) * 1000)))
+    assert hud.governor_step(1, [], hud.read_soc_temperature(str(zone)), 0.1) == 2
+    assert hud.governor_step(len(hud.GOVERNOR_LEVELS) - 1, slow, None, 0.1) == len(hud.GOVERNOR_LEVELS) - 1
+
+
+def test_governor_recovers_after_calm_checks(hud, monkeypatch):
+    monkeypatch.setitem(hud.governor_state, 'calm_checks', 0)
+    fast = [(0.001, 0.001)] * 10
+    for _ in range(hud.GOVERNOR_RECOVER_CHECKS - 1):
+        assert hud.governor_step(2, fast, hud.THERMAL_LOW_C - 1, 0.1) == 2
+    assert hud.governor_step(2, fast, hud.THERMAL_LOW_C - 1, 0.1) == 1
+    # A warm reading resets the count
+    assert hud.governor_step(1, fast, hud.THERMAL_LOW_C + 1, 0.1) == 1
+    assert hud.governor_state['calm_checks'] == 0
+
+
+# Album art disk cache
+
+@pytest.fixture
+def art_cache(hud, tmp_path, monkeypatch):
+    monkeypatch.setattr(hud, 'ART_CACHE_DIR', str(tmp_path / 'art'))
+    monkeypatch.setattr(hud, 'art_disk_index', OrderedDict())
+    monkeypatch.setattr(hud, 'art_disk_index_loaded', False)
+    monkeypatch.setattr(hud, 'art_disk_bytes', 0)
+    return hud
+
+
+def put_art(hud, name):
+    hud.art_cache_put(f'http://art/{name}', Image.new('RGB', (30, 30), (10, 20, 30)), (1, 2, 3), (4, 5, 6))
+
+
+def test_art_cache_round_trip(art_cache):
+    hud = art_cache
+    put_art(hud, 'a')
+    cached = hud.art_cache_get('http://art/a')
+    assert cached['main_color'] == (1, 2, 3) and cached['secondary_color'] == (4, 5, 6)
+    assert hud.image_key(cached['image'])[0] == 'http://art/a'
+    assert hud.art_cache_get('http://art/missing') is None
+
+
+def test_art_cache_evicts_least_recently_used(art_cache, monkeypatch):
+    hud = art_cache
+    put_art(hud, 'a')
+    entry_bytes = hud.art_disk_bytes
+    monkeypatch.setattr(hud, 'ART_CACHE_BYTES', entry_bytes * 2 + entry_bytes // 2)
+    put_art(hud, 'b')
+    assert hud.art_cache_get('http://art/a') is not None
+    put_art(hud, 'c')
+    assert hud.art_cache_get('http://art/b') is None
+    assert hud.art_cache_get('http://art/a') is not None
+    assert hud.art_cache_get('http://art/c') is not None
+    # Accounting matches the files left on disk, also after reloading the index from the directory
+    on_disk = sum(entry.stat().st_size for entry in os.scandir(hud.ART_CACHE_DIR))
+    assert hud.art_disk_bytes == on_disk
+    hud._load_art_disk_index()
+    assert hud.art_disk_bytes == on_disk and len(hud.art_disk_index) == 2
+
+
+def test_art_cache_image_variants_count_towards_entry(art_cache):
+    hud = art_cache
+    put_art(hud, 'a')
+    before = hud.art_disk_bytes
+    hud.art_cache_put_image('http://art/a', (48, 32), Image.new('RGB', (48, 32), (200, 0, 0)))
+    assert hud.art_disk_bytes > before
+    assert hud.art_cache_get_image('http://art/a', (48, 32)).size == (48, 32)
+    assert hud.art_cache_get_image('http://art/a', (10, 10)) is None
+
+
+# Background job queue
+
+@pytest.fixture
+def bg_queue(hud, monkeypatch):
+    monkeypatch.setattr(hud, 'bg_jobs', OrderedDict())
+    monkeypatch.setattr(hud, 'bg_job_latest', {})
+    monkeypatch.setattr(hud, 'bg_job_stats', {'queued': 0, 'coalesced': 0, 'dropped': 0, 'run': 0})
+    monkeypatch.setattr(hud, 'track_generation', 3)
+    return hud
+
+
+def test_background_jobs_coalesce_per_type(bg_queue):
+    hud = bg_queue
+    hud.enqueue_background_job('spotify', None, (480, 320), 3)
+    hud.enqueue_background_job('clock', None, (480, 320), 3)
+    hud.enqueue_background_job('spotify', 'newer', (480, 320), 3)
+    assert hud.bg_job_stats['queued'] == 3 and hud.bg_job_stats['coalesced'] == 1
+    bg_type, album_img, size, generation, seq = hud.take_background_job(timeout=0.1)
+    assert bg_type == 'clock'
+    bg_type, album_img, size, generation, seq = hud.take_background_job(timeout=0.1)
+    assert (bg_type, album_img) == ('spotify', 'newer')
+    assert hud.is_latest_background_job('spotify', seq)
+    assert hud.bg_job_stats['run'] == 2
+    assert hud.take_background_job(timeout=0.01) is None
+
+
+def test_background_job_superseded_while_running(bg_queue):
+    hud = bg_queue
+    hud.enqueue_background_job('spotify', None, (480, 320), 3)
+    seq = hud.take_background_job(timeout=0.1)[4]
+    hud.enqueue_background_job('spotify', None, (480, 320), 3)
+    assert not hud.is_latest_background_job('spotify', seq)
+    assert hud.bg_job_stats['dropped'] == 1
+
+
+def test_background_jobs_for_old_generations_are_skipped(bg_queue):
+    hud = bg_queue
+    hud.enqueue_background_job('spotify', None, (480, 320), 2)
+    hud.enqueue_background_job('clock', None, (480, 320), 3)
+    assert hud.take_background_job(timeout=0.1)[0] == 'clock'
+    assert hud.bg_job_stats == {'queued': 2, 'coalesced': 0, 'dropped': 1, 'run': 1}
+
+
+# Track generations
+
+@pytest.fixture
+def art_state(hud, monkeypatch):
+    """Current art installed for generation 4, with disk, web copy and background side effects recorded."""
+    current = Image.new('RGB', (150, 150), (1, 1, 1))
+    saved = []
+    monkeypatch.setattr(hud, 'track_generation', 4)
+    monkeypatch.setattr(hud, 'album_art_image', current)
+    monkeypatch.setattr(hud, 'artist_image', current)
+    monkeypatch.setattr(hud, 'current_album_art_hash', 'current')
+    monkeypatch.setattr(hud, 'process_executor', None)
+    monkeypatch.setattr(hud, 'save_current_album_art', lambda img, *args: saved.append(img))
+    monkeypatch.setattr(hud, 'art_cache_put', lambda *args: None)
+    monkeypatch.setattr(hud, 'request_background_generation', lambda *args: None)
+    monkeypatch.setattr(hud, 'update_display', lambda *args: None)
+    return current, saved
+
+
+def test_stale_cache_hit_leaves_current_art(hud, art_state, monkeypatch):
+    current, saved = art_state
+    cached = {'image': Image.new('RGB', (150, 150), (9, 9, 9)), 'main_color': (1, 2, 3), 'secondary_color': (4, 5, 6)}
+    monkeypatch.setattr(hud, 'art_cache_get', lambda url: cached)
+    track = {}
+    hud.fetch_and_process_album_art('http://art/old', track, {'artists': []}, False, generation=3)
+    assert hud.album_art_image is current and hud.current_album_art_hash == 'current'
+    assert saved == [] and 'main_color' not in track
+
+
+def test_current_cache_hit_installs_art(hud, art_state, monkeypatch):
+    current, saved = art_state
+    cached = {'image': Image.new('RGB', (150, 150), (9, 9, 9)), 'main_color': (1, 2, 3), 'secondary_color': (4, 5, 6)}
+    monkeypatch.setattr(hud, 'art_cache_get', lambda url: cached)
+    track = {'title': 'Song', 'artists': 'Artist', 'album': 'Album'}
+    hud.fetch_and_process_album_art('http://art/new', track, {'artists': []}, False, generation=4)
+    assert hud.album_art_image is cached['image']
+    assert saved == [cached['image']] and track['main_color'] == (1, 2, 3)
+
+
+def test_track_skipped_during_download_leaves_current_art(hud, art_state, monkeypatch):
+    current, saved = art_state
+    monkeypatch.setattr(hud, 'art_cache_get', lambda url: None)
+
+    def download(url, generation, **kwargs):
+        # The user skips to the next track while the old art is still downloading
+        hud.begin_track_generation()
+        return jpeg_bytes()
+    monkeypatch.setattr(hud, 'download_for_generation', download)
+    track = {}
+    hud.fetch_and_process_album_art('http://art/old', track, {'artists': []}, False, generation=4)
+    assert hud.album_art_image is current and hud.current_album_art_hash == 'current'
+    assert saved == [] and 'main_color' not in track
+
+
+def test_stale_inline_album_art_result_is_dropped(hud, art_state):
+    current, saved = art_state
+    art = Image.new('RGB', (150, 150), (20, 40, 160))
+    result = hud.hud_workers.process_album_art(hud.pack_image(art))
+    track = {}
+    hud.set_processed_album_art('http://art/old', *result, track, 3)
+    assert hud.album_art_image is current and track == {}
+    hud.set_processed_album_art('http://art/new', *result, track, 4)
+    assert hud.image_key(hud.album_art_image)[0] == 'http://art/new'
+    assert track['palette'] == ((20, 40, 160),)
+
+
+def test_stale_inline_artist_image_is_dropped(hud, art_state, monkeypatch):
+    current, saved = art_state
+
+    class Spotify:
+        def artist(self, artist_id):
+            return {'images': [{'url': 'http://artist/1', 'width': 160, 'height': 160}]}
+
+    def download(url, generation, **kwargs):
+        hud.begin_track_generation()
+        return jpeg_bytes()
+    monkeypatch.setattr(hud, 'download_for_generation', download)
+    hud.fetch_and_store_artist_image(Spotify(), 'artist-id', generation=4)
+    assert hud.artist_image is current
+
+
+# Pool result dispatch
+
+def test_dispatch_future_hands_results_to_handler(hud):
+    received = []
+
+    def on_ready(result, meta):
+        received.append((result, meta))
+    fut = hud.dispatch_future(Future(), on_ready, {'url': 'x'})
+    fut.set_result(('packed',))
+    empty = hud.dispatch_future(Future(), on_ready, {})
+    empty.set_result(None)
+    assert received == [(('packed',), {'url': 'x'})]
+
+
+def test_dispatch_future_ignores_cancelled_jobs(hud, capsys):
+    received = []
+    fut = hud.dispatch_future(Future(), lambda result, meta: received.append(result), {})
+    assert fut.cancel()
+    assert received == [] and capsys.readouterr().out == ''
+
+
+def test_dispatch_future_reports_job_errors(hud, capsys):
+
+    def on_thing_ready(result, meta):
+        pass
+    fut = hud.dispatch_future(Future(), on_thing_ready, {})
+    fut.set_exception(ValueError('bad art'))
+    assert 'on_thing_ready error: bad art' in capsys.readouterr().out
+
+
+def test_track_skip_cancels_dispatched_jobs_quietly(hud, monkeypatch, capsys):
+    monkeypatch.setattr(hud, 'track_generation', 0)
+    monkeypatch.setattr(hud, 'generation_futures', [])
+    received = []
+    generation = hud.begin_track_generation()
+    queued = hud.dispatch_future(hud.track_future(Future(), generation), lambda result, meta: received.append(result), {})
+    hud.begin_track_generation()
+    assert queued.cancelled() and not hud.is_current_generation(generation)
+    assert received == [] and 'error' not in capsys.readouterr().out
+
+
+# Compositor and display helpers
+
+def test_merge_damage_rects_clips_and_merges(hud):
+    size = (100, 100)
+    assert hud.merge_damage_rects([(-5, -5, 10, 10), (200, 200, 300, 300)], size) == [(0, 0, 10, 10)]
+    assert hud.merge_damage_rects([(0, 0, 10, 10), (5, 0, 15, 10)], size) == [(0, 0, 15, 10)]
+    # Far apart boxes stay separate rather than dragging in the undamaged area between them
+    assert sorted(hud.merge_damage_rects([(0, 0, 10, 10), (50, 50, 60, 60)], size)) == [(0, 0, 10, 10), (50, 50, 60, 60)]
+    assert hud.merge_damage_rects([(0, 0, 90, 90)], size) is None
+
+
+def test_blend_into_rounds_exactly(hud):
+    dst = np.arange(256, dtype=np.uint8).repeat(3).reshape(16, 16, 3)
+    alpha = np.arange(256, dtype=np.uint16)[::-1].reshape(16, 16, 1)
+    color = np.array([255, 128, 7], dtype=np.uint16)
+    inv_alpha = (255 - alpha).astype(np.uint8)
+    color_term = alpha * color
+    expected = np.floor((dst * inv_alpha.astype(np.float64) + color_term) / 255 + 0.5).astype(np.uint8)
+    hud._blend_into(dst, inv_alpha, color_term)
+    assert (dst == expected).all()
+
+
+def test_rgb_to_rgb565(hud):
+    arr = np.zeros((2, 3, 3), dtype=np.uint8)
+    arr[0, 0] = (255, 255, 255)
+    arr[1, 2] = (255, 0, 0)
+    out = hud.rgb_to_rgb565(arr)
+    assert out.shape == (2, 3) and out.dtype == np.dtype('<u2')
+    assert out[0, 0] == 0xFFFF and out[1, 2] == 0xF800 and out[0, 1] == 0
+    rotated = hud.rgb_to_rgb565(arr, 90)
+    assert rotated.shape == (3, 2)
+    # Counter-clockwise: the top-left pixel ends up bottom-left, the bottom-right one top-right
+    assert rotated[2, 0] == 0xFFFF and rotated[0, 1] == 0xF800
+
+
+def test_frame_image_wraps_arrays_only(hud):
+    frame = np.zeros((4, 6, 3), dtype=np.uint8)
+    assert hud.frame_image(frame).size == (6, 4)
+    img = Image.new('RGB', (2, 2))
+    assert hud.frame_image(img) is img
+
+
+# Image keys, transport and renditions
+
+def test_image_key_and_tag_image(hud):
+    img = Image.new('RGB', (4, 4), (1, 2, 3))
+    key = hud.image_key(img)
+    assert key == hud.image_key(Image.new('RGB', (4, 4), (1, 2, 3)))
+    assert key != hud.image_key(Image.new('RGB', (4, 4), (3, 2, 1)))
+    tagged = hud.tag_image(Image.new('RGB', (4, 4)), 'http://art/1')
+    assert hud.image_key(tagged) == ('http://art/1', (4, 4), 'RGB')
+    assert hud.image_key(tagged.copy()) == hud.image_key(tagged)
+    # The tag lapses when the rendition changes
+    assert hud.image_key(tagged.convert('L'))[0] != 'http://art/1'
+
+
+def test_select_image_rendition(hud):
+    images = [{'url': 'big', 'width': 640, 'height': 640}, {'url': 'mid', 'width': 300, 'height': 300},
+              {'url': 'small', 'width': 64, 'height': 64}]
+    assert hud.select_image_rendition(images, 300)['url'] == 'mid'
+    assert hud.select_image_rendition(images, 100)['url'] == 'mid'
+    assert hud.select_image_rendition(images, 1000)['url'] == 'big'
+    assert hud.select_image_rendition([{'url': 'unsized'}, images[2]], 100)['url'] == 'unsized'
+    assert hud.select_image_rendition([], 100) is None
+
+
+def test_pack_unpack_image_round_trip(hud):
+    img = Image.new('RGBA', (5, 3), (1, 2, 3, 4))
+    packed = hud.pack_image(img)
+    assert packed[:2] == ('RGBA', (5, 3))
+    assert hud.unpack_image(packed).tobytes() == img.tobytes()
+    assert hud.pack_image(None) is None and hud.unpack_image(None) is None
+
+
+# Text sprites
+
+def test_draw_text_aliased_matches_pil(hud):
+    frame = np.zeros((40, 120, 3), dtype=np.uint8)
+    hud.draw_text_aliased(frame, (3, 2), 'Hi 42', hud.MEDIUM_FONT, (255, 200, 100))
+    reference = Image.new('RGB', (120, 40))
+    ImageDraw.Draw(reference).text((3, 2), 'Hi 42', fill=(255, 200, 100), font=hud.MEDIUM_FONT)
+    assert frame.any() and (frame == np.asarray(reference)).all()
+
+
+def test_text_sprites_are_cached_within_budget(hud, monkeypatch):
+    monkeypatch.setattr(hud, 'text_sprite_cache', OrderedDict())
+    monkeypatch.setattr(hud, 'text_sprite_cache_bytes', 0)
+    sprite = hud.get_text_sprite('12:34', hud.MEDIUM_FONT, [255, 255, 255])
+    assert hud.get_text_sprite('12:34', hud.MEDIUM_FONT, (255, 255, 255)) is sprite
+    assert hud.get_text_sprite('12:34', hud.MEDIUM_FONT, 'red') is not sprite
+    monkeypatch.setattr(hud, 'TEXT_SPRITE_CACHE_BYTES', sprite['nbytes'] * 2)
+    hud.get_text_sprite('56:78', hud.MEDIUM_FONT, (255, 255, 255))
+    # The least recently used sprite goes first once the cache is over budget
+    assert len(hud.text_sprite_cache) == 2 and hud.text_sprite_cache_bytes <= hud.TEXT_SPRITE_CACHE_BYTES
+    assert hud.get_text_sprite('12:34', hud.MEDIUM_FONT, (255, 255, 255)) is not sprite
+
+
+# Framebuffer
+
+@pytest.fixture
+def framebuffer(hud, tmp_path, monkeypatch):
+    """A regular file standing in for the framebuffer device, mapped at SCREEN_WIDTH x SCREEN_HEIGHT."""
+    (tmp_path / 'fb1').write_bytes(b'')
+    monkeypatch.setattr(hud, 'FRAMEBUFFER', str(tmp_path / 'fb1'))
+    monkeypatch.setattr(hud, 'fb_map', None)
+    monkeypatch.setattr(hud, 'fb_map_failed', False)
+    fb = hud.open_framebuffer()
+    yield fb
+    del fb['pixels'], fb['shadow']
+    fb['mmap'].close()
+    fb['file'].close()
+
+
+def test_open_framebuffer_maps_regular_file_once(hud, framebuffer):
+    assert (framebuffer['width'], framebuffer['height']) == (hud.SCREEN_WIDTH, hud.SCREEN_HEIGHT)
+    assert os.path.getsize(hud.FRAMEBUFFER) == hud.SCREEN_WIDTH * hud.SCREEN_HEIGHT * 2
+    assert hud.open_framebuffer() is framebuffer
+
+
+def test_write_framebuffer_rows_writes_changed_spans_only(hud, framebuffer):
+    frame = np.zeros((hud.SCREEN_HEIGHT, hud.SCREEN_WIDTH), dtype='<u2')
+    frame[3, 10:20] = 0xF800
+    frame[7, 5] = 0x07E0
+    # Pixels outside the changed spans are not rewritten, even if the mapping was changed behind our back
+    framebuffer['pixels'][3, 0] = 0x1234
+    hud.write_framebuffer_rows(framebuffer, frame)
+    assert framebuffer['pixels'][3, 0] == 0x1234
+    framebuffer['pixels'][3, 0] = 0
+    framebuffer['mmap'].flush()
+    with open(hud.FRAMEBUFFER, 'rb') as f:
+        written = np.frombuffer(f.read(), dtype='<u2').reshape(frame.shape)
+    assert (written == frame).all() and (framebuffer['shadow'] == frame).all()
+
+
+# Weather screen
+
+@pytest.fixture
+def set_now(hud, monkeypatch):
+    """Freezes hud's datetime.datetime.now(); the returned function moves it to another time of day."""
+    now = [datetime.datetime(2026, 3, 1, 12, 34, 56)]
+
+    class FakeDatetime(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now[0]
+    monkeypatch.setattr(hud, 'datetime', SimpleNamespace(datetime=FakeDatetime))
+
+    def set_time(hour, minute, second=0):
+        now[0] = now[0].replace(hour=hour, minute=minute, second=second)
+    return set_time
+
+
+@pytest.fixture
+def weather_icons(hud, tmp_path, monkeypatch):
+    """Empty icon cache on tmp_path; returns the list of URLs fetched from the network."""
+    monkeypatch.setattr(hud, 'WEATHER_ICON_DIR', str(tmp_path / 'icons'))
+    monkeypatch.setattr(hud, 'weather_icon_sources', {})
+    monkeypatch.setattr(hud, 'weather_icon_cache', {})
+    monkeypatch.setattr(hud, 'update_display', lambda *args: None)
+    icon = BytesIO()
+    Image.new('RGBA', (100, 100), (255, 200, 0, 255)).save(icon, format='PNG')
+    fetched = []
+
+    def get(url, timeout=None):
+        fetched.append(url)
+        return SimpleNamespace(content=icon.getvalue(), raise_for_status=lambda: None)
+    monkeypatch.setattr(hud, 'session', SimpleNamespace(get=get))
+    return fetched
+
+
+def test_weather_icon_is_fetched_once_off_the_render_path(hud, weather_icons):
+    assert hud.get_weather_icon('01d', (64, 64)) is None and weather_icons == []
+    hud.fetch_weather_icon('01d')
+    hud.fetch_weather_icon('01d')
+    assert weather_icons == ['http://openweathermap.org/img/wn/01d@2x.png']
+    icon = hud.get_weather_icon('01d', (64, 64))
+    assert icon.size == (64, 64) and icon.mode == 'RGBA'
+    assert hud.get_weather_icon('01d', (64, 64)) is icon
+    assert hud.get_weather_icon('01d', (64, 64), '1').mode == '1'
+
+
+def test_weather_icons_persist_across_restarts(hud, weather_icons, monkeypatch):
+    hud.fetch_weather_icon('10n')
+    monkeypatch.setattr(hud, 'weather_icon_sources', {})
+    monkeypatch.setattr(hud, 'weather_icon_cache', {})
+    hud.preload_weather_icons()
+    assert hud.get_weather_icon('10n', (128, 128)) is not None
+    assert os.listdir(hud.WEATHER_ICON_DIR) == ['10n@2x.png'] and len(weather_icons) == 1
+
+
+def test_weather_screen_redraws_only_the_time_badge(hud, set_now, monkeypatch):
+    monkeypatch.setattr(hud, 'TIME_DISPLAY', True)
+    monkeypatch.setattr(hud, 'weather_frame_state', {})
+    monkeypatch.setattr(hud, 'compositor_frames', {})
+    monkeypatch.setattr(hud, 'get_background_path', lambda info: None)
+    bases = []
+    render_weather_base = hud.render_weather_base
+    monkeypatch.setattr(hud, 'render_weather_base', lambda *args: bases.append(render_weather_base(*args)))
+    weather = {'city': 'Oslo', 'country': 'NO', 'temp': 3, 'feels_like': 1, 'description': 'light rain',
+               'humidity': 80, 'pressure': 1012, 'wind_speed': 4, 'main': 'Rain'}
+    set_now(12, 34, 5)
+    hud.draw_weather_image(weather)
+    assert hud.frame_damage is None and len(bases) == 1
+    set_now(12, 34, 50)
+    hud.draw_weather_image(weather)
+    assert hud.frame_damage == []
+    set_now(12, 35)
+    frame = hud.draw_weather_image(weather).copy()
+    (x0, y0, x1, y1), = hud.frame_damage
+    assert x1 > hud.SCREEN_WIDTH - 20 and y1 > hud.SCREEN_HEIGHT - 20 and x0 > hud.SCREEN_WIDTH // 2
+    assert len(bases) == 1
+    # The badge swap matches a full render of the same minute
+    hud.weather_frame_state.clear()
+    assert (hud.draw_weather_image(weather) == frame).all() and len(bases) == 2
+    hud.draw_weather_image(dict(weather, temp=4))
+    assert hud.frame_damage is None and len(bases) == 3
+
+
+# Clock screen
+
+@pytest.fixture
+def clock(hud, set_now, monkeypatch):
+    """Clock on a plain colour background, with the time of day set through the returned function."""
+    monkeypatch.setattr(hud, 'CLOCK_BACKGROUND', 'color')
+    monkeypatch.setattr(hud, 'CLOCK_COLOR', '#203040')
+    monkeypatch.setattr(hud, 'clock_scene_cache', {})
+    monkeypatch.setattr(hud, 'clock_frame_state', {})
+    monkeypatch.setattr(hud, 'clock_digit_atlas', OrderedDict())
+    monkeypatch.setattr(hud, 'compositor_frames', {})
+    monkeypatch.setitem(hud.config, 'display_ip_on_main', False)
+    set_now(12, 34, 56)
+    return set_now
+
+
+def test_clock_atlas_has_tabular_digits(hud, clock):
+    atlas = hud.get_clock_atlas(hud.LARGE_FONT, (255, 255, 255))
+    assert hud.get_clock_atlas(hud.LARGE_FONT, (255, 255, 255)) is atlas
+    assert len({atlas['advance'][d] for d in '0123456789'}) == 1
+    ones = hud.clock_glyph_layers('11:11:11', atlas, 240, 100)
+    eights = hud.clock_glyph_layers('88:88:88', atlas, 240, 100)
+    # Digits sit in the same cells whatever their ink width, so the clock never shifts sideways
+    assert [layer['box'][0] - atlas['glyphs'][ch]['offset'][0] for ch, layer in ones] == \
+        [layer['box'][0] - atlas['glyphs'][ch]['offset'][0] for ch, layer in eights]
+
+
+def test_clock_redraws_only_changed_digits(hud, clock):
+    hud.draw_clock_image()
+    assert hud.frame_damage is None
+    clock(12, 34, 57)
+    frame = hud.draw_clock_image().copy()
+    atlas = hud.get_clock_atlas(hud.LARGE_FONT, hud.clock_background()[2][0])
+    (x0, y0, x1, y1), = hud.frame_damage
+    assert x1 - x0 <= atlas['advance']['0'] + hud.LARGE_FONT.size
+    # The partial update matches a full recomposite of the same second
+    hud.clock_frame_state.clear()
+    assert (hud.draw_clock_image() == frame).all() and hud.frame_damage is None
+
+
+
+def test_clock_scene_inputs_are_cached(hud, clock, monkeypatch):
+    background, bg_color, palette = hud.clock_background()
+    assert background is None and bg_color == (0x20, 0x30, 0x40)
+    assert hud.clock_background()[2] is palette
+    monkeypatch.setattr(hud, 'CLOCK_COLOR', '#000000')
+    assert hud.clock_background()[1] == (0, 0, 0)
+    lookups = []
+    monkeypatch.setattr(hud, 'get_local_ip', lambda: lookups.append(1) or '10.0.0.2')
+    assert hud.get_display_ip() == hud.get_display_ip() == '10.0.0.2' and len(lookups) == 1
+
+
+def test_wyze_thumbnail_is_decoded_once_per_mtime(hud, clock, tmp_path):
+    path = tmp_path / 'wyze_last.jpg'
+    assert hud.get_wyze_thumbnail(str(path)) == (None, None)
+    Image.new('RGB', (320, 240), (0, 90, 0)).save(path)
+    mtime, thumb = hud.get_wyze_thumbnail(str(path))
+    assert thumb.shape == (60, 60, 3) and hud.get_wyze_thumbnail(str(path))[1] is thumb
+    Image.new('RGB', (320, 240), (90, 0, 0)).save(path)
+    os.utime(path, (mtime + 5, mtime + 5))
+    assert hud.get_wyze_thumbnail(str(path))[1][0, 0, 0] > 0
+
+
+# Frame change detection
+
+def test_changed_tiles(hud):
+    previous = np.zeros((32, 64, 3), dtype=np.uint8)
+    frame = previous.copy()
+    assert hud.changed_tiles(frame, previous, tile=16) == []
+    frame[1, 1] = 255
+    frame[20, 17] = 1
+    frame[20, 40] = 1
+    assert hud.changed_tiles(frame, previous, tile=16) == [(0, 0, 16, 16), (16, 16, 48, 32)]
+
+
+def test_detect_frame_changes_per_backend(hud, monkeypatch):
+    monkeypatch.setattr(hud, 'frame_change_state', {})
+    frame = np.zeros((32, 32), dtype=np.uint8)
+    assert hud.detect_frame_changes('epd', frame) is None
+    assert hud.detect_frame_changes('epd', frame) == []
+    frame[0, 0] = 1
+    assert hud.detect_frame_changes('epd', frame) == [(0, 0, 16, 16)]
+    assert hud.detect_frame_changes('epd', frame) == []
+    hud.reset_frame_changes('epd')
+    assert hud.detect_frame_changes('epd', frame) is None
+
+
+# Timer wheel
+
+@pytest.fixture
+def wheel(hud, monkeypatch):
+    monkeypatch.setattr(hud, 'timer_wheel', {})
+    monkeypatch.setattr(hud, 'timer_wheel_wake', threading.Event())
+    monkeypatch.setattr(hud, 'timer_dump_requested', threading.Event())
+    monkeypatch.setattr(hud, 'timer_wheel_stats', {'wakeups': 0, 'fired': 0})
+    return hud
+
+
+def test_next_boundary(hud):
+    assert hud.next_boundary(1.0, 100.25) == 101.0
+    assert hud.next_boundary(60.0, 125.0) == 180.0
+    assert hud.next_boundary(60.0, 180.0) == 240.0
+
+
+def test_schedule_at_slack_keeps_pending_deadline(wheel):
+    hud = wheel
+    hud.schedule_at('track_end', 1000.0, None, slack=1.0)
+    hud.timer_wheel_wake.clear()
+    hud.schedule_at('track_end', 1000.6, None, slack=1.0)
+    assert hud.timer_schedule()[0][1] == 1000.0
+    assert not hud.timer_wheel_wake.is_set()
+    hud.schedule_at('track_end', 1005.0, None, slack=1.0)
+    assert hud.timer_schedule()[0][1] == 1005.0
+    assert hud.timer_wheel_wake.is_set()
+    hud.cancel_timer('track_end')
+    assert hud.timer_schedule() == []
+
+
+def test_timer_wheel_fires_due_timers(wheel):
+    hud = wheel
+    fired = []
+    hud.schedule_every('tick', 0.05, lambda: fired.append('tick'))
+
+    def finish():
+        fired.append('once')
+        hud.exit_event.set()
+        hud.timer_wheel_wake.set()
+    hud.schedule_at('once', time.time() + 0.2, finish)
+    thread = threading.Thread(target=hud.run_timer_wheel, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert 'once' in fired and 'tick' in fired
+    assert [name for name, *_ in hud.timer_schedule()] == ['tick']
+    assert hud.timer_wheel_stats['fired'] == len(fired)
+
+
+def test_timer_dump_is_printed_by_the_wheel(wheel, capsys):
+    hud = wheel
+    hud.schedule_every('time', 60.0, lambda: None)
+    hud.request_timer_schedule()
+    assert hud.timer_dump_requested.is_set()
+    thread = threading.Thread(target=hud.run_timer_wheel, daemon=True)
+    thread.start()
+    deadline = time.time() + 5
+    while hud.timer_dump_requested.is_set() and time.time() < deadline:
+        time.sleep(0.01)
+    hud.exit_event.set()
+    hud.timer_wheel_wake.set()
+    thread.join(timeout=5)
+    assert 'time: in' in capsys.readouterr().out
+
+
+# Render thread
+
+def test_render_loop_coalesces_requests_and_stops_on_wake(hud, monkeypatch):
+    rendered = []
+    monkeypatch.setattr(hud, 'render_condition', threading.Condition())
+    monkeypatch.setattr(hud, 'render_dirty', set())
+    monkeypatch.setattr(hud, 'render_stats', {'requested': 0, 'performed': 0})
+    monkeypatch.setattr(hud, 'MIN_DISPLAY_INTERVAL', 0.2)
+    monkeypatch.setattr(hud, 'START_SCREEN', 'time')
+    monkeypatch.setattr(hud, 'render_frame', lambda: rendered.append(time.monotonic()))
+    thread = threading.Thread(target=hud.render_loop, daemon=True)
+    thread.start()
+    hud.update_display()
+    deadline = time.monotonic() + 2
+    while not rendered and time.monotonic() < deadline:
+        time.sleep(0.01)
+    for _ in range(5):
+        hud.update_display()
+    hud.update_display('weather')
+    time.sleep(0.5)
+    assert len(rendered) == 2 and rendered[1] - rendered[0] >= 0.2
+    hud.exit_event.set()
+    hud.wake_render_loop()
+    thread.join(1)
+    assert not thread.is_alive()
@@ -0,0 +1,96 @@
+from io import BytesIO
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import hud_workers
+
+
+def split_image(left, right, size=(60, 60)):
+    img = Image.new('RGB', size, left)
+    img.paste(right, (size[0] // 2, 0, size[0], size[1]))
+    return img
+
+
+def test_dominant_colors_most_populated_first():
+    pixels = np.array([[255, 0, 0]] * 30 + [[0, 0, 255]] * 10, dtype=np.float32)
+    centres = hud_workers.dominant_colors(pixels, k=2)
+    assert centres.round().tolist() == [[255, 0, 0], [0, 0, 255]]
+
+
+def test_dominant_colors_drops_empty_clusters():
+    pixels = np.full((100, 3), 42, dtype=np.float32)
+    centres = hud_workers.dominant_colors(pixels, k=5)
+    assert centres.round().tolist() == [[42, 42, 42]]
+
+
+def test_art_palette_flat_image():
+    palette = hud_workers.art_palette(Image.new('RGB', (80, 80), (10, 200, 30)))
+    assert palette['mean'] == (10, 200, 30)
+    assert palette['dominant'] == ((10, 200, 30),)
+    assert (palette['main_color'], palette['secondary_color']) == hud_workers.contrast_colors(palette['mean'])
+
+
+def test_art_palette_dominant_colours_are_distinct():
+    palette = hud_workers.art_palette(split_image((0, 0, 0), (255, 0, 0)))
+    dominant = palette['dominant']
+    assert len(dominant) == len(set(dominant))
+    assert {(0, 0, 0), (255, 0, 0)} <= set(dominant)
+
+
+def test_gradient_background_is_memoized_per_size_and_colour():
+    bg = hud_workers.gradient_background((40, 20), (100, 100, 100))
+    assert bg is hud_workers.gradient_background((40, 20), (100, 100, 100))
+    assert bg is not hud_workers.gradient_background((40, 20), (50, 50, 50))
+    pixels = np.asarray(bg)
+    assert pixels.shape == (20, 40, 3)
+    # 0.7x at the top, approaching 1.3x at the bottom, constant along each row
+    assert tuple(pixels[0, 0]) == (70, 70, 70)
+    assert pixels[-1, 0, 0] > pixels[0, 0, 0]
+    assert (pixels == pixels[:, :1]).all()
+
+
+def test_render_backgrounds_one_per_size():
+    sizes = [(480, 320), (320, 240)]
+    backgrounds = hud_workers.render_backgrounds(split_image((200, 40, 40), (40, 40, 200)), sizes, mean=(100, 100, 100))
+    assert sorted(backgrounds) == sorted(sizes)
+    for size, bg in backgrounds.items():
+        assert bg.size == size and bg.mode == 'RGB'
+        # Left edge is outside the faded-in art: the darkened mean colour
+        assert bg.getpixel((0, 0)) == (70, 70, 70)
+
+
+def test_make_backgrounds_without_art_uses_gradient():
+    packed = hud_workers.make_backgrounds(None, [[30, 10]])
+    mode, size, data = packed[(30, 10)]
+    assert (mode, size) == ('RGB', (30, 10))
+    assert data == hud_workers.gradient_background((30, 10)).tobytes()
+
+
+def test_process_album_art_returns_thumbnail_colours_and_palette():
+    art = Image.new('RGB', (300, 300), (20, 40, 160))
+    packed, main_color, secondary_color, palette = hud_workers.process_album_art(('RGB', art.size, art.tobytes()), (150, 150))
+    assert packed[:2] == ('RGB', (150, 150))
+    assert (main_color, secondary_color) == (palette['main_color'], palette['secondary_color'])
+    assert palette['dominant'] == ((20, 40, 160),)
+
+
+def test_process_album_art_without_art():
+    assert hud_workers.process_album_art(None) == (None, (0, 255, 0), (0, 255, 255), None)
+
+
+@pytest.mark.parametrize('target, expected', [((100, 100), (160, 160)), ((400, 400), (640, 640))])
+def test_decode_art_bytes_uses_jpeg_draft_scale(target, expected):
+    bio = BytesIO()
+    Image.new('RGB', (640, 640), (1, 2, 3)).save(bio, format='JPEG')
+    img = hud_workers.decode_art_bytes(bio.getvalue(), target)
+    assert img.size == expected and img.mode == 'RGB'
+
+
+def test_process_artist_image_packs_rgba():
+    bio = BytesIO()
+    Image.new('RGB', (640, 480), (9, 9, 9)).save(bio, format='JPEG')
+    mode, size, data = hud_workers.process_artist_image(bio.getvalue())
+    assert (mode, size, len(data)) == ('RGBA', (100, 100), 100 * 100 * 4)
+    assert hud_workers.process_artist_image(b'not an image') is None